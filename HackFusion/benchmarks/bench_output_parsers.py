@@ -0,0 +1,228 @@
+"""
+Micro-benchmark: single-pass output parsers vs the previous per-field parsers
+
+Builds large outputs from recorded samples of each tool, checks that the new
+parsers agree with the old ones, and reports the best-of-N parse time.
+
+Usage (from the HackFusion directory):
+    python benchmarks/bench_output_parsers.py [--repeat 5] [--scale 1]
+"""
+
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.tools_integration.information_gathering import (  # noqa: E402
+    DIRB_PARSER, NIKTO_PARSER, NMAP_TEXT_PARSER, WHOIS_PARSER
+)
+from src.utils.output_parsers import get_parser  # noqa: E402
+
+# Recorded output excerpts, repeated to build large inputs
+
+NMAP_SAMPLE = """Nmap scan report for 10.0.{n}.{m}
+Host is up (0.00042s latency).
+Not shown: 993 closed tcp ports (reset)
+PORT     STATE SERVICE     VERSION
+22/tcp   open  ssh         OpenSSH 8.9p1 Ubuntu 3ubuntu0.6 (Ubuntu Linux; protocol 2.0)
+| ssh-hostkey:
+|   256 3e:ea:28:ba:77:1b:31:b5:f2:1f:66:61:ab:92:c7:0b (ECDSA)
+|_  256 0c:41:21:c4:3b:4c:9b:1e:91:52:9c:a4:ad:1f:47:ea (ED25519)
+80/tcp   open  http        nginx 1.18.0 (Ubuntu)
+|_http-title: Welcome to nginx!
+|_http-server-header: nginx/1.18.0 (Ubuntu)
+139/tcp  open  netbios-ssn Samba smbd 4.6.2
+443/tcp  open  ssl/http    nginx 1.18.0 (Ubuntu)
+| ssl-cert: Subject: commonName=example.internal
+| Not valid before: 2024-01-01T00:00:00
+|_Not valid after:  2025-01-01T00:00:00
+445/tcp  open  netbios-ssn Samba smbd 4.6.2
+3306/tcp open  mysql       MySQL 8.0.36-0ubuntu0.22.04.1
+8080/tcp open  http-proxy
+Service Info: OS: Linux; CPE: cpe:/o:linux:linux_kernel
+
+"""
+
+WHOIS_HEADER = """   Domain Name: EXAMPLE.COM
+   Registry Domain ID: 2336799_DOMAIN_COM-VRSN
+   Registrar WHOIS Server: whois.iana.org
+   Registrar URL: http://res-dom.iana.org
+   Updated Date: 2024-08-14T07:01:34Z
+   Creation Date: 1995-08-14T04:00:00Z
+   Registry Expiry Date: 2025-08-13T04:00:00Z
+   Registrar Registration Expiration Date: 2025-08-13T04:00:00Z
+   Registrar: RESERVED-Internet Assigned Numbers Authority
+   Registrar IANA ID: 376
+   Domain Status: clientDeleteProhibited https://icann.org/epp#clientDeleteProhibited
+   Name Server: A.IANA-SERVERS.NET
+   Name Server: B.IANA-SERVERS.NET
+   DNSSEC: signedDelegation
+"""
+
+WHOIS_NOTICE = """NOTICE: The expiration date displayed in this record is the date the
+registrar's sponsorship of the domain name registration in the registry is
+currently set to expire. This date does not necessarily reflect the expiration
+date of the domain name registrant's agreement with the sponsoring
+registrar.  Users may consult the sponsoring registrar's Whois database to
+view the registrar's reported date of expiration for this registration.
+"""
+
+NIKTO_SAMPLE = """+ Server: Apache/2.4.41 (Ubuntu)
++ /: The anti-clickjacking X-Frame-Options header is not present.
++ OSVDB-3092: /admin/: This might be interesting...
++ OSVDB-3233: /icons/README: Apache default file found.
++ /: The X-Content-Type-Options header is not set.
++ OSVDB-3268: /images/: Directory indexing found.
++ Allowed HTTP Methods: GET, POST, OPTIONS, HEAD
+"""
+
+DIRB_SAMPLE = """---- Scanning URL: http://10.0.0.{n}/ ----
++ http://10.0.0.{n}/index.html (CODE:200|SIZE:10918)
+==> DIRECTORY: http://10.0.0.{n}/images/
++ http://10.0.0.{n}/server-status (CODE:403|SIZE:277)
+==> DIRECTORY: http://10.0.0.{n}/uploads/
+"""
+
+WPSCAN_SAMPLE = """[+] URL: http://10.0.0.{n}/ [10.0.0.{n}]
+[+] Started: Mon Jan  1 00:00:00 2024
+Interesting Finding(s):
+[+] Headers
+ | Interesting Entry: Server: Apache/2.4.41 (Ubuntu)
+ | Found By: Headers (Passive Detection)
+ | Confidence: 100%
+"""
+
+
+# Previous implementations, kept verbatim as the baseline
+
+def legacy_nmap(output):
+    parsed_results = {'open_ports': [], 'services': [], 'os_detection': None}
+    port_pattern = re.compile(r'(\d+)/(\w+)\s+(\w+)\s+(.+)')
+    for line in output.split('\n'):
+        port_match = port_pattern.search(line)
+        if port_match:
+            parsed_results['open_ports'].append({
+                'port': port_match.group(1),
+                'protocol': port_match.group(2),
+                'state': port_match.group(3),
+                'service': port_match.group(4)
+            })
+    return parsed_results
+
+
+def legacy_whois(output):
+    parsed_results = {
+        'domain_name': None, 'registrar': None, 'creation_date': None,
+        'expiration_date': None, 'name_servers': [], 'registrant': {}
+    }
+    patterns = {
+        'domain_name': r'Domain Name:\s*(.+)',
+        'registrar': r'Registrar:\s*(.+)',
+        'creation_date': r'Creation Date:\s*(.+)',
+        'expiration_date': r'Expiration Date:\s*(.+)',
+        'name_servers': r'Name Server:\s*(.+)',
+        'registrant_name': r'Registrant Name:\s*(.+)',
+        'registrant_org': r'Registrant Organization:\s*(.+)'
+    }
+    for key, pattern in patterns.items():
+        match = re.search(pattern, output, re.IGNORECASE)
+        if match:
+            if key == 'name_servers':
+                parsed_results['name_servers'].extend(match.group(1).split())
+            elif key == 'registrant_name':
+                parsed_results['registrant']['name'] = match.group(1)
+            elif key == 'registrant_org':
+                parsed_results['registrant']['organization'] = match.group(1)
+            else:
+                parsed_results[key] = match.group(1)
+    return parsed_results
+
+
+def legacy_nikto(output):
+    parsed_results = {'vulnerabilities': []}
+    vulnerability_pattern = re.compile(r'OSVDB-\d+: (.+)')
+    for line in output.split('\n'):
+        vulnerability_match = vulnerability_pattern.search(line)
+        if vulnerability_match:
+            parsed_results['vulnerabilities'].append(vulnerability_match.group(1))
+    return parsed_results
+
+
+def legacy_dirb(output):
+    parsed_results = {'directories': []}
+    directory_pattern = re.compile(r'==> DIRECTORY: (.+)')
+    for line in output.split('\n'):
+        directory_match = directory_pattern.search(line)
+        if directory_match:
+            parsed_results['directories'].append(directory_match.group(1))
+    return parsed_results
+
+
+def legacy_wpscan(output):
+    parsed_results = {'vulnerabilities': []}
+    vulnerability_pattern = re.compile(r'([a-zA-Z]+): (.+)')
+    for line in output.split('\n'):
+        vulnerability_match = vulnerability_pattern.search(line)
+        if vulnerability_match:
+            parsed_results['vulnerabilities'].append({
+                'severity': vulnerability_match.group(1),
+                'description': vulnerability_match.group(2)
+            })
+    return parsed_results
+
+
+def build_outputs(scale: int):
+    # WHOIS: the fields sit at the end of a long registry/registrar notice,
+    # the worst case for the old one-search-per-field parser
+    return {
+        'nmap': ''.join(NMAP_SAMPLE.format(n=i // 256, m=i % 256) for i in range(2000 * scale)),
+        'whois': WHOIS_NOTICE * 3000 * scale + WHOIS_HEADER,
+        'nikto': NIKTO_SAMPLE * 10000 * scale,
+        'dirb': ''.join(DIRB_SAMPLE.format(n=i % 256) for i in range(10000 * scale)),
+        'wpscan': ''.join(WPSCAN_SAMPLE.format(n=i % 256) for i in range(10000 * scale)),
+    }
+
+
+def comparable(tool, result):
+    """Drop the deliberate differences before checking agreement"""
+    if tool == 'whois':
+        # New parser strips values and keeps every Name Server line
+        result = dict(result, name_servers=result['name_servers'][:1])
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs per parser (best is reported)')
+    parser.add_argument('--scale', type=int, default=1, help='multiplier for the generated output sizes')
+    args = parser.parse_args()
+
+    cases = {
+        'nmap': (legacy_nmap, NMAP_TEXT_PARSER.parse),
+        'whois': (legacy_whois, WHOIS_PARSER.parse),
+        'nikto': (legacy_nikto, NIKTO_PARSER.parse),
+        'dirb': (legacy_dirb, DIRB_PARSER.parse),
+        'wpscan': (legacy_wpscan, get_parser('wpscan').parse),
+    }
+    outputs = build_outputs(args.scale)
+
+    print(f"{'tool':<8} {'size':>9} {'legacy ms':>10} {'new ms':>8} {'speedup':>8}  agree")
+    for tool, (legacy, new) in cases.items():
+        output = outputs[tool]
+        old_result, new_result = legacy(output), new(output)
+        if tool == 'whois':
+            old_result = {k: (v.strip() if isinstance(v, str) else v) for k, v in old_result.items()}
+        agree = comparable(tool, new_result) == old_result
+        old_time = min(timeit.repeat(lambda: legacy(output), number=1, repeat=args.repeat))
+        new_time = min(timeit.repeat(lambda: new(output), number=1, repeat=args.repeat))
+        print(
+            f"{tool:<8} {len(output) / 1e6:>7.1f}MB {old_time * 1000:>10.1f} {new_time * 1000:>8.1f} "
+            f"{old_time / new_time:>7.1f}x  {'yes' if agree else 'NO'}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Startup benchmark: time-to-menu with lazy modules vs building every module
+
+Each run is a fresh interpreter, so import costs are included. 'lazy' is what
+startup costs now: import src.menu and construct Menu. 'eager' additionally
+builds all ten tool modules up front, as Menu.init_modules used to. The
+install prompt for missing tools is answered 'n'.
+
+Usage (from the HackFusion directory):
+    python benchmarks/bench_startup.py [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import io, json, sys, time, contextlib
+started = time.perf_counter()
+sys.path.insert(0, {root!r})
+import rich.prompt
+rich.prompt.Prompt.ask = staticmethod(lambda *args, **kwargs: 'n')
+with contextlib.redirect_stdout(io.StringIO()):
+    from src.menu import Menu
+    imported = time.perf_counter()
+    menu = Menu()
+    ready = time.perf_counter()
+    failed = []
+    if {eager!r}:
+        for name in menu.modules.names():
+            try:
+                menu.modules.get(name)
+            except Exception:
+                failed.append(name)
+finished = time.perf_counter()
+print(json.dumps({{
+    'import': imported - started,
+    'menu': ready - started,
+    'total': finished - started,
+    'modules': menu.modules.load_times(),
+    'failed': failed
+}}))
+"""
+
+
+def run_child(eager: bool) -> dict:
+    code = CHILD.format(root=ROOT, eager=eager)
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=ROOT)
+    wall = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'child failed')
+    stats = json.loads(result.stdout.strip().splitlines()[-1])
+    stats['wall'] = wall
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=3, help='fresh interpreters per mode (median is reported)')
+    args = parser.parse_args()
+
+    runs = {'lazy': [run_child(False) for _ in range(args.repeat)],
+            'eager': [run_child(True) for _ in range(args.repeat)]}
+
+    print(f"{'mode':<6} {'import s':>9} {'to menu s':>10} {'all modules s':>14} {'process s':>10}")
+    for mode, stats in runs.items():
+        median = {key: statistics.median(run[key] for run in stats) for key in ('import', 'menu', 'total', 'wall')}
+        all_modules = f"{median['total']:.2f}" if mode == 'eager' else '-'
+        print(
+            f"{mode:<6} {median['import']:>9.2f} {median['menu']:>10.2f} "
+            f"{all_modules:>14} {median['wall']:>10.2f}"
+        )
+
+    print("\nPer-module import + construction (eager, median s):")
+    eager = runs['eager']
+    for name in eager[0]['modules']:
+        print(f"  {name:<16} {statistics.median(run['modules'].get(name, 0.0) for run in eager):>7.2f}")
+    failed = sorted({name for run in eager for name in run['failed']})
+    if failed:
+        print(f"  failed to initialize: {', '.join(failed)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,27 +3,40 @@ Tool execution and orchestration module
 """
 
 import subprocess
-import threading
 import queue
 import time
-from typing import Dict, List, Optional, Callable
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Callable
 import logging
 from tools_integration.information_gathering import InformationGathering
+from src.utils.config_loader import ConfigLoader
+from src.utils.execution_engine import ExecutionEngine, QueueFullError
+from src.utils.task_registry import TaskRegistry
+from src.utils.process_control import TaskCancelled, TaskContext, task_context
+from src.utils.task_journal import TaskJournal
 
 logger = logging.getLogger('HackFusion')
 
 class ToolExecutor:
-    def __init__(self):
-        self.running_tasks: Dict[str, Dict] = {}
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.results_queue = queue.Queue()
-        self.config = {}
+        self.config = config if config is not None else ConfigLoader().config
+        executor_config = self.config.get('executor', {})
+        self.engine = ExecutionEngine.from_config(executor_config)
+        self.tasks = TaskRegistry.from_config(executor_config.get('retention', {}))
+        self.cancel_grace_period = float(executor_config.get('cancel_grace_period', 5))
+        # Survives crashes so unfinished tasks can be re-queued with resume()
+        self.journal = TaskJournal.from_config(executor_config.get('journal', {}))
+        # Live handles of unfinished tasks: cancellation context and pool future
+        self._contexts: Dict[str, TaskContext] = {}
+        self._futures: Dict[str, Future] = {}
         self.modules = {}
         self._initialize_modules()
 
     def _initialize_modules(self):
         """Initialize tool integration modules"""
         try:
-            self.modules['info_gathering'] = InformationGathering(self.config)
+            self.modules['info_gathering'] = InformationGathering()
             # Initialize other modules as they are implemented
         except Exception as e:
             logger.error(f"Error initializing modules: {str(e)}")
@@ -45,88 +58,168 @@ class ToolExecutor:
         Returns:
             task_id: Unique identifier for the task
         """
-        task_id = f"{tool_name}_{int(time.time())}"
+        task_id = TaskRegistry.new_task_id(tool_name)
         
         try:
             # Create task entry
-            self.running_tasks[task_id] = {
+            self.tasks.add(task_id, {
                 'tool': tool_name,
-                'status': 'running',
+                'status': 'queued',
                 'start_time': time.time(),
                 'args': args,
                 'callback': callback
-            }
+            })
 
-            # Start task in background thread
-            thread = threading.Thread(
-                target=self._run_tool,
-                args=(task_id, tool_name, args)
-            )
-            thread.daemon = True
-            thread.start()
+            self._contexts[task_id] = TaskContext(task_id, self.cancel_grace_period)
+            self.journal.record_submitted(task_id, tool_name, args)
+
+            # Register the future before the job is queued: a worker that
+            # finishes first removes it in _run_tool
+            future = Future()
+            self._futures[task_id] = future
+
+            # Queue task on the worker pool (blocks while the queue is full)
+            self.engine.submit(tool_name, self._run_tool, task_id, tool_name, args, future=future)
 
             return task_id
 
+        except QueueFullError as e:
+            logger.warning(f"Execution queue full, rejecting {tool_name}: {str(e)}")
+            self.tasks.update(task_id, status='failed', error=str(e))
+            self.journal.record_failed(task_id, str(e))
+            self._contexts.pop(task_id, None)
+            self._futures.pop(task_id, None)
+            return task_id
+
         except Exception as e:
             logger.error(f"Error executing tool {tool_name}: {str(e)}")
-            self.running_tasks[task_id] = {
-                'tool': tool_name,
-                'status': 'failed',
-                'error': str(e)
-            }
+            self._contexts.pop(task_id, None)
+            self._futures.pop(task_id, None)
+            if task_id in self.tasks:
+                self.tasks.update(task_id, status='failed', error=str(e))
+            else:
+                self.tasks.add(task_id, {
+                    'tool': tool_name,
+                    'status': 'failed',
+                    'error': str(e)
+                })
             return task_id
 
     def _run_tool(self, task_id: str, tool_name: str, args: Dict):
         """Internal method to run a tool and handle its execution"""
+        context = self._contexts.get(task_id)
         try:
+            task = self.tasks.get(task_id)
+            if task is None or task['status'] != 'queued' or context is None:
+                return
+            self.tasks.update(task_id, status='running', start_time=time.time())
             result = None
             
-            # Route to appropriate module based on tool name
-            if tool_name == 'nmap':
-                result = self.modules['info_gathering'].run_nmap_scan(
-                    args.get('target', ''),
-                    args.get('scan_args')
-                )
-            elif tool_name == 'whois':
-                result = self.modules['info_gathering'].gather_whois_info(
-                    args.get('domain', '')
-                )
-            # Add more tool handlers as they are implemented
+            # Child processes started by the module are owned by this task
+            with task_context(context):
+                # Route to appropriate module based on tool name
+                if tool_name == 'nmap':
+                    result = self.modules['info_gathering'].run_nmap_scan(
+                        args.get('target', ''),
+                        args.get('scan_args'),
+                        use_cache=args.get('use_cache', True),
+                        refresh=args.get('refresh', False)
+                    )
+                elif tool_name == 'whois':
+                    result = self.modules['info_gathering'].run_whois_lookup(
+                        args.get('domain', ''),
+                        use_cache=args.get('use_cache', True),
+                        refresh=args.get('refresh', False)
+                    )
+                # Add more tool handlers as they are implemented
+
+            # A cancel that raced with completion wins
+            if context.cancelled:
+                return
             
             # Update task status
-            self.running_tasks[task_id]['status'] = 'completed'
-            self.running_tasks[task_id]['result'] = result
-            self.running_tasks[task_id]['end_time'] = time.time()
+            callback = task.get('callback')
+            self.tasks.update(
+                task_id,
+                status='completed',
+                result=result,
+                end_time=time.time(),
+                callback=None
+            )
+            self.journal.record_completed(task_id, result, tool=tool_name)
 
             # Call callback if provided
-            if self.running_tasks[task_id].get('callback'):
-                self.running_tasks[task_id]['callback'](result)
+            if callback:
+                callback(result)
 
             # Put result in queue
             self.results_queue.put((task_id, result))
 
+        except TaskCancelled:
+            logger.info(f"Task {task_id} cancelled")
+
         except Exception as e:
             logger.error(f"Error in task {task_id}: {str(e)}")
-            self.running_tasks[task_id]['status'] = 'failed'
-            self.running_tasks[task_id]['error'] = str(e)
+            if not (context and context.cancelled):
+                self.tasks.update(task_id, status='failed', error=str(e), end_time=time.time())
+                self.journal.record_failed(task_id, str(e))
+
+        finally:
+            self._contexts.pop(task_id, None)
+            self._futures.pop(task_id, None)
 
     def get_task_status(self, task_id: str) -> Dict:
         """Get the status of a running or completed task"""
-        return self.running_tasks.get(task_id, {
+        return self.tasks.get(task_id) or {
             'status': 'not_found',
             'error': 'Task ID not found'
-        })
+        }
 
     def get_running_tasks(self) -> List[str]:
         """Get list of currently running tasks"""
-        return [
-            task_id for task_id, task in self.running_tasks.items()
-            if task['status'] == 'running'
-        ]
+        return self.tasks.ids_by_status('running')
+
+    def get_tasks_by_tool(self, tool_name: str) -> List[str]:
+        """Get list of in-memory tasks for a tool"""
+        return self.tasks.ids_by_tool(tool_name)
+
+    def get_engine_stats(self) -> Dict[str, Any]:
+        """Get worker pool queue depth and per-tool activity"""
+        return self.engine.stats()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker pool, optionally waiting for queued tasks"""
+        self.engine.shutdown(wait=wait, cancel_pending=not wait)
+        self.journal.close()
+
+    def resume(self) -> List[str]:
+        """
+        Re-queue tasks the journal shows as submitted but never finished
+        
+        Completed tasks are skipped. Each unfinished task is closed in the
+        journal with a pointer to the task that replaces it.
+        
+        Returns:
+            List of new task IDs
+        """
+        task_ids = []
+        for state in self.journal.unfinished():
+            if state['task_id'] in self.tasks:
+                # Still owned by this process
+                continue
+            new_task_id = self.execute_tool(state.get('tool', ''), state.get('args') or {})
+            self.journal.record_cancelled(state['task_id'], requeued_as=new_task_id)
+            task_ids.append(new_task_id)
+            logger.info(f"Re-queued unfinished task {state['task_id']} as {new_task_id}")
+        return task_ids
 
     def cancel_task(self, task_id: str) -> bool:
         """
-        Cancel a running task
+        Cancel a queued or running task
+        
+        Queued tasks are dropped from the worker pool. Running tasks have their
+        tool process group terminated (SIGTERM, then SIGKILL after the grace
+        period) and release their worker slot immediately.
         
         Args:
             task_id: ID of the task to cancel
@@ -134,8 +227,19 @@ class ToolExecutor:
         Returns:
             bool: True if task was cancelled, False otherwise
         """
-        if task_id in self.running_tasks:
-            if self.running_tasks[task_id]['status'] == 'running':
-                self.running_tasks[task_id]['status'] = 'cancelled'
-                return True
-        return False
+        task = self.tasks.get(task_id)
+        if task is None or task['status'] not in ('queued', 'running'):
+            return False
+
+        self.tasks.update(task_id, status='cancelled', end_time=time.time())
+        self.journal.record_cancelled(task_id)
+
+        future = self._futures.pop(task_id, None)
+        if future is not None:
+            # Frees the queue slot now if the job has not started yet
+            self.engine.cancel(future)
+
+        context = self._contexts.pop(task_id, None)
+        if context is not None:
+            context.cancel()
+        return True
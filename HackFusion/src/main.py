@@ -5,6 +5,7 @@ Main entry point for HackFusion
 
 import sys
 import os
+import argparse
 
 # Add project root to Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -20,12 +21,88 @@ logger = logging.getLogger(__name__)
 try:
     from src.menu import Menu
     from src.feedback import FeedbackManager
+    from src.utils.target_batch import read_targets
+
+    def parse_args(argv=None):
+        """Parse command line arguments"""
+        parser = argparse.ArgumentParser(description="HackFusion - Advanced Cybersecurity Toolkit")
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Resume AI plans left unfinished by a previous run (completed steps are skipped)'
+        )
+        subparsers = parser.add_subparsers(dest='command')
+        rescan = subparsers.add_parser(
+            'rescan',
+            help='Rescan an estate against a stored baseline and report what changed'
+        )
+        rescan.add_argument('targets', nargs='+', help='Scope files, IPs, hostnames or CIDR ranges')
+        rescan.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Probe every host cheaply and fully scan only new or changed hosts'
+        )
+        rescan.add_argument('--baseline', default='default', help='Baseline name (default: %(default)s)')
+        rescan.add_argument('--output', help='Write the JSON diff report to this file')
+        return parser.parse_args(argv)
+
+    def run_rescan(args) -> int:
+        """
+        Run the rescan command and print the diff report
+        
+        :param args: Parsed command line arguments
+        :return: Process exit code
+        """
+        import json
+        from src.tools_integration.information_gathering import InformationGathering
+        from src.utils.incremental_rescan import IncrementalRescanner
+        
+        feedback = FeedbackManager()
+        info_gathering = InformationGathering()
+        rescanner = IncrementalRescanner.from_config(info_gathering, info_gathering.config.get('rescan', {}))
+        
+        targets = [target for source in args.targets for target in read_targets(source)]
+        feedback.display_progress(
+            f"{'Incremental' if args.incremental else 'Full'} rescan of baseline '{args.baseline}'"
+        )
+        report = rescanner.run(targets, baseline=args.baseline, incremental=args.incremental)
+        
+        for host, entry in report['hosts'].items():
+            status = entry['status']
+            if status == 'unchanged':
+                continue
+            details = []
+            if entry.get('reason'):
+                details.append('; '.join(entry['reason']))
+            for key in ('opened', 'closed'):
+                if entry.get(key):
+                    details.append(f"{key}: {', '.join(entry[key])}")
+            for change in entry.get('service_changes', []):
+                details.append(f"{change['port']} {change['before']} -> {change['after']}")
+            if entry.get('error'):
+                details.append(entry['error'])
+            print(f"{status:<11} {host}" + (f"  ({' | '.join(details)})" if details else ''))
+        
+        summary = report['summary']
+        feedback.display_success(
+            f"{summary['hosts']} hosts: {summary['full_scans']} fully scanned, "
+            f"{summary['skipped_scans']} unchanged, {summary['new']} new, {summary['changed']} changed, "
+            f"{summary['down']} down, {summary['failed']} failed in {summary['elapsed']}s"
+        )
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(report, f, indent=2)
+            feedback.display_success(f"Report written to {args.output}")
+        return 1 if summary['failed'] else 0
 
     def main():
         """
         Main entry point for HackFusion
         Provides comprehensive error handling and logging
         """
+        args = parse_args()
+        if args.command == 'rescan':
+            sys.exit(run_rescan(args))
         try:
             logger.info("🚀 Initializing HackFusion")
             # Initialize feedback manager for colored output
@@ -33,7 +110,7 @@ try:
             feedback.print_banner()
             
             # Create and run menu
-            menu = Menu()
+            menu = Menu(resume=args.resume)
             menu.run()
         except Exception as e:
             logger.error(f"Critical error in HackFusion: {e}", exc_info=True)
@@ -6,6 +6,7 @@ import sys
 import os
 import json
 import traceback
+import uuid
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from rich.console import Console
@@ -18,26 +19,46 @@ from rich import box
 
 from src.utils.config_loader import ConfigLoader
 from src.utils.kali_tools import KaliToolsManager
-from src.tools_integration.information_gathering import InformationGathering
-from src.tools_integration.vulnerability_analysis import VulnerabilityAnalysis
-from src.tools_integration.web_application import WebApplicationAnalysis
-from src.tools_integration.password_attacks import PasswordAttacks
-from src.tools_integration.wireless_attacks import WirelessAttacks
-from src.tools_integration.reverse_engineering import ReverseEngineering
-from src.tools_integration.exploitation import ExploitationTools
-from src.tools_integration.forensics import Forensics
-from src.tools_integration.reporting import ReportGenerator
-from src.tools_integration.network_attacks import NetworkAttacks
-from src.ai_assistant import AIAssistant
+from src.utils.task_journal import TaskJournal
+from src.utils.module_registry import ModuleRegistry, lazy_module
+
+# Plan step tool -> module that runs it
+PLAN_TOOL_MODULES = {
+    'nmap': 'info_gathering',
+    'whois': 'info_gathering',
+    'vuln_scan': 'vuln_analysis',
+    'web_scan': 'web_analysis'
+}
 
 class Menu:
     """Main menu class"""
     
-    def __init__(self):
-        """Initialize menu"""
+    # Tool modules, imported and constructed on first use (see init_modules)
+    info_gathering = lazy_module('info_gathering')
+    vuln_analysis = lazy_module('vuln_analysis')
+    web_analysis = lazy_module('web_analysis')
+    wireless = lazy_module('wireless')
+    password = lazy_module('password')
+    reverse = lazy_module('reverse')
+    exploitation = lazy_module('exploitation')
+    forensics = lazy_module('forensics')
+    reporting = lazy_module('reporting')
+    network_attacks = lazy_module('network_attacks')
+    
+    def __init__(self, resume: bool = False):
+        """
+        Initialize menu
+        
+        Args:
+            resume: Offer to resume AI plans left unfinished by a previous run
+        """
         self.console = Console()
+        self.resume = resume
+        journal_config = ConfigLoader().config.get('executor', {}).get('journal', {})
+        self.journal = TaskJournal.from_config(journal_config, path_key='plans_path')
         
         # Initialize Kali Tools Manager
+        self.kali_tools = None
         try:
             print("Initializing Kali Tools Manager...")
             self.kali_tools = KaliToolsManager()
@@ -59,6 +80,7 @@ class Menu:
             print("Initializing AI Assistant...")
             print(f"OPENAI_API_KEY present: {bool(os.getenv('OPENAI_API_KEY'))}")
             print(f"OPENAI_API_KEY value: {os.getenv('OPENAI_API_KEY')[:10]}..." if os.getenv('OPENAI_API_KEY') else "No OPENAI_API_KEY set")
+            from src.ai_assistant import AIAssistant
             self.ai_assistant = AIAssistant()
             self.has_ai = True
             print("AI Assistant initialized successfully")
@@ -73,20 +95,43 @@ class Menu:
         self.init_modules()
         
     def init_modules(self):
-        """Initialize tool modules"""
-        try:
-            self.info_gathering = InformationGathering()
-            self.vuln_analysis = VulnerabilityAnalysis()
-            self.web_analysis = WebApplicationAnalysis()
-            self.wireless = WirelessAttacks()
-            self.password = PasswordAttacks()
-            self.reverse = ReverseEngineering()
-            self.exploitation = ExploitationTools()
-            self.forensics = Forensics()
-            self.reporting = ReportGenerator()
-            self.network_attacks = NetworkAttacks()
-        except Exception as e:
-            self.console.print(f"[red]Warning: Some modules failed to initialize: {e}[/red]")
+        """
+        Register tool modules
+        
+        Nothing is imported or constructed here: each module is built with its
+        configuration the first time a menu or plan step uses it, so startup
+        does not pay for every module's tool checks and diagnostics.
+        """
+        config = ConfigLoader().config
+        self.modules = ModuleRegistry()
+        self.modules.register(
+            'info_gathering', 'src.tools_integration.information_gathering:InformationGathering',
+            lambda: {'kali_tools_manager': self.kali_tools}
+        )
+        self.modules.register('vuln_analysis', 'src.tools_integration.vulnerability_analysis:VulnerabilityAnalysis')
+        self.modules.register('web_analysis', 'src.tools_integration.web_application:WebApplicationAnalysis')
+        self.modules.register('wireless', 'src.tools_integration.wireless_attacks:WirelessAttacks')
+        self.modules.register(
+            'password', 'src.tools_integration.password_attacks:PasswordAttacks',
+            lambda: {'config': config}
+        )
+        self.modules.register(
+            'reverse', 'src.tools_integration.reverse_engineering:ReverseEngineering',
+            lambda: {'config': config.get('reverse_engineering', {})}
+        )
+        self.modules.register(
+            'exploitation', 'src.tools_integration.exploitation:ExploitationTools',
+            lambda: {'config': config}
+        )
+        self.modules.register(
+            'forensics', 'src.tools_integration.forensics:Forensics',
+            lambda: {'config': config.get('forensics', {})}
+        )
+        self.modules.register(
+            'reporting', 'src.tools_integration.reporting:ReportGenerator',
+            lambda: {'config': config}
+        )
+        self.modules.register('network_attacks', 'src.tools_integration.network_attacks:NetworkAttacks')
             
     def print_menu(self):
         """Print main menu"""
@@ -146,11 +191,28 @@ class Menu:
         }
         return examples.get(tool, [])
         
-    def execute_ai_plan(self, plan: Dict[str, Any]) -> None:
-        """Execute AI-generated action plan"""
+    def execute_ai_plan(self, plan: Dict[str, Any], plan_id: Optional[str] = None) -> None:
+        """
+        Execute AI-generated action plan
+        
+        Every step is journaled, so a plan interrupted by a crash can be
+        resumed with its plan_id: completed steps are restored from the
+        journal instead of being run again.
+        
+        Args:
+            plan: Action plan from the AI assistant
+            plan_id: Journal ID of an interrupted plan to resume
+        """
         results = []
         logs = []
         
+        step_states = {}
+        if plan_id is None:
+            plan_id = f"plan_{uuid.uuid4().hex}"
+            self.journal.record_submitted(plan_id, 'ai_plan', {'plan': plan})
+        else:
+            step_states = self.journal.replay()
+        
         # Show plan overview
         title = Text()
         title.append("🎯 ", style="green")
@@ -167,6 +229,11 @@ class Menu:
         )
         self.console.print(panel)
         
+        # Build the modules the plan needs while the user answers prompts
+        self.modules.preload(
+            PLAN_TOOL_MODULES[step['tool']] for step in plan['steps'] if step['tool'] in PLAN_TOOL_MODULES
+        )
+        
         # Execute steps
         for i, step in enumerate(plan['steps'], 1):
             step_title = Text()
@@ -180,6 +247,26 @@ class Menu:
             )
             self.console.print(step_panel)
             
+            step_id = f"{plan_id}_step_{i}"
+            state = step_states.get(step_id)
+            if state and state['status'] == 'completed':
+                stored = self.journal.load_result(state) or {}
+                if stored.get('result') is not None:
+                    results.append({'step': step, 'result': stored['result']})
+                if stored.get('log'):
+                    logs.append(stored['log'])
+                self.console.print("[green]Already completed, restored from journal[/green]")
+                continue
+            
+            log_entry = {
+                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'step': i,
+                'action': step['action'],
+                'tool': step['tool'],
+                'status': 'started'
+            }
+            self.journal.record_submitted(step_id, step['tool'], {'plan_id': plan_id, 'step': i})
+            
             try:
                 # Get optimal parameters for this step based on previous results
                 params = self.ai_assistant.get_next_step_params(step, results)
@@ -188,14 +275,7 @@ class Menu:
                 result = None
                 
                 # Log the step execution
-                log_entry = {
-                    'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    'step': i,
-                    'action': step['action'],
-                    'tool': step['tool'],
-                    'params': params,
-                    'status': 'started'
-                }
+                log_entry['params'] = params
                 
                 if step['tool'] == 'nmap':
                     examples = self.get_example_targets('nmap')
@@ -250,6 +330,10 @@ class Menu:
             # Add log entry
             log_entry['end_time'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             logs.append(log_entry)
+            if log_entry['status'] == 'success':
+                self.journal.record_completed(step_id, {'result': result, 'log': log_entry})
+            else:
+                self.journal.record_failed(step_id, log_entry.get('error', 'unknown error'))
                 
         # Generate report
         try:
@@ -284,6 +368,7 @@ class Menu:
                 
             self.console.print(f"[green]Report saved to:[/green] {report_file}")
             self.console.print(f"[green]Logs saved to:[/green] {logs_file}")
+            self.journal.record_completed(plan_id, {'report': report_file, 'logs': logs_file})
             
         except Exception as e:
             self.console.print(f"[red]Error generating report:[/red] {e}")
@@ -478,9 +563,6 @@ class Menu:
             elif choice == "1":
                 target = Prompt.ask("\n[cyan]Enter target URL[/cyan]")
                 
-                # Initialize vulnerability analysis
-                self.vuln_analysis = VulnerabilityAnalysis()
-                
                 # Use the correct method name: run_vuln_scan instead of run_scan
                 result = self.vuln_analysis.run_vuln_scan(target)
                 
@@ -935,8 +1017,32 @@ class Menu:
             elif choice == "0":
                 break
                 
+    def resume_ai_plans(self):
+        """Offer to resume AI plans the journal shows as unfinished"""
+        if not self.has_ai:
+            self.console.print("[red]AI Assistant not available, cannot resume AI plans[/red]")
+            return
+        
+        plans = self.journal.unfinished(tool='ai_plan')
+        if not plans:
+            self.console.print("[yellow]No unfinished AI plans to resume[/yellow]")
+            return
+        
+        for state in plans:
+            plan = (state.get('args') or {}).get('plan')
+            if not plan:
+                continue
+            started = datetime.fromtimestamp(state['ts']).strftime("%Y-%m-%d %H:%M:%S")
+            self.console.print(f"[cyan]Unfinished plan from {started}:[/cyan] {plan.get('description', state['task_id'])}")
+            if Prompt.ask("[cyan]Resume this plan?[/cyan] (y/n)", default="y").lower() == "y":
+                self.execute_ai_plan(plan, plan_id=state['task_id'])
+            else:
+                self.journal.record_cancelled(state['task_id'])
+                
     def run(self):
         """Run the menu"""
+        if self.resume:
+            self.resume_ai_plans()
         while True:
             try:
                 self.print_menu()
@@ -9,6 +9,7 @@ import logging
 import json
 import os
 import time
+from src.utils.timeout_policy import run_tool_process
 
 logger = logging.getLogger('HackFusion')
 
@@ -103,7 +104,7 @@ class ExploitationTools:
             ]
 
             logger.info(f"Running Metasploit exploit: {module}")
-            process = subprocess.run(cmd, capture_output=True, text=True)
+            process = run_tool_process(cmd)
 
             # Clean up script
             os.remove(script_path)
@@ -134,7 +135,7 @@ class ExploitationTools:
             cmd = ['searchsploit', '--json', query]
             
             logger.info(f"Searching ExploitDB: {query}")
-            process = subprocess.run(cmd, capture_output=True, text=True)
+            process = run_tool_process(cmd, target=query)
 
             results = []
             if process.returncode == 0:
@@ -185,13 +186,14 @@ class ExploitationTools:
                 cmd.extend(['-o', output_file])
 
             logger.info(f"Generating payload: {' '.join(cmd)}")
-            process = subprocess.run(cmd, capture_output=True)
+            # The payload is binary, so output is kept as bytes
+            process = run_tool_process(cmd, text=False)
 
             return {
                 'success': process.returncode == 0,
                 'output_file': output_file if output_file else None,
                 'payload': process.stdout if not output_file else None,
-                'error': process.stderr.decode() if process.returncode != 0 else None
+                'error': process.stderr.decode(errors='replace') if process.returncode != 0 else None
             }
         except Exception as e:
             logger.error(f"Error generating payload: {str(e)}")
@@ -8,6 +8,7 @@ from typing import Dict, List, Optional
 import logging
 import os
 import json
+from src.utils.timeout_policy import run_tool_process
 
 logger = logging.getLogger('HackFusion')
 
@@ -110,7 +111,7 @@ class Forensics:
                 ]
 
                 logger.info(f"Running Volatility plugin {plugin}: {' '.join(cmd)}")
-                process = subprocess.run(cmd, capture_output=True, text=True)
+                process = run_tool_process(cmd, target=dump_file)
                 
                 results[plugin] = {
                     'success': process.returncode == 0,
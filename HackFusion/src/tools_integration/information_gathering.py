@@ -26,13 +26,18 @@ def configure_tool_logging(log_level=logging.INFO, log_dir='/tmp/hackfusion_logs
 # Configure logging when the module is imported
 configure_tool_logging()
 
+import asyncio
 import subprocess
 import re
+import xml.etree.ElementTree as ET
 import json
 import os
-import socket
 import ipaddress
-from typing import Dict, Any, Optional, List
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Callable, Iterable, Iterator
 from datetime import datetime
 
 from rich.console import Console
@@ -41,67 +46,190 @@ from rich.panel import Panel
 from rich.text import Text
 
 from src.utils.kali_tools import KaliToolsManager
+from src.utils.process_control import TaskCancelled, TaskContext, current_context, run_process, task_context
+from src.utils import async_runner
+from src.utils.nmap_model import aggregate_host_records, parse_nmap_xml
+from src.utils.output_parsers import ALL, EXTEND, Field, OutputParser, get_parser, register_parser
+from src.utils.nmap_stream import iter_nmap_hosts
+from src.utils.strategy_scheduler import StrategyScheduler
+from src.utils.target_sharding import ShardedNmapScanner, parse_network
+from src.utils.tcp_sweep import TcpSweeper
+from src.utils.whois_client import whois_lookup, whois_lookup_many
+from src.utils.whois_cache import WhoisCache, get_whois_cache
+from src.utils.dag_scheduler import DagScheduler
+from src.utils.config_loader import ConfigLoader
+from src.utils.result_cache import get_result_cache
+from src.utils.async_dns import AsyncResolver, DEFAULT_RECORD_TYPES
+from src.utils.resolver_cache import get_resolver_cache
+from src.utils.network_monitor import get_network_monitor
+from src.utils.target_batch import TargetSource, read_targets, run_bounded, unique_targets
+from src.utils.timeout_policy import get_timeout_policy, run_tool_process
+from src.utils.install_planner import InstallPlanner
+
+# Used when config/tools.yaml does not define information_gathering.nmap.strategies
+DEFAULT_NMAP_STRATEGIES = [
+    # Basic service and version detection with increased verbosity
+    {'name': 'service_scan', 'args': ['-sV', '-sC', '-v'], 'cost': 2},
+    
+    # More aggressive scanning with OS detection and full verbosity
+    {'name': 'full_aggressive', 'args': ['-A', '-p-', '-vv'], 'cost': 10},
+    
+    # Quick scan with top ports and network diagnostics
+    {'name': 'top_ports', 'args': ['-sS', '-sV', '-Pn', '--traceroute', '--top-ports', '100', '-vv'], 'cost': 1}
+]
+
+# Per-shard arguments when information_gathering.nmap.sharding.args is not set
+DEFAULT_SHARD_ARGS = ['-sS', '-sV', '--top-ports', '100']
+
+def _stripped(groups):
+    return groups[0].strip()
+
+
+def _port_record(groups):
+    return {'port': groups[0], 'protocol': groups[1], 'state': groups[2], 'service': groups[3]}
+
+
+def _severity_record(groups):
+    return {'severity': groups[0], 'description': groups[1]}
+
+
+def _split_names(groups):
+    return groups[0].split()
+
+
+# Output parsers, compiled once at import time (see src.utils.output_parsers)
+NMAP_TEXT_PARSER = register_parser('nmap', OutputParser([
+    Field('open_ports', r'(\d+)/(\w+)[ \t]+(\w+)[ \t]+(.+)', ALL, _port_record),
+], template={'open_ports': [], 'services': [], 'os_detection': None}, anchored=True))
+
+# Registrar answers prefix some labels ("Registrar Registration Expiration
+# Date:", "Sponsoring Registrar:"), so those fields allow leading label words.
+# Restricted to word characters so prose lines are rejected early
+_WHOIS_LABEL_PREFIX = r'[\w \t-]*?'
+
+WHOIS_PARSER = register_parser('whois', OutputParser([
+    Field('domain_name', r'Domain Name:[ \t]*(.+)', build=_stripped, ignore_case=True),
+    Field('registrar', _WHOIS_LABEL_PREFIX + r'Registrar:[ \t]*(.+)', build=_stripped, ignore_case=True),
+    Field('creation_date', r'Creation Date:[ \t]*(.+)', build=_stripped, ignore_case=True),
+    Field('expiration_date', _WHOIS_LABEL_PREFIX + r'Expiration Date:[ \t]*(.+)', build=_stripped, ignore_case=True),
+    # Every Name Server line, not just the first
+    Field('name_servers', r'Name Server:[ \t]*(.+)', EXTEND, _split_names, ignore_case=True),
+    Field('registrant.name', r'Registrant Name:[ \t]*(.+)', build=_stripped, ignore_case=True),
+    Field('registrant.organization', r'Registrant Organization:[ \t]*(.+)', build=_stripped, ignore_case=True),
+], template={
+    'domain_name': None,
+    'registrar': None,
+    'creation_date': None,
+    'expiration_date': None,
+    'name_servers': [],
+    'registrant': {}
+}, anchored=True))
+
+NIKTO_PARSER = register_parser('nikto', OutputParser([
+    Field('vulnerabilities', r'OSVDB-\d+: (.+)', ALL),
+]))
+
+DIRB_PARSER = register_parser('dirb', OutputParser([
+    Field('directories', r'==> DIRECTORY: (.+)', ALL),
+]))
+
+register_parser('burpsuite', OutputParser([Field('issues', r'([a-zA-Z]+): (.+)', ALL, _severity_record)]))
+register_parser('wpscan', OutputParser([Field('vulnerabilities', r'([a-zA-Z]+): (.+)', ALL, _severity_record)]))
+
 from src.utils.tool_decorators import tool_loading_animation
 
 class InformationGathering:
     """Information gathering tools with enhanced output and error handling"""
     
+    # Tools the information gathering wrappers shell out to
+    CRITICAL_TOOLS = ['whois', 'nmap', 'dig', 'host', 'traceroute', 'netstat', 'ip']
+    
     def __init__(self, kali_tools_manager: Optional[KaliToolsManager] = None):
         """
-        Initialize Information Gathering module with comprehensive diagnostics
+        Initialize Information Gathering module
+        
+        Construction does no installs and no network I/O. Missing tools are
+        only reported (see install_missing_tools), and network diagnostics
+        are collected by the shared NetworkMonitor in the background or on
+        demand, depending on information_gathering.diagnostics.on_start.
         
         :param kali_tools_manager: KaliTools instance for tool management
         """
         import logging
-        import subprocess
         
         logger = logging.getLogger(__name__)
         
         # Initialize Kali Tools
         self.kali_tools = kali_tools_manager or KaliToolsManager()
         
-        # Critical tools for information gathering
-        critical_tools = [
-            'whois', 'nmap', 'dig', 'host', 
-            'traceroute', 'netstat', 'ip'
-        ]
+        # Information gathering section of config/tools.yaml
+        self.config = ConfigLoader().get_tool_config('information_gathering')
         
         # Tool availability check
-        missing_tools = []
-        for tool in critical_tools:
-            if not self.kali_tools.check_tool(tool):
-                missing_tools.append(tool)
-                logger.warning(f"Critical tool not found: {tool}")
-        
-        # Comprehensive tool installation check
+        missing_tools = self.missing_tools()
         if missing_tools:
-            logger.error(f"Missing critical tools: {', '.join(missing_tools)}")
-            try:
-                # Attempt to install missing tools
-                install_cmd = ['sudo', 'apt-get', 'install', '-y'] + missing_tools
-                result = subprocess.run(
-                    install_cmd, 
-                    capture_output=True, 
-                    text=True, 
-                    timeout=300  # 5-minute timeout
-                )
-                
-                if result.returncode == 0:
-                    logger.info(f"Successfully installed: {', '.join(missing_tools)}")
-                else:
-                    logger.error(f"Tool installation failed. Output: {result.stderr}")
-            except Exception as install_error:
-                logger.error(f"Tool installation attempt failed: {install_error}")
+            logger.warning(
+                f"Missing critical tools: {', '.join(missing_tools)} "
+                f"(call install_missing_tools() to install them)"
+            )
         
-        # Perform network diagnostics
-        try:
-            self.log_network_diagnostics()
-        except Exception as diag_error:
-            logger.error(f"Network diagnostics failed: {diag_error}")
+        # Network diagnostics never block construction; a report within the TTL is reused
+        if self.config.get('diagnostics', {}).get('on_start', 'background') == 'background':
+            get_network_monitor().snapshot(wait=False)
         
         # Initialize console for rich output
         self.console = Console()
     
+    def missing_tools(self) -> List[str]:
+        """
+        Critical tools that are not installed
+        
+        :return: Names of missing tools
+        """
+        return self.kali_tools.availability.missing(self.CRITICAL_TOOLS)
+    
+    def install_missing_tools(self, timeout: int = 300) -> Dict[str, Any]:
+        """
+        Install missing critical tools with apt-get
+        
+        :param timeout: Seconds allowed for the install transaction
+        :return: Dictionary with the tools attempted and the install status
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+        
+        missing_tools = self.missing_tools()
+        if not missing_tools:
+            return {'status': 'success', 'installed': []}
+        
+        # One index refresh and one apt transaction for every missing tool
+        packages = {
+            tool: self.kali_tools.REQUIRED_TOOLS.get(tool, {'package': tool})
+            for tool in missing_tools
+        }
+        config = dict(ConfigLoader().config.get('installer', {}), install_timeout=timeout)
+        try:
+            report = InstallPlanner.from_config(config, packages).install(missing_tools)
+        except Exception as install_error:
+            logger.error(f"Tool installation attempt failed: {install_error}")
+            return {'status': 'error', 'error': str(install_error), 'missing': missing_tools}
+        
+        self.kali_tools.availability.invalidate(missing_tools)
+        installed = [tool for tool, ok in report['tools'].items() if ok]
+        failed = [tool for tool in missing_tools if tool not in installed]
+        if not failed:
+            logger.info(f"Successfully installed: {', '.join(installed)}")
+            return {'status': 'success', 'installed': installed, 'packages': report['packages']}
+        errors = [result.get('stderr') or result.get('error', '') for result in report['install']]
+        logger.error(f"Tool installation failed for {', '.join(failed)}")
+        return {
+            'status': 'error',
+            'error': '\n'.join(error for error in errors if error) or 'installation failed',
+            'installed': installed,
+            'missing': failed,
+            'packages': report['packages']
+        }
+    
     def _validate_target(self, target: str) -> bool:
         """
         Validate target input for various information gathering tools
@@ -114,11 +242,10 @@ class InformationGathering:
             ipaddress.ip_address(target)
             return True
         except ValueError:
-            # Check if it's a valid domain
-            try:
-                socket.gethostbyname(target)
+            # Check if it's a valid domain (resolutions are shared process-wide)
+            if get_resolver_cache().resolve(target) is not None:
                 return True
-            except socket.gaierror:
+            else:
                 # Check if it's a valid URL
                 url_pattern = re.compile(
                     r'^https?://'  # http:// or https://
@@ -131,12 +258,29 @@ class InformationGathering:
         
         return False
     
-    def _run_command(self, cmd: List[str], timeout: int = 300) -> Dict[str, Any]:
+    def validate_targets(self, targets: Iterable[str]) -> Dict[str, bool]:
+        """
+        Validate many targets, resolving hostnames concurrently
+        
+        :param targets: Target IPs, domains or URLs
+        :return: Mapping of each target to its validity
+        """
+        targets = list(targets)
+        # Warm the shared resolver cache in one batch so the per-target checks hit it
+        get_resolver_cache().resolve_many(
+            target for target in targets if '://' not in target and '/' not in target
+        )
+        return {target: self._validate_target(target) for target in targets}
+    
+    def _run_command(self, cmd: List[str], timeout: Optional[int] = None, target: Optional[str] = None) -> Dict[str, Any]:
         """
         Run a command with enhanced error handling, logging, and output capture
         
+        The execution is recorded in the tool telemetry store.
+        
         :param cmd: Command to run as a list of strings
-        :param timeout: Timeout in seconds
+        :param timeout: Timeout in seconds (default: derived from the tool's history)
+        :param target: Target the command runs against (for telemetry grouping)
         :return: Dictionary with command execution results
         """
         import logging
@@ -148,6 +292,9 @@ class InformationGathering:
         
         # Detailed logging of command execution
         logger.info(f"Executing command: {' '.join(cmd)}")
+        if timeout is None:
+            timeout = get_timeout_policy().timeout_for_command(cmd, target)
+        started = time.monotonic()
         
         try:
             # Enhanced subprocess configuration
@@ -155,50 +302,26 @@ class InformationGathering:
             process_env['LC_ALL'] = 'C.UTF-8'  # Ensure consistent encoding
             process_env['LANG'] = 'C.UTF-8'
             
-            # Comprehensive subprocess run with enhanced error handling
-            result = subprocess.run(
-                cmd, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE,
-                text=True, 
-                timeout=timeout, 
-                universal_newlines=True,
-                env=process_env,
-                errors='replace'  # Handle potential encoding issues
-            )
+            # Run in its own process group so task cancellation can kill it
+            result = run_process(cmd, timeout=timeout, env=process_env)
             
             # Log raw outputs for debugging
             logger.debug(f"Command STDOUT: {result.stdout}")
             logger.debug(f"Command STDERR: {result.stderr}")
             
-            # Determine overall status
-            status = 'success' if result.returncode == 0 else 'error'
-            
             # Prepare detailed result dictionary
-            command_result = {
-                'status': status,
+            command_result = self._annotate_command_result({
+                'status': 'success' if result.returncode == 0 else 'error',
                 'stdout': result.stdout.strip(),
                 'stderr': result.stderr.strip(),
                 'returncode': result.returncode,
                 'command': ' '.join(cmd)
-            }
-            
-            # Add extra diagnostics for error cases
-            if status == 'error':
-                logger.error(f"Command failed with return code {result.returncode}")
-                logger.error(f"Error output: {result.stderr}")
-                
-                # Additional error context
-                command_result['error_details'] = {
-                    'possible_reasons': self._analyze_command_error(result.stderr)
-                }
-            
-            return command_result
+            })
         
         except subprocess.TimeoutExpired:
             error_msg = f"Command {' '.join(cmd)} timed out after {timeout} seconds"
             logger.error(error_msg)
-            return {
+            command_result = {
                 'status': 'timeout',
                 'error': error_msg,
                 'command': ' '.join(cmd)
@@ -212,6 +335,29 @@ class InformationGathering:
                 'error': error_msg,
                 'command': ' '.join(cmd)
             }
+        
+        self.kali_tools.telemetry.record_command(cmd, command_result, time.monotonic() - started, target)
+        return command_result
+    
+    def _annotate_command_result(self, command_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add error diagnostics to a failed command result
+        
+        :param command_result: Result dictionary from a finished command
+        :return: The same dictionary, with error_details for failures
+        """
+        logger = logging.getLogger(__name__)
+        
+        if command_result.get('status') == 'error' and 'returncode' in command_result:
+            logger.error(f"Command failed with return code {command_result['returncode']}")
+            logger.error(f"Error output: {command_result['stderr']}")
+            
+            # Additional error context
+            command_result['error_details'] = {
+                'possible_reasons': self._analyze_command_error(command_result['stderr'])
+            }
+        
+        return command_result
     
     def _analyze_command_error(self, error_output: str) -> List[str]:
         """
@@ -247,7 +393,30 @@ class InformationGathering:
         
         return possible_reasons
     
-    def run_nmap_scan(self, target: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    def run_nmap_scan(
+        self,
+        target: str,
+        params: Dict[str, Any] = None,
+        use_cache: bool = True,
+        refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run Nmap scan, serving a fresh cached result for the same target and params
+        
+        :param target: Target IP or domain to scan
+        :param params: Additional Nmap parameters
+        :param use_cache: Set to False to bypass the result cache entirely
+        :param refresh: Rescan and replace any cached result
+        :return: Scan results dictionary
+        """
+        return get_result_cache().cached(
+            'nmap', target, params,
+            lambda: self._run_nmap_scan(target, params),
+            bypass=not use_cache,
+            refresh=refresh
+        )
+    
+    def _run_nmap_scan(self, target: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Run Nmap scan with comprehensive error handling and output parsing
         
@@ -259,14 +428,15 @@ class InformationGathering:
         import logging
         logger = logging.getLogger(__name__)
         
+        # CIDR ranges are sharded across parallel nmap processes, not resolved
+        network = parse_network(target)
+        if network is not None:
+            return self._run_sharded_nmap_scan(network)
+        
         # Validate and prepare target
         try:
             # Attempt to resolve target to IP if it's a domain
-            import socket
-            try:
-                target_ip = socket.gethostbyname(target)
-            except socket.gaierror:
-                target_ip = target
+            target_ip = get_resolver_cache().resolve(target) or target
         except Exception as resolve_error:
             logger.error(f"Target resolution error: {resolve_error}")
             target_ip = target
@@ -284,60 +454,59 @@ class InformationGathering:
             logger.error('Nmap is not installed')
             return {'error': 'Nmap is not installed. Please install it first.'}
         
-        # Prepare multiple Nmap scanning strategies with increased verbosity
-        scan_strategies = [
-            # Basic service and version detection with increased verbosity
-            ['nmap', '-sV', '-sC', '-v', '-oX', '-', target_ip],
-            
-            # More aggressive scanning with OS detection and full verbosity
-            ['nmap', '-A', '-p-', '-vv', '-oX', '-', target_ip],
-            
-            # Quick scan with top ports and network diagnostics
-            ['nmap', '-sS', '-sV', '-Pn', '--traceroute', '--top-ports', '100', '-vv', '-oX', '-', target_ip]
-        ]
-        
-        # Additional network diagnostics before scanning
-        try:
-            import subprocess
-            # Ping test
-            ping_result = subprocess.run(['ping', '-c', '4', target_ip], 
-                                         capture_output=True, text=True, timeout=10)
-            logger.info(f"Ping result: {ping_result.stdout}")
-        except Exception as ping_error:
-            logger.warning(f"Ping diagnostics failed: {ping_error}")
-        
-        # Try multiple scanning strategies
-        for idx, cmd in enumerate(scan_strategies, 1):
-            logger.info(f"Attempting Nmap scan strategy {idx}: {' '.join(cmd)}")
-            
+        # TCP connect pre-sweep instead of a blocking ping
+        sweep_result = None
+        if self.config.get('nmap', {}).get('pre_sweep', {}).get('enabled', True):
             try:
-                result = self._run_command(cmd)
-                
-                # Log raw command output for debugging
-                logger.debug(f"Nmap Scan Strategy {idx} Raw Output: {result}")
-                
-                # Parse and enhance Nmap output
-                if result['status'] == 'success' and result['stdout']:
-                    try:
-                        # Try parsing XML output
-                        parsed_output = self._parse_nmap_xml_output(result['stdout'])
-                        
-                        # Only return if we have meaningful parsed results
-                        if parsed_output and parsed_output.get('open_ports'):
-                            result['parsed_output'] = parsed_output
-                            logger.info(f"Successful scan with strategy {idx}")
-                            return result
-                    except Exception as parse_error:
-                        logger.error(f"XML Parsing error (Strategy {idx}): {parse_error}")
-                        
-                        # Fallback to text parsing
-                        parsed_output = self._parse_nmap_output(result['stdout'])
-                        if parsed_output and parsed_output.get('open_ports'):
-                            result['parsed_output'] = parsed_output
-                            logger.info(f"Successful text parsing with strategy {idx}")
-                            return result
-            except Exception as scan_error:
-                logger.error(f"Scan strategy {idx} failed: {scan_error}")
+                sweep_result = self.pre_sweep([target_ip])['hosts'][target_ip]
+                logger.info(f"Pre-sweep of {target_ip}: {sweep_result}")
+            except Exception as sweep_error:
+                logger.warning(f"Pre-sweep failed: {sweep_error}")
+        
+        return self._scan_resolved_target(target, target_ip, sweep_result)
+    
+    def _scan_resolved_target(
+        self,
+        target: str,
+        target_ip: str,
+        sweep_result: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Run the Nmap strategies against a validated, resolved target
+        
+        :param target: Target as given by the caller
+        :param target_ip: Resolved target
+        :param sweep_result: Pre-sweep record for target_ip, or None if not swept
+        :return: Scan results dictionary
+        """
+        logger = logging.getLogger(__name__)
+        nmap_config = self.config.get('nmap', {})
+        sweep_config = nmap_config.get('pre_sweep', {})
+        
+        if sweep_result is not None and not sweep_result['alive'] and sweep_config.get('skip_dead_targets', False):
+            return {
+                'status': 'not_found',
+                'error': f'Target did not answer the TCP pre-sweep: {target_ip}',
+                'pre_sweep': sweep_result
+            }
+        
+        # Run the configured strategies (sequentially, cheapest first, or raced)
+        scheduler = StrategyScheduler(
+            policy=nmap_config.get('strategy_policy', 'cost_order'),
+            max_parallel=nmap_config.get('max_parallel_strategies')
+        )
+        strategy, result, attempts = scheduler.run(
+            self._nmap_strategies(),
+            lambda strategy: self._run_nmap_strategy(strategy, target_ip),
+            lambda result: bool(result['parsed_output'].get('open_ports'))
+        )
+        
+        if strategy is not None:
+            result['strategy'] = strategy['name']
+            result['strategy_attempts'] = attempts
+            result['pre_sweep'] = sweep_result
+            logger.info(f"Successful scan with strategy {strategy['name']}")
+            return result
         
         # If no results found, provide a detailed error with comprehensive diagnostics
         return {
@@ -346,6 +515,8 @@ class InformationGathering:
             'diagnostics': {
                 'target_original': target,
                 'target_resolved': target_ip,
+                'strategy_attempts': attempts,
+                'pre_sweep': sweep_result,
                 'suggestions': [
                     'Verify network connectivity',
                     'Check firewall settings',
@@ -356,54 +527,280 @@ class InformationGathering:
             }
         }
     
-    def _parse_nmap_xml_output(self, xml_output: str) -> Dict[str, Any]:
+    def _run_sharded_nmap_scan(self, network) -> Dict[str, Any]:
         """
-        Parse Nmap XML output for more detailed scanning results
+        Scan a CIDR range as parallel shards and merge the results
         
-        :param xml_output: Raw XML output from Nmap
-        :return: Parsed scanning results
+        :param network: ipaddress network to scan
+        :return: Scan results dictionary with merged parsed_output
         """
-        import xml.etree.ElementTree as ET
+        logger = logging.getLogger(__name__)
         
-        parsed_results = {
-            'open_ports': [],
-            'services': [],
-            'os_detection': None,
-            'host_status': 'down'
-        }
+        if not self.kali_tools.check_tool('nmap'):
+            logger.error('Nmap is not installed')
+            return {'error': 'Nmap is not installed. Please install it first.'}
+        
+        sharding_config = self.config.get('nmap', {}).get('sharding', {})
+        scan_args = sharding_config.get('args', DEFAULT_SHARD_ARGS)
+        if isinstance(scan_args, str):
+            scan_args = scan_args.split()
+        
+        process_env = os.environ.copy()
+        process_env['LC_ALL'] = 'C.UTF-8'
+        process_env['LANG'] = 'C.UTF-8'
+        
+        scanner = ShardedNmapScanner.from_config(sharding_config)
+        sweep_config = self.config.get('nmap', {}).get('pre_sweep', {})
+        if sweep_config.get('enabled', True) and network.num_addresses <= int(sweep_config.get('max_hosts', 65536)):
+            # Only hosts that answered the sweep are handed to nmap
+            hosts = [str(host) for host in network.hosts()] or [str(network.network_address)]
+            sweep = self.pre_sweep(hosts)
+            sweep_summary = {
+                'probed': sweep['probed'],
+                'live': len(sweep['live']),
+                'elapsed': sweep['elapsed'],
+                'hints': {host: sweep['hosts'][host]['open_ports'] for host in sweep['live']}
+            }
+            if not sweep['live']:
+                return {
+                    'status': 'not_found',
+                    'error': f'No live hosts found in {network}',
+                    'parsed_output': aggregate_host_records([]),
+                    'pre_sweep': sweep_summary
+                }
+            # These hosts are known to be up, so nmap can skip host discovery
+            live_args = scan_args if '-Pn' in scan_args else scan_args + ['-Pn']
+            result = scanner.scan_hosts(sweep['live'], live_args, env=process_env)
+            result['pre_sweep'] = sweep_summary
+        else:
+            result = scanner.scan(network, scan_args, env=process_env)
+        
+        if not result['parsed_output']['open_ports']:
+            result['status'] = 'not_found' if result['status'] == 'success' else result['status']
+            result['error'] = f'No open ports found in {network}'
+        return result
+    
+    def pre_sweep(self, targets: Iterable[str], until_alive: bool = True) -> Dict[str, Any]:
+        """
+        Find live hosts with an asynchronous TCP connect sweep
+        
+        Uses information_gathering.nmap.pre_sweep for the probed ports,
+        concurrency, connection rate and timeout.
+        
+        :param targets: IP addresses or hostnames
+        :param until_alive: Decide liveness from the short liveness port list and
+                            probe the remaining ports on live hosts only
+        :return: Sweep results with per-host liveness and hinted open ports
+        """
+        sweep_config = self.config.get('nmap', {}).get('pre_sweep', {})
+        return TcpSweeper.from_config(sweep_config).sweep_hosts(targets, until_alive=until_alive)
+    
+    def _nmap_strategies(self) -> List[Dict[str, Any]]:
+        """
+        Get Nmap scan strategies from configuration
         
+        :return: List of strategies with name, argument list and relative cost
+        """
+        configured = self.config.get('nmap', {}).get('strategies') or DEFAULT_NMAP_STRATEGIES
+        strategies = []
+        for idx, strategy in enumerate(configured, 1):
+            args = strategy.get('args', [])
+            if isinstance(args, str):
+                args = args.split()
+            strategies.append({
+                'name': strategy.get('name', f'strategy_{idx}'),
+                'args': list(args),
+                'cost': strategy.get('cost', idx)
+            })
+        return strategies
+    
+    def _run_nmap_strategy(self, strategy: Dict[str, Any], target_ip: str) -> Optional[Dict[str, Any]]:
+        """
+        Execute a single Nmap strategy and parse its output
+        
+        :param strategy: Strategy from _nmap_strategies
+        :param target_ip: Resolved target
+        :return: Command result with parsed_output, or None if the scan failed
+        """
+        logger = logging.getLogger(__name__)
+        
+        cmd = ['nmap'] + strategy['args'] + ['-oX', '-', target_ip]
+        logger.info(f"Attempting Nmap scan strategy {strategy['name']}: {' '.join(cmd)}")
+        
+        result = self._run_command(cmd, target=target_ip)
+        
+        # Log raw command output for debugging
+        logger.debug(f"Nmap Scan Strategy {strategy['name']} Raw Output: {result}")
+        
+        if result['status'] != 'success' or not result['stdout']:
+            return None
+        
+        # Parse and enhance Nmap output
         try:
-            # Parse XML output
-            root = ET.fromstring(xml_output)
+            # Try parsing XML output
+            result['parsed_output'] = self._parse_nmap_xml_output(result['stdout'])
+        except Exception as parse_error:
+            logger.error(f"XML Parsing error (Strategy {strategy['name']}): {parse_error}")
             
-            # Check host status
-            host = root.find('.//host')
-            if host is not None:
-                status = host.find('status')
-                if status is not None and status.get('state') == 'up':
-                    parsed_results['host_status'] = 'up'
-                
-                # Extract port information
-                for port in host.findall('.//port'):
-                    port_info = {
-                        'number': port.get('portid'),
-                        'protocol': port.get('protocol'),
-                        'state': port.find('state').get('state') if port.find('state') is not None else 'unknown',
-                        'service': port.find('service').get('name', 'unknown') if port.find('service') is not None else 'unknown'
-                    }
-                    parsed_results['open_ports'].append(port_info)
-                
-                # OS Detection
-                os_match = host.find('.//osmatch')
-                if os_match is not None:
-                    parsed_results['os_detection'] = {
-                        'name': os_match.get('name', 'Unknown'),
-                        'accuracy': os_match.get('accuracy', 'N/A')
-                    }
-            
-            return parsed_results
+            # Fallback to text parsing
+            result['parsed_output'] = self._parse_nmap_output(result['stdout'])
         
-        except Exception as e:
+        return result
+    
+    def stream_nmap_scan(
+        self,
+        target: str,
+        scan_args: Optional[List[str]] = None,
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        timeout: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Run an Nmap scan and yield host records as each host finishes
+        
+        Reads the XML from the pipe with an incremental parser, so the first
+        results are available while the scan is still running and memory is
+        bounded by a single host instead of the whole document.
+        
+        :param target: Target IP, domain or network to scan
+        :param scan_args: Nmap arguments (defaults to service and script scan)
+        :param callback: Optional function called with each host record
+        :param timeout: Timeout in seconds for the whole scan (default: timeout policy)
+        :return: Iterator of host records
+        """
+        logger = logging.getLogger(__name__)
+        
+        target = self._normalize_domain(target)
+        if not self.kali_tools.check_tool('nmap'):
+            logger.error('Nmap is not installed')
+            return
+        
+        cmd = ['nmap'] + list(scan_args or ['-sV', '-sC']) + ['-oX', '-', target]
+        logger.info(f"Streaming Nmap scan: {' '.join(cmd)}")
+        
+        process_env = os.environ.copy()
+        process_env['LC_ALL'] = 'C.UTF-8'
+        process_env['LANG'] = 'C.UTF-8'
+        
+        if timeout is None:
+            timeout = get_timeout_policy().timeout_for_command(cmd, target)
+        
+        # Only complete runs are recorded: a consumer that stops early says nothing about duration
+        started = time.monotonic()
+        try:
+            returncode = yield from iter_nmap_hosts(cmd, env=process_env, timeout=timeout, on_host=callback)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Streaming Nmap scan of {target} exceeded its {timeout:.1f}s deadline and was killed")
+            self.kali_tools.telemetry.record_command(cmd, {'status': 'timeout'}, time.monotonic() - started, target)
+            raise
+        self.kali_tools.telemetry.record_command(
+            cmd, {'status': 'success' if returncode == 0 else 'error', 'returncode': returncode},
+            time.monotonic() - started, target
+        )
+    
+    def run_nmap_batch(
+        self,
+        targets: TargetSource,
+        params: Dict[str, Any] = None,
+        concurrency: Optional[int] = None,
+        use_cache: bool = True,
+        refresh: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Run Nmap scans over many targets and yield each result as it finishes
+        
+        Targets are normalized and de-duplicated. Tool availability is checked
+        once, hostnames are resolved in one batch and uncached hosts share a
+        single TCP pre-sweep before up to ``concurrency`` scans run at once.
+        CIDR ranges go through the sharded scanner.
+        
+        :param targets: Scope file path or iterable of IPs, domains and CIDR ranges
+        :param params: Additional Nmap parameters (part of the cache key)
+        :param concurrency: Maximum concurrent scans (default: batch.nmap_concurrency)
+        :param use_cache: Set to False to bypass the result cache entirely
+        :param refresh: Rescan and replace any cached results
+        :return: Iterator of scan results, each with a 'target' key
+        """
+        logger = logging.getLogger(__name__)
+        
+        concurrency = concurrency or int(self.config.get('batch', {}).get('nmap_concurrency', 4))
+        targets = list(unique_targets(read_targets(targets), self._normalize_scan_target))
+        if not targets:
+            return
+        
+        if not self.kali_tools.check_tool('nmap'):
+            logger.error('Nmap is not installed')
+            for target in targets:
+                yield {'target': target, 'error': 'Nmap is not installed. Please install it first.'}
+            return
+        
+        networks = [target for target in targets if parse_network(target) is not None]
+        hosts = [target for target in targets if parse_network(target) is None]
+        resolved = get_resolver_cache().resolve_many(hosts)
+        
+        cache = get_result_cache()
+        pending = list(networks)
+        for host in hosts:
+            if not resolved.get(host):
+                yield {'target': host, 'error': f'Invalid target: {host}'}
+                continue
+            cached = cache.get('nmap', host, params) if use_cache and not refresh else None
+            if cached is not None:
+                yield dict(cached, target=host, cache={'hit': True, 'tool': 'nmap'})
+            else:
+                pending.append(host)
+        
+        # One sweep for every uncached host instead of one per scan
+        sweeps: Dict[str, Any] = {}
+        sweep_hosts = [resolved[target] for target in pending if target in resolved]
+        if sweep_hosts and self.config.get('nmap', {}).get('pre_sweep', {}).get('enabled', True):
+            try:
+                sweeps = self.pre_sweep(sweep_hosts)['hosts']
+            except Exception as sweep_error:
+                logger.warning(f"Pre-sweep failed: {sweep_error}")
+        
+        def scan(target: str) -> Dict[str, Any]:
+            network = parse_network(target)
+            if network is not None:
+                compute = lambda: self._run_sharded_nmap_scan(network)
+            else:
+                target_ip = resolved[target]
+                compute = lambda: self._scan_resolved_target(target, target_ip, sweeps.get(target_ip))
+            # Hits were served above, so this only stores the new result
+            return cache.cached('nmap', target, params, compute, bypass=not use_cache, refresh=True)
+        
+        logger.info(f"Nmap batch: {len(pending)} scans, {len(targets) - len(pending)} served or rejected up front")
+        for target, result in run_bounded(scan, pending, concurrency):
+            if isinstance(result, Exception):
+                logger.error(f"Nmap scan of {target} failed: {result}")
+                yield {'target': target, 'error': str(result)}
+            else:
+                yield dict(result, target=target)
+    
+    def _normalize_scan_target(self, target: str) -> str:
+        """
+        Normalize a scan target, keeping CIDR ranges intact
+        
+        :param target: Raw IP, domain, URL or CIDR range
+        :return: Normalized target
+        """
+        network = parse_network(target)
+        if network is not None:
+            return str(network)
+        return self._normalize_domain(target)
+    
+    def _parse_nmap_xml_output(self, xml_output: str) -> Dict[str, Any]:
+        """
+        Parse Nmap XML output for more detailed scanning results
+        
+        Every host in the document is parsed in a single pass; see
+        src.utils.nmap_model for the resulting keys.
+        
+        :param xml_output: Raw XML output from Nmap
+        :return: Parsed scanning results
+        """
+        try:
+            return parse_nmap_xml(xml_output).to_dict()
+        except ET.ParseError:
             # Fallback to text parsing if XML parsing fails
             return self._parse_nmap_output(xml_output)
     
@@ -414,32 +811,36 @@ class InformationGathering:
         :param output: Raw Nmap scan output
         :return: Parsed Nmap results
         """
-        parsed_results = {
-            'open_ports': [],
-            'services': [],
-            'os_detection': None
-        }
-        
-        # Basic parsing - you can make this more sophisticated
-        port_pattern = re.compile(r'(\d+)/(\w+)\s+(\w+)\s+(.+)')
-        for line in output.split('\n'):
-            port_match = port_pattern.search(line)
-            if port_match:
-                parsed_results['open_ports'].append({
-                    'port': port_match.group(1),
-                    'protocol': port_match.group(2),
-                    'state': port_match.group(3),
-                    'service': port_match.group(4)
-                })
-        
-        return parsed_results
+        return NMAP_TEXT_PARSER.parse(output)
     
     @tool_loading_animation
-    def run_whois_lookup(self, domain: str) -> Dict[str, Any]:
+    def run_whois_lookup(self, domain: str, use_cache: bool = True, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Run WHOIS lookup, serving a fresh cached result for the same domain
+        
+        :param domain: Domain to perform WHOIS lookup on
+        :param use_cache: Set to False to bypass the result and WHOIS caches entirely
+        :param refresh: Look up again and replace any cached result
+        :return: Lookup results dictionary
+        """
+        return get_result_cache().cached(
+            'whois', domain, None,
+            lambda: self._run_whois_lookup(domain, use_cache=use_cache, refresh=refresh),
+            bypass=not use_cache,
+            refresh=refresh
+        )
+    
+    def _run_whois_lookup(self, domain: str, use_cache: bool = True, refresh: bool = False) -> Dict[str, Any]:
         """
         Run comprehensive WHOIS lookup with multiple strategies
         
+        A fresh entry in the persistent WHOIS cache is returned without any
+        network traffic. An expired entry is only returned (with stale=True)
+        when every live strategy fails.
+        
         :param domain: Domain to perform WHOIS lookup on
+        :param use_cache: Read and update the persistent WHOIS cache
+        :param refresh: Skip fresh cache entries (the cache is still updated)
         :return: Lookup results dictionary
         """
         import logging
@@ -452,17 +853,79 @@ class InformationGathering:
             logger.error(f"Domain normalization error: {norm_error}")
             return {'error': f'Invalid domain format: {domain}'}
         
+        cache_config = self.config.get('whois', {}).get('cache', {})
+        whois_cache = get_whois_cache() if use_cache and cache_config.get('enabled', True) else None
+        cached = whois_cache.get(domain) if whois_cache else None
+        if cached and not cached['stale'] and not refresh:
+            logger.info(f"WHOIS result for {domain} served from cache")
+            return self._whois_cache_result(domain, cached)
+        
         # Validate domain
         if not self._validate_target(domain):
             logger.error(f"Invalid domain: {domain}")
             return {'error': f'Invalid domain: {domain}'}
         
-        # Check tool availability
-        if not self.kali_tools.check_tool('whois'):
-            logger.error('Whois tool is not installed')
-            return {'error': 'Whois is not installed. Please install it first.'}
+        # Native port-43 client: registry (from the cached IANA referral), then registrar
+        if self.config.get('whois', {}).get('native', True):
+            result = self._whois_native_result(domain, whois_lookup(domain), whois_cache)
+            if result is not None:
+                return result
+        
+        return self._whois_fallback(domain, cached, whois_cache)
+    
+    def _whois_native_result(
+        self,
+        domain: str,
+        native: Dict[str, Any],
+        whois_cache: Optional[WhoisCache] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Turn a native WhoisClient answer into a lookup result
+        
+        :param domain: Normalized domain
+        :param native: Result of WhoisClient.lookup
+        :param whois_cache: Persistent WHOIS cache to store the answer in, if any
+        :return: Lookup results dictionary, or None if the answer is not useful
+        """
+        logger = logging.getLogger(__name__)
+        
+        if native['status'] == 'success':
+            parsed_output = self._parse_whois_output(native['raw'])
+            if parsed_output and any(parsed_output.values()):
+                logger.info(f"Successful WHOIS lookup via {' -> '.join(native['servers'])}")
+                if whois_cache:
+                    whois_cache.put(domain, native['raw'], parsed_output, native['servers'], 'native')
+                return {
+                    'status': 'success',
+                    'method': 'native',
+                    'command': f"whois {domain} ({' -> '.join(native['servers'])})",
+                    'stdout': native['raw'],
+                    'servers': native['servers'],
+                    'parsed_output': parsed_output,
+                    'stale': False
+                }
+        logger.warning(f"Native WHOIS lookup incomplete for {domain}: {native.get('error', native['status'])}")
+        return None
+    
+    def _whois_fallback(
+        self,
+        domain: str,
+        cached: Optional[Dict[str, Any]] = None,
+        whois_cache: Optional[WhoisCache] = None,
+        whois_installed: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        WHOIS lookup without the native client: whois binary, stale cache, DNS
         
-        # Prepare multiple WHOIS lookup strategies
+        :param domain: Normalized, validated domain
+        :param cached: Expired persistent cache entry served if the binary fails
+        :param whois_cache: Persistent WHOIS cache to store the answer in, if any
+        :param whois_installed: Known availability of the whois binary (checked if None)
+        :return: Lookup results dictionary
+        """
+        logger = logging.getLogger(__name__)
+        
+        # Prepare multiple WHOIS lookup strategies (whois binary fallback)
         whois_strategies = [
             # Standard WHOIS lookup
             ['whois', domain],
@@ -476,18 +939,17 @@ class InformationGathering:
             ['whois', '-h', 'whois.networksolutions.com', domain]
         ]
         
-        # Fallback DNS lookup strategies
-        dns_strategies = [
-            ['dig', '+short', 'NS', domain],
-            ['host', '-t', 'NS', domain],
-            ['nslookup', '-type=NS', domain]
-        ]
+        if whois_installed is None:
+            whois_installed = self.kali_tools.check_tool('whois')
+        if not whois_installed:
+            logger.warning('Whois tool is not installed, skipping whois binary strategies')
+            whois_strategies = []
         
         # Try WHOIS lookup strategies
         for cmd in whois_strategies:
             try:
                 logger.info(f"Attempting WHOIS lookup: {' '.join(cmd)}")
-                result = self._run_command(cmd)
+                result = self._run_command(cmd, target=domain)
                 
                 # Parse and validate WHOIS output
                 if result['status'] == 'success' and result['stdout']:
@@ -496,26 +958,37 @@ class InformationGathering:
                     # Return if meaningful results found
                     if parsed_output and any(parsed_output.values()):
                         result['parsed_output'] = parsed_output
+                        result['stale'] = False
                         logger.info(f"Successful WHOIS lookup with: {' '.join(cmd)}")
+                        if whois_cache:
+                            whois_cache.put(domain, result['stdout'], parsed_output, [], ' '.join(cmd))
                         return result
             except Exception as lookup_error:
                 logger.warning(f"WHOIS strategy failed: {lookup_error}")
         
-        # If WHOIS fails, attempt DNS lookup strategies
-        for cmd in dns_strategies:
-            try:
-                logger.info(f"Attempting DNS lookup: {' '.join(cmd)}")
-                result = self._run_command(cmd)
-                
-                if result['status'] == 'success' and result['stdout']:
-                    logger.info(f"Successful DNS lookup with: {' '.join(cmd)}")
-                    return {
-                        'status': 'partial',
-                        'method': 'dns',
-                        'output': result['stdout'].strip()
-                    }
-            except Exception as dns_error:
-                logger.warning(f"DNS lookup strategy failed: {dns_error}")
+        # An expired registration record beats the NS-only fallback
+        if cached:
+            logger.warning(f"Live WHOIS lookup failed for {domain}, serving stale cached result")
+            return self._whois_cache_result(domain, cached)
+        
+        # If WHOIS fails, fall back to the domain's NS records
+        async def lookup_name_servers():
+            async with AsyncResolver.from_config(self.config.get('dns', {})) as resolver:
+                return await resolver.query(domain, 'NS')
+        
+        try:
+            logger.info(f"Attempting DNS NS lookup for {domain}")
+            ns_result = async_runner.run_async(lookup_name_servers())
+            if ns_result['records']:
+                logger.info(f"Successful DNS NS lookup for {domain}")
+                return {
+                    'status': 'partial',
+                    'method': 'dns',
+                    'output': '\n'.join(ns_result['records']),
+                    'name_servers': ns_result['records']
+                }
+        except Exception as dns_error:
+            logger.warning(f"DNS lookup failed: {dns_error}")
         
         # Comprehensive error reporting if all strategies fail
         logger.error(f"All WHOIS and DNS lookup strategies failed for domain: {domain}")
@@ -534,49 +1007,152 @@ class InformationGathering:
             }
         }
     
-    def _parse_whois_output(self, output: str) -> Dict[str, Any]:
+    def _whois_cache_result(self, domain: str, entry: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Enhanced WHOIS output parsing with multiple extraction strategies
+        Build a lookup result from a persistent WHOIS cache entry
         
-        :param output: Raw WHOIS output
-        :return: Parsed domain information
+        :param domain: Normalized domain
+        :param entry: Entry returned by WhoisCache.get
+        :return: Lookup results dictionary
         """
-        import re
-        
-        parsed_results = {
-            'domain_name': None,
-            'registrar': None,
-            'creation_date': None,
-            'expiration_date': None,
-            'name_servers': [],
-            'registrant': {}
+        return {
+            'status': 'success',
+            'method': 'cache',
+            'command': f"whois {domain} (cached via {entry['method']})",
+            'stdout': entry['raw'],
+            'servers': entry['servers'],
+            'parsed_output': entry['parsed'],
+            'stale': entry['stale'],
+            'cached_at': datetime.fromtimestamp(entry['fetched_at']).isoformat(),
+            'cache_age': round(time.time() - entry['fetched_at'])
         }
+    
+    def run_whois_batch(
+        self,
+        domains: TargetSource,
+        fallback_workers: Optional[int] = None,
+        use_cache: bool = True,
+        refresh: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Run WHOIS lookups over many domains and yield each result as it finishes
+        
+        Domains are normalized and de-duplicated. Fresh entries of the
+        persistent WHOIS cache are yielded first, the rest are validated in one
+        resolver batch and looked up together by the native client (bounded by
+        information_gathering.whois.concurrency and the per-server rates).
+        Domains the native client cannot answer go to the whois binary / DNS
+        fallback on a small thread pool.
+        
+        :param domains: Scope file path or iterable of domains
+        :param fallback_workers: Concurrent fallback lookups (default: batch.whois_fallback_workers)
+        :param use_cache: Read and update the persistent WHOIS cache
+        :param refresh: Skip fresh cache entries (the cache is still updated)
+        :return: Iterator of lookup results, each with a 'target' key
+        """
+        logger = logging.getLogger(__name__)
         
-        # Regex patterns for extraction
-        patterns = {
-            'domain_name': r'Domain Name:\s*(.+)',
-            'registrar': r'Registrar:\s*(.+)',
-            'creation_date': r'Creation Date:\s*(.+)',
-            'expiration_date': r'Expiration Date:\s*(.+)',
-            'name_servers': r'Name Server:\s*(.+)',
-            'registrant_name': r'Registrant Name:\s*(.+)',
-            'registrant_org': r'Registrant Organization:\s*(.+)'
-        }
+        whois_config = self.config.get('whois', {})
+        fallback_workers = fallback_workers or int(self.config.get('batch', {}).get('whois_fallback_workers', 8))
+        domains = list(unique_targets(read_targets(domains), self._normalize_domain))
+        
+        whois_cache = get_whois_cache() if use_cache and whois_config.get('cache', {}).get('enabled', True) else None
+        stale_entries: Dict[str, Dict[str, Any]] = {}
+        pending = []
+        for domain in domains:
+            entry = whois_cache.get(domain) if whois_cache else None
+            if entry and not entry['stale'] and not refresh:
+                yield dict(self._whois_cache_result(domain, entry), target=domain)
+                continue
+            if entry:
+                stale_entries[domain] = entry
+            pending.append(domain)
+        
+        validity = self.validate_targets(pending)
+        valid = []
+        for domain in pending:
+            if validity[domain]:
+                valid.append(domain)
+            else:
+                yield {'target': domain, 'error': f'Invalid domain: {domain}'}
+        if not valid:
+            return
+        
+        whois_installed = self.kali_tools.check_tool('whois')
+        
+        def fallback(domain: str) -> Dict[str, Any]:
+            return self._whois_fallback(domain, stale_entries.get(domain), whois_cache, whois_installed)
+        
+        if not whois_config.get('native', True):
+            for domain, result in run_bounded(fallback, valid, fallback_workers):
+                if isinstance(result, Exception):
+                    result = {'error': str(result)}
+                yield dict(result, target=domain)
+            return
+        
+        # Native answers and finished fallbacks arrive on one queue in completion order
+        events: 'queue.Queue' = queue.Queue()
+        parent = current_context()
+        # Own context, so closing the generator early stops the remaining lookups
+        lookups = TaskContext(parent.task_id if parent else None)
+        
+        def native_lookups():
+            with task_context(lookups):
+                try:
+                    whois_lookup_many(valid, on_result=lambda native: events.put(('native', native)))
+                except BaseException as e:
+                    events.put(('error', e))
+        
+        def run_fallback(domain: str) -> Dict[str, Any]:
+            with task_context(parent):
+                return fallback(domain)
         
-        # Extract information using regex
-        for key, pattern in patterns.items():
-            match = re.search(pattern, output, re.IGNORECASE)
-            if match:
-                if key == 'name_servers':
-                    parsed_results['name_servers'].extend(match.group(1).split())
-                elif key == 'registrant_name':
-                    parsed_results['registrant']['name'] = match.group(1)
-                elif key == 'registrant_org':
-                    parsed_results['registrant']['organization'] = match.group(1)
+        threading.Thread(target=native_lookups, name='whois-batch', daemon=True).start()
+        pool = ThreadPoolExecutor(max_workers=max(1, fallback_workers), thread_name_prefix='whois-fallback')
+        remaining = len(valid)
+        try:
+            while remaining:
+                try:
+                    kind, *payload = events.get(timeout=0.2)
+                except queue.Empty:
+                    if parent is not None:
+                        parent.raise_if_cancelled()
+                    continue
+                if kind == 'error':
+                    raise payload[0]
+                if kind == 'native':
+                    native = payload[0]
+                    result = self._whois_native_result(native['target'], native, whois_cache)
+                    if result is None:
+                        future = pool.submit(run_fallback, native['target'])
+                        future.add_done_callback(
+                            lambda done, domain=native['target']: events.put(('fallback', domain, done))
+                        )
+                        continue
+                    domain = native['target']
                 else:
-                    parsed_results[key] = match.group(1)
+                    domain, done = payload
+                    try:
+                        result = done.result()
+                    except TaskCancelled:
+                        raise
+                    except Exception as e:
+                        logger.error(f"WHOIS fallback for {domain} failed: {e}")
+                        result = {'error': str(e)}
+                remaining -= 1
+                yield dict(result, target=domain)
+        finally:
+            lookups.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _parse_whois_output(self, output: str) -> Dict[str, Any]:
+        """
+        Parse WHOIS output in a single pass (see WHOIS_PARSER)
         
-        return parsed_results
+        :param output: Raw WHOIS output
+        :return: Parsed domain information
+        """
+        return WHOIS_PARSER.parse(output)
     
     def _normalize_domain(self, domain: str) -> str:
         """
@@ -594,7 +1170,8 @@ class InformationGathering:
         # Remove any trailing slashes or paths
         domain = domain.split('/')[0]
         
-        return domain.strip()
+        # Remove the root label of fully qualified names
+        return domain.strip().rstrip('.')
     
     def _parse_dns_enum_output(self, output: str) -> Dict[str, Any]:
         """
@@ -640,7 +1217,7 @@ class InformationGathering:
         cmd = ['nikto', '-h', target, '-Format', 'json']
         
         # Execute Nikto scan
-        result = self._run_command(cmd)
+        result = self._run_command(cmd, target=target)
         
         # Parse and enhance Nikto output
         if result['status'] == 'success':
@@ -656,19 +1233,7 @@ class InformationGathering:
         :param output: Raw Nikto scan output
         :return: Parsed Nikto results
         """
-        parsed_results = {
-            'vulnerabilities': []
-        }
-        
-        # Basic parsing - you can make this more sophisticated
-        vulnerability_pattern = re.compile(r'OSVDB-\d+: (.+)')
-        
-        for line in output.split('\n'):
-            vulnerability_match = vulnerability_pattern.search(line)
-            if vulnerability_match:
-                parsed_results['vulnerabilities'].append(vulnerability_match.group(1))
-        
-        return parsed_results
+        return NIKTO_PARSER.parse(output)
     
     @tool_loading_animation
     def run_dirb_scan(self, target: str) -> Dict[str, Any]:
@@ -690,7 +1255,7 @@ class InformationGathering:
         cmd = ['dirb', target]
         
         # Execute Dirb scan
-        result = self._run_command(cmd)
+        result = self._run_command(cmd, target=target)
         
         # Parse and enhance Dirb output
         if result['status'] == 'success':
@@ -706,19 +1271,7 @@ class InformationGathering:
         :param output: Raw Dirb scan output
         :return: Parsed Dirb results
         """
-        parsed_results = {
-            'directories': []
-        }
-        
-        # Basic parsing - you can make this more sophisticated
-        directory_pattern = re.compile(r'==> DIRECTORY: (.+)')
-        
-        for line in output.split('\n'):
-            directory_match = directory_pattern.search(line)
-            if directory_match:
-                parsed_results['directories'].append(directory_match.group(1))
-        
-        return parsed_results
+        return DIRB_PARSER.parse(output)
     
     @tool_loading_animation
     def run_web_analysis(self, tool: str, target: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -745,7 +1298,7 @@ class InformationGathering:
                 cmd.extend([f'--{k}', str(v)])
         
         # Execute web analysis
-        result = self._run_command(cmd)
+        result = self._run_command(cmd, target=target)
         
         # Parse and enhance web analysis output
         if result['status'] == 'success':
@@ -756,40 +1309,14 @@ class InformationGathering:
     
     def _parse_web_analysis_output(self, output: str, tool: str) -> Dict[str, Any]:
         """
-        Parse web analysis output into a more structured format
+        Parse web analysis output with the parser registered for the tool
         
         :param output: Raw web analysis output
         :param tool: Name of the web analysis tool used
-        :return: Parsed web analysis results
+        :return: Parsed web analysis results (empty for tools without a parser)
         """
-        parsed_results = {}
-        
-        # Basic parsing - you can make this more sophisticated
-        if tool == 'burpsuite':
-            # Burp Suite parsing
-            parsed_results['issues'] = []
-            issue_pattern = re.compile(r'([a-zA-Z]+): (.+)')
-            for line in output.split('\n'):
-                issue_match = issue_pattern.search(line)
-                if issue_match:
-                    parsed_results['issues'].append({
-                        'severity': issue_match.group(1),
-                        'description': issue_match.group(2)
-                    })
-        elif tool == 'wpscan':
-            # WPScan parsing
-            parsed_results['vulnerabilities'] = []
-            vulnerability_pattern = re.compile(r'([a-zA-Z]+): (.+)')
-            for line in output.split('\n'):
-                vulnerability_match = vulnerability_pattern.search(line)
-                if vulnerability_match:
-                    parsed_results['vulnerabilities'].append({
-                        'severity': vulnerability_match.group(1),
-                        'description': vulnerability_match.group(2)
-                    })
-        # Add more tool-specific parsing here
-        
-        return parsed_results
+        parser = get_parser(tool)
+        return parser.parse(output) if parser else {}
     
     def system_diagnostics(self) -> Dict[str, Any]:
         """
@@ -797,7 +1324,6 @@ class InformationGathering:
         
         :return: Detailed system diagnostic report
         """
-        import subprocess
         import platform
         import shutil
         
@@ -816,7 +1342,7 @@ class InformationGathering:
         
         # Check network interfaces
         try:
-            interfaces_output = subprocess.run(['ip', 'addr'], capture_output=True, text=True, timeout=10)
+            interfaces_output = run_tool_process(['ip', 'addr'], default=10)
             diagnostics['network_interfaces'] = interfaces_output.stdout.strip().split('\n')
         except Exception as e:
             diagnostics['potential_issues'].append(f"Network interface detection failed: {e}")
@@ -836,11 +1362,11 @@ class InformationGathering:
         
         # Check permissions
         try:
-            current_user = subprocess.run(['whoami'], capture_output=True, text=True).stdout.strip()
+            current_user = run_tool_process(['whoami'], default=10).stdout.strip()
             diagnostics['permissions']['current_user'] = current_user
             
             # Check sudo capabilities
-            sudo_check = subprocess.run(['sudo', '-n', 'true'], capture_output=True)
+            sudo_check = run_tool_process(['sudo', '-n', 'true'], default=10)
             diagnostics['permissions']['sudo_access'] = sudo_check.returncode == 0
         except Exception as e:
             diagnostics['potential_issues'].append(f"Permission check failed: {e}")
@@ -848,7 +1374,7 @@ class InformationGathering:
         # Network connectivity checks
         try:
             # Check internet connectivity
-            internet_check = subprocess.run(['ping', '-c', '4', '8.8.8.8'], capture_output=True)
+            internet_check = run_tool_process(['ping', '-c', '4', '8.8.8.8'], default=10)
             diagnostics['network_connectivity'] = {
                 'internet_access': internet_check.returncode == 0
             }
@@ -857,7 +1383,7 @@ class InformationGathering:
         
         # Firewall status
         try:
-            ufw_status = subprocess.run(['sudo', 'ufw', 'status'], capture_output=True, text=True)
+            ufw_status = run_tool_process(['sudo', 'ufw', 'status'], default=10)
             diagnostics['firewall'] = {
                 'ufw_status': ufw_status.stdout.strip()
             }
@@ -896,20 +1422,22 @@ class InformationGathering:
             logger.error(f"Failed to generate system diagnostics: {e}")
             return {}
 
-    def network_diagnostics(self, target: str = None) -> Dict[str, Any]:
+    def network_diagnostics(self, target: str = None, max_age: Optional[float] = None) -> Dict[str, Any]:
         """
         Perform comprehensive network diagnostics
         
+        The host-wide checks come from the shared NetworkMonitor snapshot and
+        are only re-run once it is older than max_age. Target diagnostics
+        (traceroute) always run.
+        
         :param target: Optional target for specific network checks
+        :param max_age: Oldest acceptable snapshot in seconds (default: configured TTL)
         :return: Detailed network diagnostic report
         """
         import logging
-        import subprocess
-        import socket
-        import json
         
         logger = logging.getLogger(__name__)
-        diagnostics = {
+        diagnostics = get_network_monitor().snapshot(max_age=max_age) or {
             'network_interfaces': [],
             'dns_resolution': {},
             'connectivity': {},
@@ -917,79 +1445,17 @@ class InformationGathering:
             'firewall': {}
         }
         
-        # Network Interfaces
-        try:
-            interfaces = subprocess.run(['ip', 'addr'], capture_output=True, text=True, timeout=10)
-            diagnostics['network_interfaces'] = interfaces.stdout.strip().split('\n')
-        except Exception as e:
-            logger.error(f"Network interface detection failed: {e}")
-        
-        # DNS Resolution
-        try:
-            # Try resolving a few well-known domains
-            test_domains = ['google.com', 'github.com', 'microsoft.com']
-            for domain in test_domains:
-                try:
-                    ip = socket.gethostbyname(domain)
-                    diagnostics['dns_resolution'][domain] = {
-                        'resolved_ip': ip,
-                        'status': 'success'
-                    }
-                except socket.gaierror as dns_err:
-                    diagnostics['dns_resolution'][domain] = {
-                        'status': 'failed',
-                        'error': str(dns_err)
-                    }
-        except Exception as e:
-            logger.error(f"DNS resolution check failed: {e}")
-        
-        # Connectivity Checks
-        connectivity_targets = [
-            ('8.8.8.8', 'Google DNS'),
-            ('1.1.1.1', 'Cloudflare DNS')
-        ]
-        
-        for ip, name in connectivity_targets:
-            try:
-                ping = subprocess.run(['ping', '-c', '4', ip], capture_output=True, text=True, timeout=10)
-                diagnostics['connectivity'][name] = {
-                    'ip': ip,
-                    'status': 'reachable' if ping.returncode == 0 else 'unreachable',
-                    'output': ping.stdout.strip()
-                }
-            except Exception as e:
-                diagnostics['connectivity'][name] = {
-                    'status': 'error',
-                    'error': str(e)
-                }
-        
-        # Routing Information
-        try:
-            route = subprocess.run(['ip', 'route'], capture_output=True, text=True, timeout=10)
-            diagnostics['routing']['default_routes'] = route.stdout.strip().split('\n')
-        except Exception as e:
-            logger.error(f"Routing information detection failed: {e}")
-        
-        # Firewall Status
-        try:
-            ufw_status = subprocess.run(['sudo', 'ufw', 'status'], capture_output=True, text=True)
-            diagnostics['firewall']['ufw'] = ufw_status.stdout.strip()
-        except Exception as e:
-            logger.error(f"Firewall status check failed: {e}")
-        
         # Specific Target Diagnostics (if provided)
         if target:
             try:
                 # Traceroute to target
-                traceroute = subprocess.run(['traceroute', target], capture_output=True, text=True, timeout=30)
+                traceroute = run_tool_process(['traceroute', target], target=target, default=30)
                 diagnostics['target_diagnostics'] = {
                     'traceroute': traceroute.stdout.strip().split('\n')
                 }
             except Exception as e:
                 logger.error(f"Target-specific diagnostics failed: {e}")
         
-        # Log and return diagnostics
-        logger.info("Network Diagnostics Completed")
         return diagnostics
     
     def log_network_diagnostics(self, target: str = None) -> None:
@@ -1047,6 +1513,10 @@ class InformationGathering:
         """
         Perform a comprehensive multi-tool scan on a given target
         
+        Independent scans run concurrently; Nikto and Dirb start as soon as
+        Nmap finishes and only against the HTTP services it found. Per-stage
+        timings are recorded under 'timings'.
+        
         :param target: Target IP, domain, or URL to scan
         :param scan_options: Dictionary to control which scans to run
         :return: Comprehensive scan results dictionary
@@ -1075,109 +1545,117 @@ class InformationGathering:
             'scans': {}
         }
         
-        # Run Nmap scan
-        if scan_options.get('nmap', False):
-            try:
-                nmap_result = self.run_nmap_scan(target)
-                scan_results['scans']['nmap'] = nmap_result
-            except Exception as e:
-                scan_results['scans']['nmap'] = {
-                    'error': str(e),
-                    'message': 'Nmap scan failed'
-                }
+        # Build the stage graph: independent tools run concurrently, web
+        # scanners wait for nmap and only run if it found an HTTP service
+        scheduler = DagScheduler()
+        web_depends = ('nmap',) if scan_options.get('nmap', False) else ()
         
-        # Run WHOIS lookup
-        if scan_options.get('whois', False):
-            try:
-                whois_result = self.run_whois_lookup(target)
-                scan_results['scans']['whois'] = whois_result
-            except Exception as e:
-                scan_results['scans']['whois'] = {
-                    'error': str(e),
-                    'message': 'WHOIS lookup failed'
-                }
+        def web_targets(inputs: Dict[str, Any]) -> List[str]:
+            if 'nmap' not in inputs:
+                return [target]
+            return self._http_targets(target, inputs['nmap'])
         
-        # Run Nikto web server scan
-        if scan_options.get('nikto', False):
-            try:
-                nikto_result = self.run_nikto_scan(target)
-                scan_results['scans']['nikto'] = nikto_result
-            except Exception as e:
-                scan_results['scans']['nikto'] = {
-                    'error': str(e),
-                    'message': 'Nikto scan failed'
-                }
+        def run_web_stage(scan: Callable[[str], Dict[str, Any]]):
+            def stage(inputs: Dict[str, Any]) -> Dict[str, Any]:
+                urls = web_targets(inputs)
+                if len(urls) == 1:
+                    return scan(urls[0])
+                return {'targets': {url: scan(url) for url in urls}}
+            return stage
         
-        # Run Dirb directory scan
+        if scan_options.get('nmap', False):
+            scheduler.add_stage('nmap', lambda inputs: self.run_nmap_scan(target))
+        if scan_options.get('whois', False):
+            scheduler.add_stage('whois', lambda inputs: self.run_whois_lookup(target))
+        if scan_options.get('dns_enum', False):
+            scheduler.add_stage('dns_enum', lambda inputs: self._run_dns_enumeration(target))
+        if scan_options.get('nikto', False):
+            scheduler.add_stage(
+                'nikto', run_web_stage(self.run_nikto_scan),
+                depends_on=web_depends, condition=lambda inputs: bool(web_targets(inputs))
+            )
         if scan_options.get('dirb', False):
-            try:
-                dirb_result = self.run_dirb_scan(target)
-                scan_results['scans']['dirb'] = dirb_result
-            except Exception as e:
-                scan_results['scans']['dirb'] = {
-                    'error': str(e),
-                    'message': 'Dirb scan failed'
-                }
+            scheduler.add_stage(
+                'dirb', run_web_stage(self.run_dirb_scan),
+                depends_on=web_depends, condition=lambda inputs: bool(web_targets(inputs))
+            )
         
-        # Run DNS enumeration
-        if scan_options.get('dns_enum', False):
-            try:
-                # Assuming you have a DNS enumeration method
-                dns_result = self._run_dns_enumeration(target)
-                scan_results['scans']['dns_enum'] = dns_result
-            except Exception as e:
-                scan_results['scans']['dns_enum'] = {
-                    'error': str(e),
-                    'message': 'DNS enumeration failed'
-                }
+        run = scheduler.run()
+        scan_results['scans'] = run['results']
+        scan_results['timings'] = run['timings']
+        scan_results['wall_time'] = run['wall_time']
         
         # Summarize findings
         scan_results['summary'] = self._summarize_scan_results(scan_results)
         
         return scan_results
     
-    def _run_dns_enumeration(self, target: str) -> Dict[str, Any]:
+    def _http_targets(self, target: str, nmap_result: Dict[str, Any]) -> List[str]:
+        """
+        Derive web scanner targets from Nmap results
+        
+        :param target: Original scan target
+        :param nmap_result: Result of run_nmap_scan
+        :return: URLs of open HTTP(S) services, empty if none were found
+        """
+        urls = []
+        host = self._normalize_domain(target)
+        for port in nmap_result.get('parsed_output', {}).get('open_ports', []):
+            service = str(port.get('service', '')).lower()
+            if 'http' not in service or port.get('state', 'open') != 'open':
+                continue
+            number = port.get('number') or port.get('port')
+            scheme = 'https' if 'https' in service or 'ssl' in service or number == '443' else 'http'
+            url = f"{scheme}://{port.get('host') or host}:{number}"
+            if url not in urls:
+                urls.append(url)
+        return urls
+    
+    def _run_dns_enumeration(self, target: str, wordlist: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
-        Perform DNS enumeration using multiple tools
+        Perform DNS enumeration with the in-process async resolver
+        
+        All configured record types are queried concurrently. Candidate
+        subdomains from the wordlist (or the configured subdomain_wordlist
+        file) are resolved in the same batch.
         
         :param target: Domain to enumerate
+        :param wordlist: Candidate subdomain labels
         :return: DNS enumeration results
         """
-        dns_results = {}
-        
-        # DNS tools to use
-        dns_tools = [
-            ('dig', ['dig', '+short', target]),
-            ('host', ['host', '-a', target]),
-            ('nslookup', ['nslookup', target])
-        ]
+        logger = logging.getLogger(__name__)
+        dns_config = self.config.get('dns', {})
+        record_types = dns_config.get('record_types') or list(DEFAULT_RECORD_TYPES)
         
-        for tool_name, cmd in dns_tools:
+        if wordlist is None and dns_config.get('subdomain_wordlist'):
+            wordlist_path = os.path.expanduser(dns_config['subdomain_wordlist'])
             try:
-                result = subprocess.run(
-                    cmd, 
-                    capture_output=True, 
-                    text=True, 
-                    timeout=30
-                )
-                
-                if result.returncode == 0:
-                    dns_results[tool_name] = {
-                        'output': result.stdout.strip(),
-                        'command': ' '.join(cmd)
-                    }
-                else:
-                    dns_results[tool_name] = {
-                        'error': result.stderr.strip(),
-                        'command': ' '.join(cmd)
-                    }
-            except Exception as e:
-                dns_results[tool_name] = {
-                    'error': str(e),
-                    'command': ' '.join(cmd)
-                }
+                with open(wordlist_path, 'r', errors='replace') as f:
+                    wordlist = [line.strip() for line in f if line.strip()]
+            except OSError as e:
+                logger.warning(f"Cannot read subdomain wordlist {wordlist_path}: {e}")
+        
+        async def enumerate_dns():
+            async with AsyncResolver.from_config(dns_config) as resolver:
+                lookups = resolver.lookup(target, record_types)
+                if wordlist:
+                    return await asyncio.gather(lookups, resolver.resolve_subdomains(target, wordlist)), resolver.nameservers
+                return (await lookups, []), resolver.nameservers
+        
+        try:
+            (lookups, subdomains), nameservers = async_runner.run_async(enumerate_dns())
+        except Exception as e:
+            logger.error(f"DNS enumeration failed for {target}: {e}")
+            return {'error': str(e), 'message': 'DNS enumeration failed'}
         
-        return dns_results
+        records = {qtype: result['records'] for qtype, result in lookups.items() if result['records']}
+        return {
+            'status': 'success' if records or subdomains else 'not_found',
+            'records': records,
+            'responses': {qtype: result['status'] for qtype, result in lookups.items()},
+            'subdomains': subdomains,
+            'nameservers': nameservers
+        }
     
     def _summarize_scan_results(self, scan_results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1188,17 +1666,20 @@ class InformationGathering:
         """
         summary = {
             'open_ports': [],
+            'services': [],
             'vulnerabilities': [],
             'dns_info': {},
             'whois_details': {}
         }
         
         # Extract open ports from Nmap
-        if 'nmap' in scan_results['scans'] and 'ports' in scan_results['scans']['nmap']:
+        if 'nmap' in scan_results['scans']:
+            parsed_output = scan_results['scans']['nmap'].get('parsed_output') or {}
             summary['open_ports'] = [
-                port for port in scan_results['scans']['nmap']['ports'] 
-                if port.get('state') == 'open'
+                port for port in parsed_output.get('open_ports', [])
+                if port.get('state', 'open') == 'open'
             ]
+            summary['services'] = parsed_output.get('services', [])
         
         # Extract vulnerabilities from Nikto
         if 'nikto' in scan_results['scans']:
@@ -1206,9 +1687,10 @@ class InformationGathering:
         
         # Extract DNS information
         if 'dns_enum' in scan_results['scans']:
+            dns_results = scan_results['scans']['dns_enum']
             summary['dns_info'] = {
-                tool: result.get('output', '') 
-                for tool, result in scan_results['scans']['dns_enum'].items()
+                'records': dns_results.get('records', {}),
+                'subdomains': dns_results.get('subdomains', [])
             }
         
         # Extract WHOIS details
@@ -10,6 +10,7 @@ from rich.panel import Panel
 from rich.text import Text
 from rich.console import Console
 from src.utils.tool_decorators import tool_loading_animation
+from src.utils.timeout_policy import run_tool_process
 
 class NetworkAttacks:
     """Network attack tools"""
@@ -59,11 +60,7 @@ class NetworkAttacks:
             # Additional Utilities
             'netstat', 'ss', 'ip', 'route', 'traceroute'
         ]
-        missing_tools = []
-        
-        for tool in required_tools:
-            if not self.kali_tools.check_tool(tool):
-                missing_tools.append(tool)
+        missing_tools = self.kali_tools.availability.missing(required_tools)
                 
         if missing_tools:
             print(f"[yellow]Missing required tools for network attacks: {', '.join(missing_tools)}[/yellow]")
@@ -99,7 +96,7 @@ class NetworkAttacks:
         if not interface:
             try:
                 # Use default route interface
-                route_output = subprocess.check_output(['ip', 'route'], text=True)
+                route_output = run_tool_process(['ip', 'route'], default=10).stdout
                 interface = route_output.split()[4]
             except Exception:
                 return {'error': 'Could not determine network interface'}
@@ -177,7 +174,7 @@ class NetworkAttacks:
                     cmd.extend([f'--{k}', str(v)])
             
             # Run the wireless attack tool
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            result = run_tool_process(cmd, target=target, default=300)
             
             return {
                 'status': 'Wireless attack completed',
@@ -3,10 +3,11 @@ Password Attacks module for HackFusion
 Handles password cracking and analysis tools
 """
 
-import subprocess
 from typing import Dict, List, Optional
 import logging
 import os
+from src.utils.tool_availability import get_tool_availability
+from src.utils.timeout_policy import run_tool_process
 
 logger = logging.getLogger('HackFusion')
 
@@ -37,15 +38,7 @@ class PasswordAttacks:
 
     def _check_required_tools(self):
         """Check required password attack tools"""
-        missing_tools = []
-        
-        for tool in self.required_tools:
-            try:
-                result = subprocess.run(['which', tool], capture_output=True, text=True)
-                if result.returncode != 0:
-                    missing_tools.append(tool)
-            except Exception:
-                missing_tools.append(tool)
+        missing_tools = get_tool_availability().missing(self.required_tools)
         
         if missing_tools:
             print(f"[yellow]Missing password attack tools: {', '.join(missing_tools)}[/yellow]")
@@ -90,7 +83,7 @@ class PasswordAttacks:
                 cmd.extend(['-r', rules])
 
             logger.info(f"Running Hashcat: {' '.join(cmd)}")
-            process = subprocess.run(cmd, capture_output=True, text=True)
+            process = run_tool_process(cmd, target=hash_file)
             
             # Read cracked passwords if successful
             cracked = []
@@ -137,14 +130,14 @@ class PasswordAttacks:
             cmd.append(hash_file)
 
             logger.info(f"Running John the Ripper: {' '.join(cmd)}")
-            process = subprocess.run(cmd, capture_output=True, text=True)
+            process = run_tool_process(cmd, target=hash_file)
 
             # Show cracked passwords
             show_cmd = ['john', '--show', hash_file]
             if format:
                 show_cmd.extend(['--format', format])
             
-            show_process = subprocess.run(show_cmd, capture_output=True, text=True)
+            show_process = run_tool_process(show_cmd, target=hash_file)
 
             return {
                 'success': process.returncode == 0,
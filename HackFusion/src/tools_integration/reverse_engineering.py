@@ -4,9 +4,12 @@ Handles integration with reverse engineering tools
 """
 
 import os
+import shutil
 import subprocess
 from typing import Dict, List, Optional, Any
 import glob
+from src.utils.tool_availability import get_tool_availability
+from src.utils.timeout_policy import run_tool_process
 
 class ReverseEngineering:
     """Class for handling reverse engineering tools"""
@@ -96,14 +99,7 @@ class ReverseEngineering:
                 pass
 
         # Check system PATH
-        try:
-            result = subprocess.run(['which', 'ghidra'], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
-
-        return ''
+        return shutil.which('ghidra') or ''
 
     def _verify_ghidra_installation(self) -> bool:
         """Verify Ghidra installation
@@ -118,7 +114,7 @@ class ReverseEngineering:
         try:
             # Run Ghidra with a simple version check
             version_cmd = [self.ghidra_path, '-version']
-            result = subprocess.run(version_cmd, capture_output=True, text=True, timeout=10)
+            result = run_tool_process(version_cmd, default=10)
             
             if result.returncode == 0:
                 print(f"[green]Ghidra found at: {self.ghidra_path}[/green]")
@@ -135,15 +131,7 @@ class ReverseEngineering:
 
     def _check_required_tools(self):
         """Check required reverse engineering tools"""
-        missing_tools = []
-        
-        for tool in self.required_tools:
-            try:
-                result = subprocess.run(['which', tool], capture_output=True, text=True)
-                if result.returncode != 0:
-                    missing_tools.append(tool)
-            except Exception:
-                missing_tools.append(tool)
+        missing_tools = get_tool_availability().missing(self.required_tools)
         
         if missing_tools:
             print(f"[yellow]Missing reverse engineering tools: {', '.join(missing_tools)}[/yellow]")
@@ -183,13 +171,8 @@ class ReverseEngineering:
                 '-analyze'
             ]
 
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stdout, stderr = process.communicate()
+            process = run_tool_process(cmd, target=binary_path)
+            stdout, stderr = process.stdout, process.stderr
 
             if process.returncode != 0:
                 return {
@@ -230,13 +213,8 @@ class ReverseEngineering:
 
             cmd = [self.radare2_path, '-q', '-c', ';'.join(commands), binary_path]
             
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stdout, stderr = process.communicate()
+            process = run_tool_process(cmd, target=binary_path)
+            stdout, stderr = process.stdout, process.stderr
 
             if process.returncode != 0:
                 return {
@@ -269,13 +247,8 @@ class ReverseEngineering:
 
             cmd = ['strings', f'-n {min_length}', binary_path]
             
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stdout, stderr = process.communicate()
+            process = run_tool_process(cmd, target=binary_path)
+            stdout, stderr = process.stdout, process.stderr
 
             if process.returncode != 0:
                 return {
@@ -5,6 +5,8 @@ import json
 import os
 from typing import Dict, Any, Optional
 from src.utils.kali_tools import KaliToolsManager
+from src.utils.tool_availability import get_tool_availability
+from src.utils.timeout_policy import run_tool_process
 
 class VulnerabilityAnalysis:
     """Vulnerability analysis tools"""
@@ -38,15 +40,7 @@ class VulnerabilityAnalysis:
         
     def _check_required_tools(self):
         """Check required vulnerability analysis tools"""
-        missing_tools = []
-        
-        for tool in self.required_tools:
-            try:
-                result = subprocess.run(['which', tool], capture_output=True, text=True)
-                if result.returncode != 0:
-                    missing_tools.append(tool)
-            except Exception:
-                missing_tools.append(tool)
+        missing_tools = get_tool_availability().missing(self.required_tools)
         
         if missing_tools:
             print(f"[yellow]Missing vulnerability analysis tools: {', '.join(missing_tools)}[/yellow]")
@@ -78,7 +72,7 @@ class VulnerabilityAnalysis:
             cmd.append(target)
             
             # Run nmap scan
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd, target=target)
             
             if result.returncode != 0:
                 return {'error': f'Vulnerability scan failed: {result.stderr}'}
@@ -119,7 +113,7 @@ class VulnerabilityAnalysis:
                 cmd.extend(param.split())
                 
             # Run sqlmap
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd, target=target)
             
             if result.returncode != 0:
                 return {'error': f'SQLMap scan failed: {result.stderr}'}
@@ -158,7 +152,7 @@ show options
                 
             # Run metasploit with resource script
             cmd = ['msfconsole', '-q', '-r', script_path]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd, target=target)
             
             # Clean up resource script
             os.remove(script_path)
@@ -200,7 +194,7 @@ show options
                     cmd.extend([key, str(value)])
             
             # Run the database assessment tool
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            result = run_tool_process(cmd, target=target, default=300)
             
             return {
                 'status': 'Database assessment completed',
@@ -259,7 +253,7 @@ show options
                 cmd += f' {params["additional_args"]}'
             
             # Execute the command
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            result = run_tool_process(['sh', '-c', cmd], target=target, tool=tool)
             
             return {
                 'tool': tool,
@@ -316,7 +310,7 @@ show options
                 cmd += f' {params["additional_args"]}'
             
             # Execute the command
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            result = run_tool_process(['sh', '-c', cmd], target=target, tool=tool)
             
             return {
                 'tool': tool,
@@ -356,8 +350,4 @@ show options
             return {'error': f'Error in vulnerability tool execution: {str(e)}'}
             
     def _check_tool(self, tool: str) -> bool:
-        try:
-            result = subprocess.run(['which', tool], capture_output=True, text=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+        return get_tool_availability().check(tool)
@@ -2,11 +2,12 @@
 Web application analysis tools integration
 """
 
-import subprocess
 import json
 from typing import Dict, Any
 import os
 from src.utils.tool_decorators import tool_loading_animation
+from src.utils.tool_availability import get_tool_availability
+from src.utils.timeout_policy import run_tool_process
 
 class WebApplicationAnalysis:
     """Web application analysis tools"""
@@ -36,15 +37,7 @@ class WebApplicationAnalysis:
     
     def _check_required_tools(self):
         """Check required web application tools"""
-        missing_tools = []
-        
-        for tool in self.required_tools:
-            try:
-                result = subprocess.run(['which', tool], capture_output=True, text=True)
-                if result.returncode != 0:
-                    missing_tools.append(tool)
-            except Exception:
-                missing_tools.append(tool)
+        missing_tools = get_tool_availability().missing(self.required_tools)
         
         if missing_tools:
             print(f"[yellow]Missing web application tools: {', '.join(missing_tools)}[/yellow]")
@@ -61,7 +54,7 @@ class WebApplicationAnalysis:
             cmd = ['nikto', '-h', target, '-Format', 'json']
             if params and params.get('ssl'):
                 cmd.append('-ssl')
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd, target=target)
             results['nikto'] = {
                 'output': result.stdout,
                 'command': ' '.join(cmd)
@@ -74,7 +67,7 @@ class WebApplicationAnalysis:
             cmd = ['dirb', target]
             if params and params.get('wordlist'):
                 cmd.append(params['wordlist'])
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd, target=target)
             results['dirb'] = {
                 'output': result.stdout,
                 'command': ' '.join(cmd)
@@ -89,7 +82,7 @@ class WebApplicationAnalysis:
                 cmd.append('--forms')
             if params and params.get('risk'):
                 cmd.extend(['--risk', str(params['risk'])])
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd, target=target)
             results['sqlmap'] = {
                 'output': result.stdout,
                 'command': ' '.join(cmd)
@@ -101,7 +94,7 @@ class WebApplicationAnalysis:
         if self._is_wordpress(target):
             try:
                 cmd = ['wpscan', '--url', target, '--random-user-agent', '--format', 'json']
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                result = run_tool_process(cmd, target=target)
                 results['wpscan'] = {
                     'output': result.stdout,
                     'command': ' '.join(cmd)
@@ -114,7 +107,7 @@ class WebApplicationAnalysis:
             output_dir = '/tmp/skipfish-output'
             os.makedirs(output_dir, exist_ok=True)
             cmd = ['skipfish', '-o', output_dir, target]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd, target=target)
             results['skipfish'] = {
                 'output': result.stdout,
                 'command': ' '.join(cmd),
@@ -134,7 +127,7 @@ class WebApplicationAnalysis:
             
             for path in wp_paths:
                 url = target.rstrip('/') + path
-                result = subprocess.run(cmd + [url], capture_output=True, text=True)
+                result = run_tool_process(cmd + [url], target=url)
                 if result.stdout.strip() in ['200', '301', '302', '403']:
                     return True
             return False
@@ -147,7 +140,7 @@ class WebApplicationAnalysis:
         """Run XSS vulnerability scan"""
         try:
             cmd = ['xsser', '--url', target, '--auto']
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd, target=target)
             return {
                 'output': result.stdout,
                 'command': ' '.join(cmd)
@@ -160,7 +153,7 @@ class WebApplicationAnalysis:
         """Run SSL/TLS vulnerability scan"""
         try:
             cmd = ['sslyze', target, '--json_out', '-']
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd, target=target)
             return {
                 'output': result.stdout,
                 'command': ' '.join(cmd)
@@ -176,7 +169,7 @@ class WebApplicationAnalysis:
         # Run CMSmap
         try:
             cmd = ['cmsmap', target]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd, target=target)
             results['cmsmap'] = {
                 'output': result.stdout,
                 'command': ' '.join(cmd)
@@ -187,7 +180,7 @@ class WebApplicationAnalysis:
         # Run CMSeek
         try:
             cmd = ['cmseek', '-u', target]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd, target=target)
             results['cmseek'] = {
                 'output': result.stdout,
                 'command': ' '.join(cmd)
@@ -3,6 +3,8 @@
 import subprocess
 import json
 from typing import Dict, Any
+from src.utils.tool_availability import get_tool_availability
+from src.utils.timeout_policy import run_tool_process
 
 class WirelessAttacks:
     """Wireless attacks tools"""
@@ -41,15 +43,7 @@ class WirelessAttacks:
         
     def _check_required_tools(self):
         """Check required wireless attack tools"""
-        missing_tools = []
-        
-        for tool in self.required_tools:
-            try:
-                result = subprocess.run(['which', tool], capture_output=True, text=True)
-                if result.returncode != 0:
-                    missing_tools.append(tool)
-            except Exception:
-                missing_tools.append(tool)
+        missing_tools = get_tool_availability().missing(self.required_tools)
         
         if missing_tools:
             print(f"[yellow]Missing wireless attack tools: {', '.join(missing_tools)}[/yellow]")
@@ -63,7 +57,7 @@ class WirelessAttacks:
         # Put interface in monitor mode
         try:
             cmd = ['airmon-ng', 'start', interface]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd, target=interface)
             monitor_interface = interface + 'mon'
             results['monitor_mode'] = {
                 'output': result.stdout,
@@ -95,7 +89,7 @@ class WirelessAttacks:
             # Disable monitor mode
             try:
                 cmd = ['airmon-ng', 'stop', monitor_interface]
-                subprocess.run(cmd, capture_output=True, text=True)
+                run_tool_process(cmd, target=monitor_interface)
             except Exception as e:
                 results['cleanup_error'] = str(e)
                 
@@ -108,7 +102,7 @@ class WirelessAttacks:
             if target_bssid:
                 cmd.extend(['-b', target_bssid])
                 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd, target=interface)
             return {
                 'output': result.stdout,
                 'command': ' '.join(cmd)
@@ -121,11 +115,11 @@ class WirelessAttacks:
         """Run Bluetooth device scan"""
         try:
             # Enable Bluetooth if needed
-            subprocess.run(['rfkill', 'unblock', 'bluetooth'], capture_output=True)
+            run_tool_process(['rfkill', 'unblock', 'bluetooth'])
             
             # Run hcitool scan
             cmd = ['hcitool', 'scan']
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd)
             
             return {
                 'output': result.stdout,
@@ -143,7 +137,7 @@ class WirelessAttacks:
                 cmd.extend(['-c', client_mac])
             cmd.append(interface)
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_tool_process(cmd, target=target_bssid)
             return {
                 'output': result.stdout,
                 'command': ' '.join(cmd)
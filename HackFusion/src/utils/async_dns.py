@@ -0,0 +1,493 @@
+"""
+In-process asynchronous DNS resolver (UDP with TCP fallback)
+"""
+
+import asyncio
+import ipaddress
+import logging
+import random
+import socket
+import struct
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.utils.async_runner import run_async
+
+logger = logging.getLogger('HackFusion')
+
+QTYPES = {'A': 1, 'NS': 2, 'CNAME': 5, 'SOA': 6, 'PTR': 12, 'MX': 15, 'TXT': 16, 'AAAA': 28}
+QTYPE_NAMES = {value: name for name, value in QTYPES.items()}
+RCODES = {0: 'NOERROR', 1: 'FORMERR', 2: 'SERVFAIL', 3: 'NXDOMAIN', 4: 'NOTIMP', 5: 'REFUSED'}
+
+DEFAULT_RECORD_TYPES = ('A', 'AAAA', 'NS', 'MX', 'TXT', 'SOA', 'CNAME')
+FALLBACK_NAMESERVERS = ['1.1.1.1', '8.8.8.8']
+
+_CLASS_IN = 1
+_FLAG_RD = 0x0100
+_FLAG_TC = 0x0200
+
+
+class DNSError(Exception):
+    """Malformed DNS message or failed exchange"""
+
+
+def system_nameservers(resolv_conf: str = '/etc/resolv.conf') -> List[str]:
+    """
+    Read nameservers from resolv.conf
+
+    :param resolv_conf: Path to resolv.conf
+    :return: Nameserver addresses, or public fallbacks if none are configured
+    """
+    servers = []
+    try:
+        with open(resolv_conf, 'r') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0] == 'nameserver':
+                    servers.append(parts[1].split('%')[0])
+    except OSError:
+        pass
+    return servers or list(FALLBACK_NAMESERVERS)
+
+
+def encode_name(name: str) -> bytes:
+    """Encode a domain name as DNS labels"""
+    encoded = b''
+    for label in name.strip().rstrip('.').split('.'):
+        if not label:
+            continue
+        try:
+            raw = label.encode('idna')
+        except UnicodeError:
+            raw = label.encode('ascii', errors='strict')
+        if len(raw) > 63:
+            raise DNSError(f"Label too long in {name}")
+        encoded += bytes([len(raw)]) + raw
+    return encoded + b'\x00'
+
+
+def build_query(query_id: int, name: str, qtype: str) -> bytes:
+    """
+    Build a recursive query message
+
+    :param query_id: 16-bit message ID
+    :param name: Name to query
+    :param qtype: Record type name (A, AAAA, MX, ...)
+    :return: Wire-format query
+    """
+    header = struct.pack('!HHHHHH', query_id, _FLAG_RD, 1, 0, 0, 0)
+    return header + encode_name(name) + struct.pack('!HH', QTYPES[qtype], _CLASS_IN)
+
+
+def _read_name(data: bytes, offset: int) -> Tuple[str, int]:
+    labels = []
+    end = None
+    jumps = 0
+    while True:
+        if offset >= len(data):
+            raise DNSError('Truncated name')
+        length = data[offset]
+        if length & 0xC0 == 0xC0:
+            if offset + 1 >= len(data):
+                raise DNSError('Truncated compression pointer')
+            if end is None:
+                end = offset + 2
+            offset = ((length & 0x3F) << 8) | data[offset + 1]
+            jumps += 1
+            if jumps > 64:
+                raise DNSError('Compression pointer loop')
+            continue
+        offset += 1
+        if length == 0:
+            break
+        labels.append(data[offset:offset + length].decode('ascii', errors='replace'))
+        offset += length
+    return '.'.join(labels), end if end is not None else offset
+
+
+def _decode_rdata(rtype: int, data: bytes, offset: int, rdlength: int) -> Any:
+    rdata = data[offset:offset + rdlength]
+    if rtype == QTYPES['A'] and rdlength == 4:
+        return socket.inet_ntop(socket.AF_INET, rdata)
+    if rtype == QTYPES['AAAA'] and rdlength == 16:
+        return socket.inet_ntop(socket.AF_INET6, rdata)
+    if rtype in (QTYPES['NS'], QTYPES['CNAME'], QTYPES['PTR']):
+        return _read_name(data, offset)[0]
+    if rtype == QTYPES['MX']:
+        preference = struct.unpack('!H', rdata[:2])[0]
+        return {'preference': preference, 'exchange': _read_name(data, offset + 2)[0]}
+    if rtype == QTYPES['TXT']:
+        strings = []
+        position = 0
+        while position < len(rdata):
+            length = rdata[position]
+            strings.append(rdata[position + 1:position + 1 + length].decode('utf-8', errors='replace'))
+            position += 1 + length
+        return ''.join(strings)
+    if rtype == QTYPES['SOA']:
+        mname, position = _read_name(data, offset)
+        rname, position = _read_name(data, position)
+        serial, refresh, retry, expire, minimum = struct.unpack('!IIIII', data[position:position + 20])
+        return {
+            'mname': mname, 'rname': rname, 'serial': serial, 'refresh': refresh,
+            'retry': retry, 'expire': expire, 'minimum': minimum
+        }
+    return rdata.hex()
+
+
+def parse_response(data: bytes) -> Dict[str, Any]:
+    """
+    Parse a DNS response message
+
+    :param data: Wire-format response
+    :return: Dict with id, rcode, truncated flag, question and answer records
+    """
+    if len(data) < 12:
+        raise DNSError('Response shorter than DNS header')
+    query_id, flags, qdcount, ancount, nscount, _ = struct.unpack('!HHHHHH', data[:12])
+    offset = 12
+    question = None
+    for _ in range(qdcount):
+        qname, offset = _read_name(data, offset)
+        qtype, _qclass = struct.unpack('!HH', data[offset:offset + 4])
+        offset += 4
+        question = (qname.lower(), qtype)
+
+    def read_records(count, offset):
+        records = []
+        for _ in range(count):
+            name, offset = _read_name(data, offset)
+            if offset + 10 > len(data):
+                raise DNSError('Truncated resource record')
+            rtype, _rclass, ttl, rdlength = struct.unpack('!HHIH', data[offset:offset + 10])
+            offset += 10
+            records.append({
+                'name': name,
+                'type': QTYPE_NAMES.get(rtype, str(rtype)),
+                'ttl': ttl,
+                'data': _decode_rdata(rtype, data, offset, rdlength)
+            })
+            offset += rdlength
+        return records, offset
+
+    answers, offset = read_records(ancount, offset)
+    authority, offset = read_records(nscount, offset)
+    return {
+        'id': query_id,
+        'rcode': RCODES.get(flags & 0x000F, str(flags & 0x000F)),
+        'truncated': bool(flags & _FLAG_TC),
+        'question': question,
+        'answers': answers,
+        'authority': authority
+    }
+
+
+class _UDPChannel(asyncio.DatagramProtocol):
+    """One connected UDP socket multiplexing many in-flight queries by ID"""
+
+    def __init__(self):
+        self.transport = None
+        self.pending: Dict[int, asyncio.Future] = {}
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        if len(data) < 2:
+            return
+        future = self.pending.pop(struct.unpack('!H', data[:2])[0], None)
+        if future is not None and not future.done():
+            future.set_result(data)
+
+    def error_received(self, exc):
+        self._fail_all(exc)
+
+    def connection_lost(self, exc):
+        self._fail_all(exc or ConnectionError('UDP channel closed'))
+
+    def _fail_all(self, exc):
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(exc)
+        self.pending.clear()
+
+
+class AsyncResolver:
+    """
+    Asynchronous stub resolver
+
+    Queries go out over a small pool of connected UDP sockets per nameserver,
+    demultiplexed by message ID, so thousands of lookups share a handful of
+    file descriptors. Truncated answers are retried over TCP; timeouts are
+    retried against the next nameserver.
+    """
+
+    def __init__(
+        self,
+        nameservers: Optional[Sequence[str]] = None,
+        port: int = 53,
+        timeout: float = 2.0,
+        retries: int = 2,
+        concurrency: int = 256,
+        sockets_per_server: int = 4
+    ):
+        """
+        Initialize the resolver
+
+        :param nameservers: Nameserver addresses (defaults to resolv.conf)
+        :param port: Nameserver port
+        :param timeout: Seconds to wait for each attempt
+        :param retries: Additional attempts after the first
+        :param concurrency: Maximum queries in flight
+        :param sockets_per_server: UDP sockets pooled per nameserver
+        """
+        self.nameservers = list(nameservers) if nameservers else system_nameservers()
+        self.port = port
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.concurrency = max(1, concurrency)
+        self.sockets_per_server = max(1, sockets_per_server)
+        # Per nameserver: futures of pooled channels, resolved once the socket is open
+        self._channels: Dict[str, List[asyncio.Future]] = {}
+        self._next_socket = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'AsyncResolver':
+        """Build a resolver from information_gathering.dns"""
+        return cls(
+            nameservers=config.get('nameservers') or None,
+            port=int(config.get('port', 53)),
+            timeout=float(config.get('timeout', 2.0)),
+            retries=int(config.get('retries', 2)),
+            concurrency=int(config.get('concurrency', 256))
+        )
+
+    async def __aenter__(self) -> 'AsyncResolver':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close pooled sockets"""
+        for slots in self._channels.values():
+            for slot in slots:
+                if slot.done() and not slot.cancelled() and slot.exception() is None:
+                    slot.result().transport.close()
+        self._channels.clear()
+
+    async def _channel(self, server: str) -> _UDPChannel:
+        slots = self._channels.setdefault(server, [])
+        if len(slots) >= self.sockets_per_server:
+            self._next_socket = (self._next_socket + 1) % len(slots)
+            # shield: a cancelled query must not cancel a socket others share
+            return await asyncio.shield(slots[self._next_socket])
+
+        # Reserve the slot before awaiting, so concurrent queries that find
+        # the pool short share this socket instead of opening their own
+        loop = asyncio.get_running_loop()
+        slot = loop.create_future()
+        slots.append(slot)
+        try:
+            family = socket.AF_INET6 if ipaddress.ip_address(server).version == 6 else socket.AF_INET
+            _, channel = await loop.create_datagram_endpoint(
+                _UDPChannel, remote_addr=(server, self.port), family=family
+            )
+        except BaseException as e:
+            slots.remove(slot)
+            slot.set_exception(e if isinstance(e, Exception) else ConnectionError('UDP channel not opened'))
+            slot.exception()  # waiters see it; don't warn when there are none
+            raise
+        slot.set_result(channel)
+        return channel
+
+    async def _udp_exchange(self, server: str, name: str, qtype: str) -> bytes:
+        channel = await self._channel(server)
+        query_id = random.randrange(0x10000)
+        while query_id in channel.pending:
+            query_id = random.randrange(0x10000)
+        future = asyncio.get_running_loop().create_future()
+        channel.pending[query_id] = future
+        try:
+            channel.transport.sendto(build_query(query_id, name, qtype))
+            return await asyncio.wait_for(future, self.timeout)
+        finally:
+            channel.pending.pop(query_id, None)
+
+    async def _tcp_exchange(self, server: str, name: str, qtype: str) -> bytes:
+        message = build_query(random.randrange(0x10000), name, qtype)
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(server, self.port), self.timeout
+        )
+        try:
+            writer.write(struct.pack('!H', len(message)) + message)
+            await writer.drain()
+            length = struct.unpack('!H', await asyncio.wait_for(reader.readexactly(2), self.timeout))[0]
+            return await asyncio.wait_for(reader.readexactly(length), self.timeout)
+        finally:
+            writer.close()
+
+    async def query(self, name: str, qtype: str = 'A') -> Dict[str, Any]:
+        """
+        Resolve one name and record type
+
+        :param name: Name to resolve
+        :param qtype: Record type name
+        :return: Dict with name, type, status (rcode, TIMEOUT or ERROR),
+                 records (decoded data of matching answers), answers and authority
+        """
+        qtype = qtype.upper()
+        if qtype not in QTYPES:
+            return {'name': name, 'type': qtype, 'status': 'ERROR', 'error': f'Unsupported record type: {qtype}', 'records': []}
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        try:
+            # Responses carry the question as sent: IDNA-encoded and lower-cased
+            expected = (_read_name(encode_name(name), 0)[0].lower(), QTYPES[qtype])
+        except (DNSError, UnicodeError) as e:
+            return {'name': name, 'type': qtype, 'status': 'ERROR', 'error': str(e), 'records': []}
+
+        last_error = None
+        async with self._semaphore:
+            for attempt in range(self.retries + 1):
+                server = self.nameservers[attempt % len(self.nameservers)]
+                try:
+                    data = await self._udp_exchange(server, name, qtype)
+                    response = parse_response(data)
+                    if response['truncated']:
+                        response = parse_response(await self._tcp_exchange(server, name, qtype))
+                    if response['question'] and response['question'] != expected:
+                        raise DNSError('Response does not match the question')
+                except asyncio.TimeoutError:
+                    last_error = 'TIMEOUT'
+                    continue
+                except (OSError, DNSError, struct.error, asyncio.IncompleteReadError) as e:
+                    last_error = str(e)
+                    continue
+
+                if response['rcode'] == 'SERVFAIL' and attempt < self.retries:
+                    last_error = 'SERVFAIL'
+                    continue
+                answers = response['answers']
+                return {
+                    'name': name,
+                    'type': qtype,
+                    'status': response['rcode'],
+                    'records': [answer['data'] for answer in answers if answer['type'] == qtype],
+                    'answers': answers,
+                    'authority': response['authority'],
+                    'server': server
+                }
+
+        return {
+            'name': name,
+            'type': qtype,
+            'status': 'TIMEOUT' if last_error == 'TIMEOUT' else 'ERROR',
+            'error': last_error,
+            'records': []
+        }
+
+    async def lookup(self, name: str, qtypes: Iterable[str] = DEFAULT_RECORD_TYPES) -> Dict[str, Dict[str, Any]]:
+        """
+        Query several record types for one name concurrently
+
+        :param name: Name to resolve
+        :param qtypes: Record type names
+        :return: Mapping of record type to query result
+        """
+        qtypes = list(qtypes)
+        results = await asyncio.gather(*(self.query(name, qtype) for qtype in qtypes))
+        return dict(zip(qtypes, results))
+
+    async def resolve_subdomains(
+        self,
+        domain: str,
+        candidates: Iterable[str],
+        qtypes: Sequence[str] = ('A', 'AAAA'),
+        detect_wildcard: bool = True,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Resolve candidate subdomain labels in one batch
+
+        :param domain: Parent domain
+        :param candidates: Labels such as 'www' or 'mail' (or full names under domain)
+        :param qtypes: Address record types to query
+        :param detect_wildcard: Drop answers identical to a wildcard record
+        :param on_result: Callback invoked with each found subdomain
+        :return: Found subdomains with their addresses
+        """
+        domain = domain.strip().rstrip('.').lower()
+        wildcard = set()
+        if detect_wildcard:
+            probe = f"hf-wildcard-{random.randrange(1 << 30):x}.{domain}"
+            for result in (await self.lookup(probe, qtypes)).values():
+                wildcard.update(result['records'])
+
+        found = []
+
+        async def resolve(fqdn: str, label: str):
+            results = await self.lookup(fqdn, qtypes)
+            addresses = [
+                record for result in results.values() for record in result['records']
+                if isinstance(record, str)
+            ]
+            if addresses and not (wildcard and set(addresses) <= wildcard):
+                entry = {'subdomain': label, 'fqdn': fqdn, 'addresses': addresses}
+                found.append(entry)
+                if on_result:
+                    on_result(entry)
+
+        seen = set()
+        tasks = []
+        for candidate in candidates:
+            label = candidate.strip().rstrip('.').lower()
+            if not label or label.startswith('#'):
+                continue
+            if label.endswith(f".{domain}"):
+                label = label[:-len(domain) - 1]
+            if label in seen:
+                continue
+            seen.add(label)
+            tasks.append(resolve(f"{label}.{domain}", label))
+        # The semaphore in query() bounds what is actually in flight
+        await asyncio.gather(*tasks)
+        return found
+
+
+def lookup_records(
+    name: str,
+    qtypes: Iterable[str] = DEFAULT_RECORD_TYPES,
+    **resolver_kwargs
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Blocking wrapper around AsyncResolver.lookup
+
+    :param name: Name to resolve
+    :param qtypes: Record type names
+    :return: Mapping of record type to query result
+    """
+    async def run():
+        async with AsyncResolver(**resolver_kwargs) as resolver:
+            return await resolver.lookup(name, qtypes)
+    return run_async(run())
+
+
+def resolve_subdomains(
+    domain: str,
+    candidates: Iterable[str],
+    qtypes: Sequence[str] = ('A', 'AAAA'),
+    **resolver_kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Blocking wrapper around AsyncResolver.resolve_subdomains
+
+    :param domain: Parent domain
+    :param candidates: Candidate labels
+    :param qtypes: Address record types to query
+    :return: Found subdomains with their addresses
+    """
+    async def run():
+        async with AsyncResolver(**resolver_kwargs) as resolver:
+            return await resolver.resolve_subdomains(domain, candidates, qtypes)
+    return run_async(run())
@@ -0,0 +1,168 @@
+"""
+Asyncio subprocess engine for supervising many tool processes from one event loop
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import signal
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from src.utils.process_control import TaskCancelled, current_context
+
+logger = logging.getLogger('HackFusion')
+
+LineCallback = Callable[[str], Union[None, Awaitable[None]]]
+
+# Bytes read from a pipe per iteration; lines are split from these chunks so
+# very long lines (nmap XML, JSON reports) never hit the StreamReader limit
+_CHUNK_SIZE = 64 * 1024
+
+
+async def _emit(callback: Optional[LineCallback], line: str):
+    if callback is None:
+        return
+    outcome = callback(line)
+    if inspect.isawaitable(outcome):
+        await outcome
+
+
+async def _pump(
+    stream: asyncio.StreamReader,
+    sink: Optional[List[str]],
+    callback: Optional[LineCallback]
+):
+    """Read a pipe to EOF, forwarding complete lines to the callback"""
+    partial = ''
+    while True:
+        chunk = await stream.read(_CHUNK_SIZE)
+        if not chunk:
+            break
+        text = chunk.decode('utf-8', errors='replace')
+        if sink is not None:
+            sink.append(text)
+        if callback is None:
+            continue
+        lines = (partial + text).split('\n')
+        partial = lines.pop()
+        for line in lines:
+            await _emit(callback, line)
+    if partial:
+        await _emit(callback, partial)
+
+
+async def terminate_process_group(proc: asyncio.subprocess.Process, grace_period: float = 5.0):
+    """
+    Terminate a process group started with start_new_session=True
+
+    Sends SIGTERM, waits up to grace_period, then SIGKILLs the group.
+    """
+    if proc.returncode is not None:
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=grace_period)
+    except asyncio.TimeoutError:
+        logger.warning(f"Process group {proc.pid} ignored SIGTERM, sending SIGKILL")
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await proc.wait()
+
+
+async def run_command(
+    cmd: List[str],
+    timeout: Optional[float] = 300,
+    env: Optional[Dict[str, str]] = None,
+    on_stdout: Optional[LineCallback] = None,
+    on_stderr: Optional[LineCallback] = None,
+    capture_output: bool = True,
+    grace_period: float = 5.0
+) -> Dict[str, Any]:
+    """
+    Run a command without blocking the event loop
+
+    The process runs in its own process group. Cancelling the awaiting task
+    terminates the whole group before CancelledError propagates.
+
+    :param cmd: Command to run as a list of strings
+    :param timeout: Timeout in seconds (None for no limit)
+    :param env: Environment for the child process
+    :param on_stdout: Called with each stdout line as it arrives (sync or async)
+    :param on_stderr: Called with each stderr line as it arrives (sync or async)
+    :param capture_output: Keep stdout/stderr in the result; disable for streaming-only use
+    :param grace_period: Seconds between SIGTERM and SIGKILL on timeout or cancellation
+    :return: Dictionary with status, stdout, stderr, returncode and command
+    """
+    command = ' '.join(cmd)
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+            start_new_session=True
+        )
+    except Exception as e:
+        error_msg = f"Unexpected error running {command}: {str(e)}"
+        logger.error(error_msg)
+        return {'status': 'error', 'error': error_msg, 'command': command}
+
+    stdout_chunks: Optional[List[str]] = [] if capture_output else None
+    stderr_chunks: Optional[List[str]] = [] if capture_output else None
+
+    async def communicate():
+        await asyncio.gather(
+            _pump(proc.stdout, stdout_chunks, on_stdout),
+            _pump(proc.stderr, stderr_chunks, on_stderr)
+        )
+        return await proc.wait()
+
+    try:
+        returncode = await asyncio.wait_for(communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        await terminate_process_group(proc, grace_period)
+        error_msg = f"Command {command} timed out after {timeout} seconds"
+        logger.error(error_msg)
+        return {'status': 'timeout', 'error': error_msg, 'command': command}
+    except asyncio.CancelledError:
+        await terminate_process_group(proc, grace_period)
+        raise
+
+    return {
+        'status': 'success' if returncode == 0 else 'error',
+        'stdout': ''.join(stdout_chunks).strip() if capture_output else '',
+        'stderr': ''.join(stderr_chunks).strip() if capture_output else '',
+        'returncode': returncode,
+        'command': command
+    }
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion from a (worker) thread
+
+    The coroutine is cancelled when the thread-bound task context is
+    cancelled, in which case TaskCancelled is raised.
+
+    :param coro: Coroutine to run
+    :return: Result of the coroutine
+    """
+    async def supervise():
+        context = current_context()
+        task = asyncio.ensure_future(coro)
+        if context is None:
+            return await task
+        while not task.done():
+            await asyncio.wait({task}, timeout=0.2)
+            if context.cancelled and not task.done():
+                task.cancel()
+                raise TaskCancelled(context.task_id)
+        return task.result()
+    return asyncio.run(supervise())
@@ -0,0 +1,135 @@
+"""
+Persistent per-host scan baselines for incremental rescans
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger('HackFusion')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hosts (
+    baseline   TEXT NOT NULL,
+    host       TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    probe      TEXT NOT NULL,
+    ports      TEXT NOT NULL,
+    scanned_at REAL NOT NULL,
+    probed_at  REAL NOT NULL,
+    PRIMARY KEY (baseline, host)
+)
+"""
+
+
+class BaselineStore:
+    """
+    SQLite store of the last known state of every host in a named baseline
+
+    Each host keeps the fingerprint of its last cheap probe (liveness, probed
+    open ports, banner hashes) and the open ports and services of its last
+    full scan.
+    """
+
+    def __init__(self, path: str = '~/.hackfusion/baselines.db'):
+        """
+        Initialize the store
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use (caller holds the lock)"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def load(self, baseline: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Load every host of a baseline
+
+        Args:
+            baseline: Baseline name
+
+        Returns:
+            Mapping of host to its record (fingerprint, probe, ports,
+            scanned_at, probed_at)
+        """
+        with self._lock:
+            rows = self._connection().execute(
+                'SELECT host, fingerprint, probe, ports, scanned_at, probed_at FROM hosts WHERE baseline = ?',
+                (baseline,)
+            ).fetchall()
+        return {
+            host: {
+                'fingerprint': fingerprint,
+                'probe': json.loads(probe),
+                'ports': json.loads(ports),
+                'scanned_at': scanned_at,
+                'probed_at': probed_at
+            }
+            for host, fingerprint, probe, ports, scanned_at, probed_at in rows
+        }
+
+    def save_scan(
+        self,
+        baseline: str,
+        host: str,
+        fingerprint: str,
+        probe: Dict[str, Any],
+        ports: List[Dict[str, Any]]
+    ):
+        """Record a full scan of a host together with the probe taken before it"""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                'INSERT OR REPLACE INTO hosts (baseline, host, fingerprint, probe, ports, scanned_at, probed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (baseline, host, fingerprint, json.dumps(probe), json.dumps(ports), now, now)
+            )
+            conn.commit()
+
+    def save_probe(self, baseline: str, host: str, fingerprint: str, probe: Dict[str, Any]):
+        """Record a probe of a known host without touching its scan results"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                'UPDATE hosts SET fingerprint = ?, probe = ?, probed_at = ? WHERE baseline = ? AND host = ?',
+                (fingerprint, json.dumps(probe), time.time(), baseline, host)
+            )
+            conn.commit()
+
+    def drop(self, baseline: str, host: Optional[str] = None):
+        """Forget one host, or the whole baseline when host is None"""
+        with self._lock:
+            conn = self._connection()
+            if host is None:
+                conn.execute('DELETE FROM hosts WHERE baseline = ?', (baseline,))
+            else:
+                conn.execute('DELETE FROM hosts WHERE baseline = ? AND host = ?', (baseline, host))
+            conn.commit()
+
+    def baselines(self) -> Dict[str, int]:
+        """Baseline names with their host counts"""
+        with self._lock:
+            rows = self._connection().execute('SELECT baseline, COUNT(*) FROM hosts GROUP BY baseline').fetchall()
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,179 @@
+"""
+Small dependency-graph scheduler for running independent stages concurrently
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from src.utils.process_control import TaskCancelled, current_context, task_context
+
+logger = logging.getLogger('HackFusion')
+
+
+class Stage:
+    """A named unit of work with dependencies on other stages"""
+
+    __slots__ = ('name', 'func', 'depends_on', 'condition')
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        depends_on: Sequence[str] = (),
+        condition: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ):
+        """
+        Initialize stage
+
+        Args:
+            name: Unique stage name
+            func: Called with a dict of dependency results, returns the stage result
+            depends_on: Names of stages whose results this stage needs
+            condition: Optional predicate over dependency results; the stage is
+                skipped when it returns False
+        """
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.condition = condition
+
+
+class DagScheduler:
+    """
+    Run stages as soon as their dependencies have finished
+
+    Stages without a path between them run concurrently, so the wall time
+    of the graph approaches its critical path instead of the sum of stages.
+    A stage whose dependency failed or was skipped is skipped as well.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize scheduler
+
+        Args:
+            max_workers: Maximum stages running at once (defaults to stage count)
+        """
+        self.max_workers = max_workers
+        self.stages: Dict[str, Stage] = {}
+
+    def add_stage(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        depends_on: Sequence[str] = (),
+        condition: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> 'DagScheduler':
+        """Add a stage to the graph (see Stage for arguments)"""
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        self.stages[name] = Stage(name, func, depends_on, condition)
+        return self
+
+    def _validate(self):
+        for stage in self.stages.values():
+            for dependency in stage.depends_on:
+                if dependency not in self.stages:
+                    raise ValueError(f"Stage {stage.name} depends on unknown stage {dependency}")
+
+        # Kahn's algorithm to reject cycles before anything runs
+        remaining = {name: set(stage.depends_on) for name, stage in self.stages.items()}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Dependency cycle between stages: {', '.join(sorted(remaining))}")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Execute the graph
+
+        Returns:
+            Dict with 'results' (stage name -> result), 'timings' (stage name ->
+            status, start, end and duration relative to the run start) and
+            'wall_time' in seconds
+        """
+        self._validate()
+
+        parent = current_context()
+        started = time.monotonic()
+        results: Dict[str, Any] = {}
+        timings: Dict[str, Dict[str, Any]] = {}
+        status: Dict[str, str] = {}
+
+        def execute(stage: Stage, inputs: Dict[str, Any]):
+            with task_context(parent):
+                stage_start = time.monotonic()
+                try:
+                    return stage.func(inputs)
+                finally:
+                    timings[stage.name] = {
+                        'start': round(stage_start - started, 3),
+                        'end': round(time.monotonic() - started, 3),
+                        'duration': round(time.monotonic() - stage_start, 3)
+                    }
+
+        def record_skip(name: str, reason: str):
+            status[name] = 'skipped'
+            results[name] = {'status': 'skipped', 'reason': reason}
+            offset = round(time.monotonic() - started, 3)
+            timings[name] = {'start': offset, 'end': offset, 'duration': 0.0, 'status': 'skipped'}
+
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_workers or max(1, len(self.stages)),
+            thread_name_prefix='dag-stage'
+        )
+        running = {}
+        try:
+            while len(status) < len(self.stages):
+                # Start or skip every stage whose dependencies are settled
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for name, stage in self.stages.items():
+                        if name in status:
+                            continue
+                        if any(dep not in status or status[dep] == 'running' for dep in stage.depends_on):
+                            continue
+
+                        progressed = True
+                        failed = [dep for dep in stage.depends_on if status[dep] != 'completed']
+                        inputs = {dep: results[dep] for dep in stage.depends_on}
+                        if failed:
+                            record_skip(name, f"Dependency not completed: {', '.join(failed)}")
+                        elif stage.condition is not None and not stage.condition(inputs):
+                            record_skip(name, 'Condition not met')
+                        else:
+                            status[name] = 'running'
+                            running[pool.submit(execute, stage, inputs)] = name
+
+                if not running:
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                        status[name] = 'completed'
+                    except TaskCancelled:
+                        raise
+                    except Exception as e:
+                        logger.error(f"Stage {name} failed: {e}")
+                        results[name] = {'error': str(e), 'message': f'{name} stage failed'}
+                        status[name] = 'failed'
+                    timings[name]['status'] = status[name]
+        finally:
+            pool.shutdown(wait=not (parent is not None and parent.cancelled))
+
+        return {
+            'results': results,
+            'timings': timings,
+            'wall_time': round(time.monotonic() - started, 3)
+        }
+
@@ -0,0 +1,270 @@
+"""
+Bounded worker pool for tool execution
+"""
+
+import itertools
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger('HackFusion')
+
+
+class QueueFullError(Exception):
+    """Raised when a job cannot be queued before the submit timeout expires"""
+
+
+class ExecutionEngine:
+    """
+    Fixed-size worker pool with a bounded submission queue and per-tool caps
+
+    Jobs are queued per tool and dispatched in submission order to the first
+    idle worker, skipping tools that already run at their concurrency limit so
+    a burst of slow nmap jobs cannot starve cheap whois lookups.
+    """
+
+    def __init__(
+        self,
+        workers: int = 8,
+        queue_size: int = 256,
+        tool_limits: Optional[Dict[str, int]] = None,
+        default_tool_limit: Optional[int] = None,
+        submit_timeout: Optional[float] = None
+    ):
+        """
+        Initialize the execution engine
+
+        Args:
+            workers: Number of worker threads
+            queue_size: Maximum number of jobs waiting for a worker
+            tool_limits: Maximum concurrent jobs per tool name
+            default_tool_limit: Limit for tools missing from tool_limits
+            submit_timeout: Default seconds submit() blocks when the queue is full
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+        self.workers = workers
+        self.queue_size = queue_size
+        self.tool_limits = dict(tool_limits or {})
+        self.default_tool_limit = default_tool_limit or workers
+        self.submit_timeout = submit_timeout
+
+        self._cond = threading.Condition()
+        self._pending: Dict[str, Deque[Tuple[int, Future, Callable, tuple, dict]]] = {}
+        self._pending_count = 0
+        self._active: Dict[str, int] = {}
+        self._sequence = itertools.count()
+        self._threads: List[threading.Thread] = []
+        self._shutdown = False
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ExecutionEngine':
+        """
+        Build an engine from the ``executor`` section of tools.yaml
+
+        Args:
+            config: Executor configuration dictionary
+
+        Returns:
+            Configured ExecutionEngine
+        """
+        return cls(
+            workers=int(config.get('workers', 8)),
+            queue_size=int(config.get('queue_size', 256)),
+            tool_limits={
+                tool: int(limit)
+                for tool, limit in (config.get('tool_limits') or {}).items()
+            },
+            default_tool_limit=config.get('default_tool_limit'),
+            submit_timeout=config.get('submit_timeout')
+        )
+
+    def limit_for(self, tool_name: str) -> int:
+        """Get the concurrency cap for a tool"""
+        return max(1, int(self.tool_limits.get(tool_name, self.default_tool_limit)))
+
+    def submit(
+        self,
+        tool_name: str,
+        func: Callable,
+        *args,
+        block: bool = True,
+        timeout: Optional[float] = None,
+        future: Optional[Future] = None,
+        **kwargs
+    ) -> Future:
+        """
+        Queue a job for execution
+
+        Blocks while the queue is full (backpressure) unless block is False.
+
+        Args:
+            tool_name: Tool name used for the per-tool concurrency cap
+            func: Callable to run on a worker
+            block: Wait for queue space instead of failing immediately
+            timeout: Seconds to wait for queue space (defaults to submit_timeout)
+            future: Future to resolve, so the caller can register it before
+                    the job can possibly run (a new one if None)
+
+        Returns:
+            Future resolved with the callable's result
+
+        Raises:
+            QueueFullError: If no queue space became available in time
+            RuntimeError: If the engine has been shut down
+        """
+        if timeout is None:
+            timeout = self.submit_timeout
+
+        if future is None:
+            future = Future()
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("ExecutionEngine has been shut down")
+
+            if self._pending_count >= self.queue_size:
+                if not block:
+                    raise QueueFullError(f"Execution queue is full ({self.queue_size} jobs)")
+                if not self._cond.wait_for(
+                    lambda: self._pending_count < self.queue_size or self._shutdown,
+                    timeout=timeout
+                ):
+                    raise QueueFullError(
+                        f"Execution queue stayed full for {timeout} seconds"
+                    )
+                if self._shutdown:
+                    raise RuntimeError("ExecutionEngine has been shut down")
+
+            self._ensure_workers()
+            self._pending.setdefault(tool_name, deque()).append(
+                (next(self._sequence), future, func, args, kwargs)
+            )
+            self._pending_count += 1
+            self._cond.notify_all()
+
+        return future
+
+    def cancel(self, future: Future) -> bool:
+        """
+        Cancel a job, removing it from the queue if it has not started
+
+        The queue slot and the tool's queue position are released at once,
+        instead of when a worker would have dequeued the cancelled job.
+
+        Args:
+            future: Future returned by submit()
+
+        Returns:
+            True if the job was cancelled, False if it is already running or done
+        """
+        with self._cond:
+            for tool_name, jobs in self._pending.items():
+                for job in jobs:
+                    if job[1] is future:
+                        jobs.remove(job)
+                        if not jobs:
+                            del self._pending[tool_name]
+                        self._pending_count -= 1
+                        self._cond.notify_all()
+                        return future.cancel()
+        return future.cancel()
+
+    def _ensure_workers(self):
+        """Start worker threads on first use (caller holds the lock)"""
+        if self._threads:
+            return
+        for idx in range(self.workers):
+            thread = threading.Thread(
+                target=self._worker_loop,
+                name=f"hackfusion-worker-{idx}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _next_job(self):
+        """Pick the oldest job whose tool has spare capacity (caller holds the lock)"""
+        selected_tool = None
+        selected_seq = None
+        for tool_name, jobs in self._pending.items():
+            if not jobs or self._active.get(tool_name, 0) >= self.limit_for(tool_name):
+                continue
+            if selected_seq is None or jobs[0][0] < selected_seq:
+                selected_tool = tool_name
+                selected_seq = jobs[0][0]
+
+        if selected_tool is None:
+            return None
+
+        job = self._pending[selected_tool].popleft()
+        if not self._pending[selected_tool]:
+            del self._pending[selected_tool]
+        self._pending_count -= 1
+        self._active[selected_tool] = self._active.get(selected_tool, 0) + 1
+        return selected_tool, job
+
+    def _worker_loop(self):
+        """Worker thread main loop"""
+        while True:
+            with self._cond:
+                picked = self._next_job()
+                while picked is None:
+                    if self._shutdown and not self._pending_count:
+                        return
+                    self._cond.wait()
+                    picked = self._next_job()
+                # Queue space was freed, wake blocked submitters
+                self._cond.notify_all()
+
+            tool_name, (_, future, func, args, kwargs) = picked
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(func(*args, **kwargs))
+                    except BaseException as e:
+                        logger.error(f"Job for {tool_name} failed: {str(e)}")
+                        future.set_exception(e)
+            finally:
+                with self._cond:
+                    self._active[tool_name] -= 1
+                    if not self._active[tool_name]:
+                        del self._active[tool_name]
+                    self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get a snapshot of queue depth and active jobs per tool"""
+        with self._cond:
+            return {
+                'workers': self.workers,
+                'queued': self._pending_count,
+                'queue_size': self.queue_size,
+                'active': dict(self._active),
+                'queued_by_tool': {tool: len(jobs) for tool, jobs in self._pending.items()}
+            }
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False):
+        """
+        Stop accepting jobs and let workers drain the queue
+
+        Args:
+            wait: Join worker threads before returning
+            cancel_pending: Cancel queued jobs instead of running them
+        """
+        with self._cond:
+            self._shutdown = True
+            if cancel_pending:
+                for jobs in self._pending.values():
+                    for _, future, _, _, _ in jobs:
+                        future.cancel()
+                self._pending.clear()
+                self._pending_count = 0
+            self._cond.notify_all()
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
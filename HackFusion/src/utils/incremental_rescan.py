@@ -0,0 +1,400 @@
+"""
+Incremental rescans: cheap change probes against a stored baseline, full
+nmap scans only for hosts whose fingerprint changed, and a diff report
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from src.utils.async_runner import run_async
+from src.utils.baseline_store import BaselineStore
+from src.utils.resolver_cache import get_resolver_cache
+from src.utils.target_batch import TargetSource, read_targets
+from src.utils.target_sharding import parse_network
+from src.utils.tcp_sweep import DEFAULT_SWEEP_PORTS, TcpSweeper
+
+logger = logging.getLogger('HackFusion')
+
+
+class ChangeProbe:
+    """
+    Cheap per-host fingerprint: liveness, open probe ports and banner hashes
+
+    Probe ports are the sweep ports plus every port the baseline already
+    knows for the probed hosts, so both new common services and closed known
+    services change the fingerprint. Services that greet the client (SSH,
+    FTP, SMTP, databases, ...) also contribute a hash of their banner, which
+    changes with the software version.
+    """
+
+    def __init__(
+        self,
+        sweep_config: Optional[Dict[str, Any]] = None,
+        banner_timeout: float = 2.0,
+        banner_bytes: int = 256,
+        concurrency: int = 256
+    ):
+        """
+        Initialize the probe
+
+        Args:
+            sweep_config: TCP sweep settings (information_gathering.nmap.pre_sweep)
+            banner_timeout: Seconds to wait for a service banner
+            banner_bytes: Bytes of banner read from each service
+            concurrency: Maximum banner reads in flight
+        """
+        self.sweep_config = dict(sweep_config or {})
+        self.banner_timeout = banner_timeout
+        self.banner_bytes = banner_bytes
+        self.concurrency = max(1, concurrency)
+
+    @staticmethod
+    def fingerprint(probe: Dict[str, Any], ports: Optional[Iterable[int]] = None) -> str:
+        """
+        Stable hash of a probe record
+
+        Args:
+            probe: Probe record
+            ports: Only consider these ports (e.g. the ones two probes have in
+                   common, so a growing probe set alone is not a change)
+        """
+        open_ports = probe['open_ports']
+        banners = probe['banners']
+        if ports is not None:
+            ports = {int(port) for port in ports}
+            open_ports = [port for port in open_ports if port in ports]
+            banners = {port: digest for port, digest in banners.items() if int(port) in ports}
+        payload = json.dumps({'alive': probe['alive'], 'open_ports': open_ports, 'banners': banners}, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    async def grab_banner(self, host: str, port: int) -> str:
+        """
+        Hash of the first line a service sends on connect
+
+        Returns:
+            Short hex digest, or '' if the service sends nothing
+        """
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), self.banner_timeout)
+        except (OSError, asyncio.TimeoutError):
+            return ''
+        try:
+            data = await asyncio.wait_for(reader.read(self.banner_bytes), self.banner_timeout)
+        except (OSError, asyncio.TimeoutError):
+            data = b''
+        finally:
+            writer.close()
+        first_line = data.split(b'\n', 1)[0].strip()
+        return hashlib.sha256(first_line).hexdigest()[:16] if first_line else ''
+
+    async def _banners(self, targets: List[tuple]) -> List[str]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def one(host: str, port: int) -> str:
+            async with semaphore:
+                return await self.grab_banner(host, port)
+        return await asyncio.gather(*(one(host, port) for host, port in targets))
+
+    def probe(self, hosts: Iterable[str], known_ports: Iterable[int] = ()) -> Dict[str, Dict[str, Any]]:
+        """
+        Probe hosts
+
+        Args:
+            hosts: IP addresses
+            known_ports: Ports open in the baseline, probed in addition to the sweep ports
+
+        Returns:
+            Mapping of host to {'alive', 'open_ports', 'banners', 'probed_ports'}
+        """
+        hosts = list(dict.fromkeys(hosts))
+        if not hosts:
+            return {}
+        sweeper = TcpSweeper.from_config(self.sweep_config)
+        sweeper.ports = sorted(set(sweeper.ports or DEFAULT_SWEEP_PORTS) | {int(port) for port in known_ports})
+        sweep = sweeper.sweep_hosts(hosts)['hosts']
+
+        open_services = [(host, port) for host in hosts for port in sweep[host]['open_ports']]
+        banners = run_async(self._banners(open_services)) if open_services else []
+
+        probes = {
+            host: {
+                'alive': sweep[host]['alive'],
+                'open_ports': sweep[host]['open_ports'],
+                'banners': {},
+                'probed_ports': sweeper.ports
+            }
+            for host in hosts
+        }
+        for (host, port), banner in zip(open_services, banners):
+            probes[host]['banners'][str(port)] = banner
+        return probes
+
+
+def _port_key(port: Dict[str, Any]) -> str:
+    return f"{port.get('number') or port.get('port')}/{port.get('protocol') or 'tcp'}"
+
+
+def compact_ports(parsed_output: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Open ports of a parsed nmap result in the form stored in baselines
+
+    Args:
+        parsed_output: parsed_output of an nmap result (XML or text parser)
+
+    Returns:
+        Sorted list of {'port', 'protocol', 'service', 'product', 'version'}
+    """
+    ports = []
+    for port in parsed_output.get('open_ports', []):
+        if port.get('state', 'open') != 'open':
+            continue
+        ports.append({
+            'port': str(port.get('number') or port.get('port')),
+            'protocol': port.get('protocol') or 'tcp',
+            'service': port.get('service'),
+            'product': port.get('product'),
+            'version': port.get('version')
+        })
+    return sorted(ports, key=lambda port: (port['protocol'], int(port['port']) if port['port'].isdigit() else 0))
+
+
+def diff_ports(old: List[Dict[str, Any]], new: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Compare two stored port lists
+
+    Returns:
+        Dict with 'opened' and 'closed' port keys (``22/tcp``) and
+        'service_changes' for ports whose service, product or version changed
+    """
+    old_by_key = {_port_key(port): port for port in old}
+    new_by_key = {_port_key(port): port for port in new}
+    changes = []
+    for key in sorted(old_by_key.keys() & new_by_key.keys()):
+        before = {field: old_by_key[key].get(field) for field in ('service', 'product', 'version')}
+        after = {field: new_by_key[key].get(field) for field in ('service', 'product', 'version')}
+        if before != after:
+            changes.append({'port': key, 'before': before, 'after': after})
+    return {
+        'opened': sorted(new_by_key.keys() - old_by_key.keys()),
+        'closed': sorted(old_by_key.keys() - new_by_key.keys()),
+        'service_changes': changes
+    }
+
+
+def common_ports(old: Dict[str, Any], new: Dict[str, Any]) -> set:
+    """Ports covered by both probes"""
+    return set(old.get('probed_ports', [])) & set(new.get('probed_ports', []))
+
+
+def probe_changes(old: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+    """Human-readable reasons why two probes differ (over their common ports)"""
+    ports = common_ports(old, new)
+    reasons = []
+    if old.get('alive') != new.get('alive'):
+        reasons.append('came up' if new.get('alive') else 'went down')
+    opened = sorted((set(new.get('open_ports', [])) - set(old.get('open_ports', []))) & ports)
+    closed = sorted((set(old.get('open_ports', [])) - set(new.get('open_ports', []))) & ports)
+    if opened:
+        reasons.append(f"probe ports opened: {', '.join(map(str, opened))}")
+    if closed:
+        reasons.append(f"probe ports closed: {', '.join(map(str, closed))}")
+    old_banners, new_banners = old.get('banners', {}), new.get('banners', {})
+    changed = sorted(
+        (
+            port for port in old_banners.keys() & new_banners.keys()
+            if old_banners[port] != new_banners[port] and int(port) in ports
+        ),
+        key=int
+    )
+    if changed:
+        reasons.append(f"banner changed on: {', '.join(changed)}")
+    return reasons
+
+
+class IncrementalRescanner:
+    """
+    Rescan an estate against a stored baseline
+
+    Every host gets a cheap ChangeProbe. Hosts that are new, whose
+    fingerprint differs from the baseline, or whose baseline is older than
+    ``max_baseline_age`` get a full nmap scan; the others reuse their
+    baseline results. The report lists what changed per host.
+    """
+
+    def __init__(
+        self,
+        info_gathering,
+        store: Optional[BaselineStore] = None,
+        probe: Optional[ChangeProbe] = None,
+        max_baseline_age: Optional[float] = 30 * 86400
+    ):
+        """
+        Initialize the rescanner
+
+        Args:
+            info_gathering: InformationGathering instance used for full scans
+            store: Baseline store
+            probe: Change probe
+            max_baseline_age: Seconds after which a host is fully rescanned even
+                              if its fingerprint did not change (None: never)
+        """
+        self.info_gathering = info_gathering
+        self.store = store or BaselineStore()
+        self.probe = probe or ChangeProbe()
+        self.max_baseline_age = max_baseline_age
+
+    @classmethod
+    def from_config(cls, info_gathering, config: Dict[str, Any]) -> 'IncrementalRescanner':
+        """Build a rescanner from information_gathering.rescan"""
+        return cls(
+            info_gathering,
+            store=BaselineStore(config.get('baseline_path', '~/.hackfusion/baselines.db')),
+            probe=ChangeProbe(
+                sweep_config=info_gathering.config.get('nmap', {}).get('pre_sweep', {}),
+                banner_timeout=float(config.get('banner_timeout', 2.0)),
+                banner_bytes=int(config.get('banner_bytes', 256)),
+                concurrency=int(config.get('banner_concurrency', 256))
+            ),
+            max_baseline_age=config.get('max_baseline_age', 30 * 86400)
+        )
+
+    def expand_targets(self, targets: TargetSource) -> List[str]:
+        """Normalized, de-duplicated hosts; CIDR ranges become their addresses"""
+        hosts: Dict[str, None] = {}
+        for target in read_targets(targets):
+            network = parse_network(target)
+            if network is not None:
+                for address in (network.hosts() if network.num_addresses > 1 else [network.network_address]):
+                    hosts[str(address)] = None
+            else:
+                hosts[self.info_gathering._normalize_scan_target(target)] = None
+        return list(hosts)
+
+    def run(
+        self,
+        targets: TargetSource,
+        baseline: str = 'default',
+        incremental: bool = True,
+        on_host: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Rescan targets and update the baseline
+
+        Args:
+            targets: Scope file path or iterable of IPs, hostnames and CIDR ranges
+            baseline: Baseline name
+            incremental: Only fully scan hosts that changed (False scans every live host)
+            on_host: Optional callback with each host's report entry as it is decided
+
+        Returns:
+            Diff report with 'summary' counts and a 'hosts' entry per target
+        """
+        started = time.monotonic()
+        hosts = self.expand_targets(targets)
+        previous = self.store.load(baseline)
+        resolved = get_resolver_cache().resolve_many(hosts)
+
+        report_hosts: Dict[str, Dict[str, Any]] = {}
+
+        def decide(host: str, entry: Dict[str, Any]):
+            report_hosts[host] = entry
+            if on_host:
+                on_host(host, entry)
+
+        addresses = {}
+        for host in hosts:
+            if resolved.get(host):
+                addresses[host] = resolved[host]
+            else:
+                decide(host, {'status': 'unresolved'})
+
+        known_ports = {
+            int(port['port']) for host in addresses if host in previous
+            for port in previous[host]['ports']
+            if port.get('protocol', 'tcp') == 'tcp' and str(port.get('port')).isdigit()
+        }
+        probe_started = time.monotonic()
+        probes = self.probe.probe(addresses.values(), known_ports)
+        probe_elapsed = round(time.monotonic() - probe_started, 3)
+
+        to_scan: Dict[str, Dict[str, Any]] = {}
+        now = time.time()
+        for host, address in addresses.items():
+            probe = probes[address]
+            fingerprint = ChangeProbe.fingerprint(probe)
+            prev = previous.get(host)
+            # A growing probe set alone is not a change
+            shared = common_ports(prev['probe'], probe) if prev is not None else None
+
+            if not probe['alive']:
+                if prev is not None:
+                    self.store.save_probe(baseline, host, fingerprint, probe)
+                    decide(host, {'status': 'down', 'last_ports': prev['ports']})
+                else:
+                    decide(host, {'status': 'unreachable'})
+                continue
+
+            if not incremental:
+                reason = ['full rescan requested']
+            elif prev is None:
+                reason = ['not in baseline']
+            elif ChangeProbe.fingerprint(prev['probe'], shared) != ChangeProbe.fingerprint(probe, shared):
+                reason = probe_changes(prev['probe'], probe)
+            elif self.max_baseline_age and now - prev['scanned_at'] > float(self.max_baseline_age):
+                reason = ['baseline expired']
+            else:
+                self.store.save_probe(baseline, host, fingerprint, probe)
+                decide(host, {'status': 'unchanged', 'ports': prev['ports']})
+                continue
+            to_scan[host] = {'fingerprint': fingerprint, 'probe': probe, 'reason': reason}
+
+        scan_started = time.monotonic()
+        if to_scan:
+            for result in self.info_gathering.run_nmap_batch(list(to_scan), refresh=True):
+                host = result['target']
+                pending = to_scan.get(host)
+                if pending is None:
+                    continue
+                prev = previous.get(host)
+                if result.get('error') and not result.get('parsed_output'):
+                    decide(host, {'status': 'failed', 'reason': pending['reason'], 'error': result['error']})
+                    continue
+                ports = compact_ports(result.get('parsed_output') or {})
+                self.store.save_scan(baseline, host, pending['fingerprint'], pending['probe'], ports)
+                entry = {'status': 'new' if prev is None else 'changed', 'reason': pending['reason'], 'ports': ports}
+                if prev is not None:
+                    entry.update(diff_ports(prev['ports'], ports))
+                    if not (entry['opened'] or entry['closed'] or entry['service_changes']):
+                        entry['status'] = 'rescanned'
+                decide(host, entry)
+        scan_elapsed = round(time.monotonic() - scan_started, 3)
+
+        summary = {status: 0 for status in (
+            'new', 'changed', 'rescanned', 'unchanged', 'down', 'unreachable', 'unresolved', 'failed'
+        )}
+        for entry in report_hosts.values():
+            summary[entry['status']] += 1
+        summary.update({
+            'hosts': len(hosts),
+            'full_scans': len(to_scan),
+            'skipped_scans': summary['unchanged'],
+            'probe_elapsed': probe_elapsed,
+            'scan_elapsed': scan_elapsed,
+            'elapsed': round(time.monotonic() - started, 3)
+        })
+        logger.info(
+            f"Rescan of baseline '{baseline}': {len(to_scan)} full scans, "
+            f"{summary['unchanged']} hosts unchanged, {summary['elapsed']}s"
+        )
+        return {
+            'baseline': baseline,
+            'mode': 'incremental' if incremental else 'full',
+            'timestamp': datetime.now().isoformat(),
+            'summary': summary,
+            'hosts': {host: report_hosts[host] for host in hosts if host in report_hosts}
+        }
@@ -0,0 +1,240 @@
+"""
+Batched tool installation: one package index refresh, one apt transaction
+"""
+
+import logging
+import os
+import re
+import shutil
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from src.utils.async_runner import run_async, run_command
+
+logger = logging.getLogger('HackFusion')
+
+ProgressCallback = Callable[[str, str, Dict[str, Any]], None]
+
+# Package states reported to the progress callback
+PENDING = 'pending'
+UNPACKING = 'unpacking'
+INSTALLED = 'installed'
+ALREADY_INSTALLED = 'already_installed'
+NOT_FOUND = 'not_found'
+FAILED = 'failed'
+
+_DONE = (INSTALLED, ALREADY_INSTALLED)
+
+# apt-get output runs under LC_ALL=C, so these messages are stable
+_UNPACKING = re.compile(r'^Unpacking ([^\s:]+)(?::\S+)? ')
+_SETTING_UP = re.compile(r'^Setting up ([^\s:]+)(?::\S+)? ')
+_NEWEST = re.compile(r'^([^\s:]+)(?::\S+)? is already the newest version')
+_NOT_FOUND = (
+    re.compile(r'^E: Unable to locate package (\S+)'),
+    re.compile(r"^E: Package '([^']+)' has no installation candidate"),
+)
+
+
+class InstallPlanner:
+    """
+    Install many tools with a single apt transaction
+
+    plan() resolves tools to the full, de-duplicated package set (tool
+    packages plus their dependencies). execute() refreshes the package index
+    once, installs everything in one ``apt-get install`` and reports each
+    package's progress as apt works through it. Packages apt cannot locate
+    would abort the whole transaction, so they are dropped and the remaining
+    packages retried once without another index refresh.
+    """
+
+    def __init__(
+        self,
+        tools: Dict[str, Dict[str, Any]],
+        dependencies: Optional[Dict[str, List[str]]] = None,
+        apt_get: str = 'apt-get',
+        use_sudo: Optional[bool] = None,
+        update: bool = True,
+        update_timeout: float = 900,
+        install_timeout: float = 3600
+    ):
+        """
+        Initialize the planner
+
+        Args:
+            tools: Tool name -> info with a 'package' key (KaliToolsManager.REQUIRED_TOOLS)
+            dependencies: Tool name -> extra packages it needs
+            apt_get: apt-get executable, looked up on PATH
+            use_sudo: Prefix commands with ``sudo -n`` (default: when not root)
+            update: Refresh the package index before installing
+            update_timeout: Seconds allowed for apt-get update
+            install_timeout: Seconds allowed for the install transaction
+        """
+        self.tools = tools
+        self.dependencies = dict(dependencies or {})
+        self.apt_get = apt_get
+        if use_sudo is None:
+            use_sudo = os.geteuid() != 0 and shutil.which('sudo') is not None
+        self.use_sudo = use_sudo
+        self.update = update
+        self.update_timeout = update_timeout
+        self.install_timeout = install_timeout
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Dict[str, Any],
+        tools: Dict[str, Dict[str, Any]],
+        dependencies: Optional[Dict[str, List[str]]] = None
+    ) -> 'InstallPlanner':
+        """Build a planner from the installer configuration section"""
+        use_sudo = config.get('sudo', 'auto')
+        return cls(
+            tools,
+            dependencies=dependencies if config.get('include_dependencies', True) else None,
+            apt_get=config.get('apt_get', 'apt-get'),
+            use_sudo=None if use_sudo == 'auto' else bool(use_sudo),
+            update=bool(config.get('update', True)),
+            update_timeout=float(config.get('update_timeout', 900)),
+            install_timeout=float(config.get('install_timeout', 3600))
+        )
+
+    def plan(self, tools: Iterable[str]) -> Dict[str, Any]:
+        """
+        Resolve tools to the packages that have to be installed
+
+        Args:
+            tools: Tool names
+
+        Returns:
+            tools (tool -> its packages, its own package last), packages
+            (unique, in install order) and unknown (tools without a known package)
+        """
+        per_tool: Dict[str, List[str]] = {}
+        packages: Dict[str, None] = {}
+        unknown = []
+        for tool in dict.fromkeys(tools):
+            info = self.tools.get(tool)
+            if not info or not info.get('package'):
+                unknown.append(tool)
+                continue
+            needed = [dep for dep in dict.fromkeys(self.dependencies.get(tool, [])) if dep != info['package']]
+            needed.append(info['package'])
+            per_tool[tool] = needed
+            packages.update(dict.fromkeys(needed))
+        return {'tools': per_tool, 'packages': list(packages), 'unknown': unknown}
+
+    def _command(self, *args: str) -> List[str]:
+        prefix = ['sudo', '-n'] if self.use_sudo else []
+        # env keeps the settings across sudo, which resets the environment
+        return prefix + ['env', 'DEBIAN_FRONTEND=noninteractive', 'LC_ALL=C', self.apt_get] + list(args)
+
+    def execute(self, plan: Dict[str, Any], on_progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+        """
+        Run a plan: one index refresh, one install transaction
+
+        Args:
+            plan: Result of plan()
+            on_progress: Called as on_progress(package, state, report) whenever
+                         a package changes state
+
+        Returns:
+            Report with status, update and install command results, the state
+            of every package and whether each tool's packages all installed
+        """
+        packages = {package: {'status': PENDING} for package in plan['packages']}
+        report: Dict[str, Any] = {
+            'status': 'success',
+            'packages': packages,
+            'tools': {},
+            'unknown': list(plan.get('unknown', [])),
+            'update': None,
+            'install': []
+        }
+        if not packages:
+            report['tools'] = {tool: False for tool in plan.get('tools', {})}
+            return report
+
+        def set_state(package: str, state: str):
+            entry = packages.get(package)
+            if entry is None or entry['status'] == state or entry['status'] in _DONE:
+                return
+            entry['status'] = state
+            if on_progress is not None:
+                try:
+                    on_progress(package, state, report)
+                except Exception as e:
+                    logger.debug(f"Install progress callback failed: {e}")
+
+        def on_line(line: str):
+            line = line.strip()
+            for pattern, state in ((_SETTING_UP, INSTALLED), (_UNPACKING, UNPACKING), (_NEWEST, ALREADY_INSTALLED)):
+                match = pattern.match(line)
+                if match:
+                    set_state(match.group(1), state)
+                    return
+            for pattern in _NOT_FOUND:
+                match = pattern.match(line)
+                if match:
+                    set_state(match.group(1), NOT_FOUND)
+                    return
+
+        if self.update:
+            report['update'] = self._run(['update', '-q'], self.update_timeout)
+            if report['update']['status'] != 'success':
+                # A stale index can still satisfy the install; apt says so if not
+                logger.warning(f"apt-get update failed: {report['update'].get('error') or report['update'].get('stderr')}")
+
+        # One transaction, plus one retry without packages apt cannot locate
+        for _ in range(2):
+            batch = [package for package, entry in packages.items() if entry['status'] not in _DONE + (NOT_FOUND,)]
+            if not batch:
+                break
+            logger.info(f"Installing {len(batch)} packages in one transaction: {' '.join(batch)}")
+            result = self._run(['install', '-y', '-q'] + batch, self.install_timeout, on_line)
+            report['install'].append(result)
+            if result['status'] == 'success':
+                # apt names every requested package it handles; anything unnamed is in place
+                for package in batch:
+                    set_state(package, INSTALLED)
+                break
+            if not any(packages[package]['status'] == NOT_FOUND for package in batch):
+                break
+
+        for package, entry in packages.items():
+            if entry['status'] not in _DONE + (NOT_FOUND,):
+                set_state(package, FAILED)
+
+        # A dependency apt cannot locate (renamed or dropped from the
+        # distribution) does not fail a tool whose own package installed
+        report['tools'] = {
+            tool: packages[needed[-1]]['status'] in _DONE and all(
+                packages[package]['status'] in _DONE + (NOT_FOUND,) for package in needed[:-1]
+            )
+            for tool, needed in plan['tools'].items()
+        }
+        if not all(report['tools'].values()) or report['unknown']:
+            report['status'] = 'partial' if any(report['tools'].values()) else 'error'
+        return report
+
+    def install(self, tools: Iterable[str], on_progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+        """
+        Plan and execute the installation of tools
+
+        Args:
+            tools: Tool names
+            on_progress: See execute()
+
+        Returns:
+            Report from execute() with the plan under 'plan'
+        """
+        plan = self.plan(tools)
+        report = self.execute(plan, on_progress)
+        report['plan'] = plan
+        return report
+
+    def _run(self, args: List[str], timeout: float, on_line: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        cmd = self._command(*args)
+        started = time.monotonic()
+        result = run_async(run_command(cmd, timeout=timeout, on_stdout=on_line, on_stderr=on_line))
+        result['duration'] = round(time.monotonic() - started, 3)
+        return result
@@ -2,14 +2,15 @@
 Kali Linux Tools Manager
 """
 
-import os
 import subprocess
-import time
-import json
 import logging
 from typing import List, Dict, Optional, Any
 import shutil
 from rich.console import Console
+from src.utils.config_loader import ConfigLoader
+from src.utils.install_planner import FAILED, NOT_FOUND, PENDING, UNPACKING, InstallPlanner, ProgressCallback
+from src.utils.tool_availability import get_tool_availability
+from src.utils.tool_telemetry import get_telemetry_store
 
 class KaliToolsManager:
     """Advanced Kali Linux Tools Manager with Optimization"""
@@ -281,66 +282,48 @@ class KaliToolsManager:
         }
     }
 
+    # Extra packages installed alongside a tool's own package
+    TOOL_DEPENDENCIES = {
+        'nmap': ['libpcap0.8', 'libssl1.1'],
+        'metasploit': ['ruby', 'postgresql'],
+        'sqlmap': ['python3', 'python3-pip'],
+        'hydra': ['libssl-dev', 'libssh-dev'],
+        'aircrack-ng': ['wireless-tools', 'iw'],
+        'john': ['libssl-dev'],
+        'hashcat': ['opencl-headers']
+    }
+
     def __init__(self):
         """Initialize Kali Tools Manager with advanced tracking"""
         self.console = Console()
         self.logger = logging.getLogger(__name__)
         
-        # Performance tracking
-        self.tool_performance = {}
-        self.optimization_config_path = os.path.expanduser('~/.hackfusion/tool_optimization.json')
+        # Execution telemetry (append-only, shared process-wide)
+        self.telemetry = get_telemetry_store()
+        self._executions: Dict[str, int] = {}
         
-        # Load existing optimization data
-        self.load_tool_optimization()
+        # Shared, persisted availability cache
+        self.availability = get_tool_availability()
         
         # Check Kali Linux
         self.is_kali = self._check_kali_linux()
         if not self.is_kali:
             self.console.print("[yellow]Warning: Not running on Kali Linux. Some features may be limited.[/yellow]")
     
-    def load_tool_optimization(self):
-        """Load tool optimization data from persistent storage"""
-        try:
-            os.makedirs(os.path.dirname(self.optimization_config_path), exist_ok=True)
-            if os.path.exists(self.optimization_config_path):
-                with open(self.optimization_config_path, 'r') as f:
-                    self.tool_performance = json.load(f)
-        except Exception as e:
-            self.logger.warning(f"Could not load tool optimization data: {e}")
-    
-    def save_tool_optimization(self):
-        """Save tool optimization data to persistent storage"""
-        try:
-            with open(self.optimization_config_path, 'w') as f:
-                json.dump(self.tool_performance, f, indent=4)
-        except Exception as e:
-            self.logger.error(f"Could not save tool optimization data: {e}")
-    
-    def optimize_tool_performance(self, tool_name: str, execution_time: float):
+    def optimize_tool_performance(self, tool_name: str, execution_time: float, **fields):
         """
-        Track and optimize tool performance
+        Record a tool execution and periodically suggest optimizations
         
         :param tool_name: Name of the tool
         :param execution_time: Time taken to execute the tool
+        :param fields: Extra telemetry (exit_code, output_bytes, target_class, args, status)
         """
-        if tool_name not in self.tool_performance:
-            self.tool_performance[tool_name] = {
-                'total_executions': 0,
-                'total_time': 0,
-                'average_time': 0,
-                'last_optimized': time.time()
-            }
-        
-        data = self.tool_performance[tool_name]
-        data['total_executions'] += 1
-        data['total_time'] += execution_time
-        data['average_time'] = data['total_time'] / data['total_executions']
+        self.telemetry.record(tool_name, execution_time, **fields)
         
         # Periodic optimization suggestion
-        if data['total_executions'] % 10 == 0:
+        self._executions[tool_name] = self._executions.get(tool_name, 0) + 1
+        if self._executions[tool_name] % 10 == 0:
             self.suggest_tool_optimization(tool_name)
-        
-        self.save_tool_optimization()
     
     def suggest_tool_optimization(self, tool_name: str):
         """
@@ -348,12 +331,12 @@ class KaliToolsManager:
         
         :param tool_name: Name of the tool
         """
-        data = self.tool_performance.get(tool_name, {})
-        avg_time = data.get('average_time', 0)
+        stats = self.telemetry.percentiles(tool_name)
+        p50 = stats.get('p50') or 0
         
-        if avg_time > 5:  # If average execution time is more than 5 seconds
+        if p50 > 5:  # If the median execution time is more than 5 seconds
             self.console.print(f"[yellow]Performance Optimization Suggestion for {tool_name}:[/yellow]")
-            self.console.print(f"- Average Execution Time: {avg_time:.2f} seconds")
+            self.console.print(f"- Execution Time: p50 {p50:.2f}s, p95 {stats['p95']:.2f}s, p99 {stats['p99']:.2f}s")
             self.console.print("- Consider updating tool configuration or using alternative flags")
     
     def check_tool_dependencies(self, tool_name: str) -> List[str]:
@@ -363,18 +346,8 @@ class KaliToolsManager:
         :param tool_name: Name of the tool
         :return: List of missing dependencies
         """
-        tool_dependencies = {
-            'nmap': ['libpcap0.8', 'libssl1.1'],
-            'metasploit': ['ruby', 'postgresql'],
-            'sqlmap': ['python3', 'python3-pip'],
-            'hydra': ['libssl-dev', 'libssh-dev'],
-            'aircrack-ng': ['wireless-tools', 'iw'],
-            'john': ['libssl-dev'],
-            'hashcat': ['opencl-headers']
-        }
-        
         missing_deps = []
-        for dep in tool_dependencies.get(tool_name, []):
+        for dep in self.TOOL_DEPENDENCIES.get(tool_name, []):
             if not shutil.which(dep):
                 missing_deps.append(dep)
         
@@ -387,18 +360,9 @@ class KaliToolsManager:
         :param tool_name: Name of the tool
         :return: Whether installation was successful
         """
-        # Check and install dependencies first
-        missing_deps = self.check_tool_dependencies(tool_name)
-        if missing_deps:
-            self.console.print(f"[yellow]Installing dependencies for {tool_name}:[/yellow]")
-            for dep in missing_deps:
-                try:
-                    subprocess.run(['sudo', 'apt-get', 'install', '-y', dep], check=True)
-                except subprocess.CalledProcessError:
-                    self.console.print(f"[red]Failed to install dependency: {dep}[/red]")
-        
-        # Then install the tool
-        return self.install_tool(tool_name)
+        if tool_name not in self.REQUIRED_TOOLS:
+            raise ValueError(f"Unknown tool: {tool_name}")
+        return self.install_tools([tool_name], include_dependencies=True)['status'] == 'success'
     
     def _check_kali_linux(self) -> bool:
         """Check if running on Kali Linux"""
@@ -420,80 +384,107 @@ class KaliToolsManager:
         except:
             return None
 
-    def check_tool(self, tool_name: str) -> bool:
-        """Check if a tool is installed"""
-        # First check if command exists in PATH
-        if shutil.which(tool_name):
-            return True
+    def check_tool(self, tool_name: str, refresh: bool = False) -> bool:
+        """
+        Check if a tool is installed
         
-        # If not in REQUIRED_TOOLS, use shutil.which as fallback
-        if tool_name not in self.REQUIRED_TOOLS:
+        :param tool_name: Name of the tool
+        :param refresh: Probe the tool again instead of trusting the cache
+        :return: Whether the tool is available
+        """
+        available = self.availability.check(tool_name, refresh=refresh)
+        if not available and tool_name not in self.REQUIRED_TOOLS:
             self.console.print(f"[yellow]Warning: Tool {tool_name} not in predefined list. Using basic check.[/yellow]")
-            return shutil.which(tool_name) is not None
-        
-        # Try running the check command
-        try:
-            check_command = self.REQUIRED_TOOLS[tool_name].get('check_command')
-            if check_command:
-                result = self._run_command(check_command)
-                return result is not None
-            return False
-        except Exception:
-            return False
+        return available
 
     def install_tool(self, tool_name: str) -> bool:
         """Install a Kali Linux tool"""
-        if not self.is_kali:
-            self.console.print("[red]Error: Tool installation is only supported on Kali Linux[/red]")
-            return False
-
         if tool_name not in self.REQUIRED_TOOLS:
             raise ValueError(f"Unknown tool: {tool_name}")
+        return self.install_tools([tool_name], include_dependencies=False)['status'] == 'success'
 
-        package = self.REQUIRED_TOOLS[tool_name]['package']
-        try:
-            # Update package list
-            self.console.print(f"[cyan]Updating package list...[/cyan]")
-            self._run_command("apt-get update", check_output=False)
+    def install_tools(
+        self,
+        tool_names: List[str],
+        include_dependencies: bool = True,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Install several tools in one apt transaction
+        
+        The package index is refreshed once and every package (and, if
+        requested, every dependency) is installed by a single apt-get run.
+        
+        :param tool_names: Names of the tools to install
+        :param include_dependencies: Also install TOOL_DEPENDENCIES packages
+        :param on_progress: Called as on_progress(package, state, report); prints progress when None
+        :return: Install report (status, per-package states, per-tool 'tools' and 'verified' results)
+        """
+        if not self.is_kali:
+            self.console.print("[red]Error: Tool installation is only supported on Kali Linux[/red]")
+            return {'status': 'error', 'error': 'Tool installation is only supported on Kali Linux'}
 
-            # Install package
-            self.console.print(f"[cyan]Installing {tool_name}...[/cyan]")
-            self._run_command(f"apt-get install -y {package}", check_output=False)
+        planner = InstallPlanner.from_config(
+            ConfigLoader().config.get('installer', {}),
+            self.REQUIRED_TOOLS,
+            self.TOOL_DEPENDENCIES if include_dependencies else None
+        )
+        plan = planner.plan(tool_names)
+        for tool in plan['unknown']:
+            self.console.print(f"[yellow]Warning: No package known for {tool}, skipping[/yellow]")
+        if not plan['packages']:
+            return {'status': 'error', 'error': 'Nothing to install', 'plan': plan, 'tools': {}, 'verified': {}}
 
-            # Verify installation
-            if self.check_tool(tool_name):
-                self.console.print(f"[green]{tool_name} installed successfully[/green]")
-                return True
-            else:
-                self.console.print(f"[red]Failed to verify {tool_name} installation[/red]")
-                return False
+        total = len(plan['packages'])
+        done = set()
 
+        def print_progress(package: str, state: str, report: Dict[str, Any]):
+            if state in (PENDING, UNPACKING):
+                return
+            done.add(package)
+            color = 'red' if state in (NOT_FOUND, FAILED) else 'green'
+            self.console.print(f"[{color}][{len(done)}/{total}] {package}: {state.replace('_', ' ')}[/{color}]")
+
+        self.console.print(f"[cyan]Installing {len(plan['tools'])} tools ({total} packages) in one transaction...[/cyan]")
+        try:
+            report = planner.execute(plan, on_progress or print_progress)
         except Exception as e:
-            self.console.print(f"[red]Error installing {tool_name}: {str(e)}[/red]")
-            return False
+            self.console.print(f"[red]Error installing tools: {str(e)}[/red]")
+            return {'status': 'error', 'error': str(e), 'plan': plan, 'tools': {}, 'verified': {}}
+        report['plan'] = plan
 
-    def check_all_tools(self) -> Dict[str, bool]:
-        """Check status of all required tools"""
-        status = {}
-        for tool in self.REQUIRED_TOOLS:
-            status[tool] = self.check_tool(tool)
-        return status
+        # apt's word is not enough: probe the installed tools again
+        report['verified'] = self.availability.check_many(plan['tools'], refresh=True)
+        for tool, verified in report['verified'].items():
+            if verified:
+                self.console.print(f"[green]{tool} installed successfully[/green]")
+            else:
+                self.console.print(f"[red]Failed to verify {tool} installation[/red]")
+        if not all(report['verified'].values()):
+            report['status'] = 'partial' if any(report['verified'].values()) else 'error'
+        return report
+
+    def check_all_tools(self, refresh: bool = False) -> Dict[str, bool]:
+        """
+        Check status of all required tools
+        
+        Cached results are reused; tools without one are probed in parallel.
+        
+        :param refresh: Probe every tool again instead of trusting the cache
+        :return: Mapping of tool name to availability
+        """
+        return self.availability.check_many(self.REQUIRED_TOOLS, refresh=refresh)
 
     def install_missing_tools(self) -> bool:
-        """Install all missing tools"""
+        """Install all missing tools with a single package index refresh and apt transaction"""
         if not self.is_kali:
             self.console.print("[red]Error: Tool installation is only supported on Kali Linux[/red]")
             return False
 
-        success = True
-        status = self.check_all_tools()
-        
-        for tool, installed in status.items():
-            if not installed:
-                if not self.install_tool(tool):
-                    success = False
-                    
-        return success
+        missing = [tool for tool, installed in self.check_all_tools().items() if not installed]
+        if not missing:
+            return True
+        return self.install_tools(missing)['status'] == 'success'
 
     def get_tool_info(self, tool_name: str) -> Dict:
         """Get information about a tool"""
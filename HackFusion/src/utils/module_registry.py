@@ -0,0 +1,152 @@
+"""
+Lazily imported and constructed tool modules
+"""
+
+import importlib
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger('HackFusion')
+
+
+class ModuleUnavailable(RuntimeError):
+    """A registered module could not be imported or constructed"""
+
+
+class _Entry:
+    __slots__ = ('name', 'target', 'factory', 'instance', 'lock', 'load_time', 'loader')
+
+    def __init__(self, name: str, target: str, factory: Optional[Callable[[], Dict[str, Any]]]):
+        self.name = name
+        self.target = target
+        self.factory = factory
+        self.instance: Any = None
+        self.lock = threading.Lock()
+        self.load_time: Optional[float] = None
+        self.loader: Optional[threading.Thread] = None
+
+
+class ModuleRegistry:
+    """
+    Tool modules that are imported and constructed on first use
+
+    Each module is registered as ``'package.module:ClassName'`` with a
+    factory returning its constructor keyword arguments, so neither the
+    import nor the constructor (tool checks, diagnostics) runs until a menu
+    or plan step asks for the module. A failed construction is not cached:
+    the next access tries again.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _Entry] = {}
+
+    def register(self, name: str, target: str, factory: Optional[Callable[[], Dict[str, Any]]] = None):
+        """
+        Register a module
+
+        Args:
+            name: Name the module is looked up by
+            target: 'package.module:ClassName' to import
+            factory: Returns the constructor keyword arguments (none if None)
+        """
+        self._entries[name] = _Entry(name, target, factory)
+
+    def get(self, name: str) -> Any:
+        """
+        Get a module, importing and constructing it on first use
+
+        Args:
+            name: Registered module name
+
+        Returns:
+            The module instance
+
+        Raises:
+            KeyError: If no module is registered under name
+            ModuleUnavailable: If the module could not be imported or constructed
+        """
+        entry = self._entries[name]
+        if entry.instance is not None:
+            return entry.instance
+        with entry.lock:
+            if entry.instance is None:
+                entry.instance = self._build(entry)
+        return entry.instance
+
+    def _build(self, entry: _Entry) -> Any:
+        """Import and construct a module (caller holds the entry lock)"""
+        module_path, class_name = entry.target.split(':')
+        started = time.perf_counter()
+        try:
+            cls = getattr(importlib.import_module(module_path), class_name)
+            instance = cls(**(entry.factory() if entry.factory else {}))
+        except Exception as e:
+            logger.error(f"Failed to initialize {entry.name} module: {e}")
+            raise ModuleUnavailable(f"{entry.name} module failed to initialize: {e}") from e
+        entry.load_time = time.perf_counter() - started
+        logger.debug(f"Initialized {entry.name} module in {entry.load_time:.2f}s")
+        return instance
+
+    def preload(self, names: Iterable[str]) -> List[threading.Thread]:
+        """
+        Start constructing modules in the background
+
+        A later get() waits for the background construction instead of
+        starting another. Failures are logged and retried by get().
+
+        Args:
+            names: Registered module names
+
+        Returns:
+            The started threads
+        """
+        threads = []
+        for name in dict.fromkeys(names):
+            entry = self._entries[name]
+            if entry.instance is not None or (entry.loader is not None and entry.loader.is_alive()):
+                continue
+            entry.loader = threading.Thread(target=self._preload, args=(name,), name=f'preload-{name}', daemon=True)
+            entry.loader.start()
+            threads.append(entry.loader)
+        return threads
+
+    def _preload(self, name: str):
+        try:
+            self.get(name)
+        except ModuleUnavailable:
+            pass
+
+    def loaded(self, name: str) -> bool:
+        """Whether a module has been constructed"""
+        return self._entries[name].instance is not None
+
+    def load_times(self) -> Dict[str, float]:
+        """Seconds each constructed module took to import and build"""
+        return {name: entry.load_time for name, entry in self._entries.items() if entry.load_time is not None}
+
+    def names(self) -> List[str]:
+        """Registered module names"""
+        return list(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+
+class lazy_module:
+    """
+    Class attribute resolving to a module from the instance's registry
+
+    ``info_gathering = lazy_module('info_gathering')`` on a class whose
+    instances have a ``modules`` ModuleRegistry makes ``self.info_gathering``
+    construct the module on first access.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj.modules.get(self.name)
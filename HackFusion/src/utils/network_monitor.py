@@ -0,0 +1,232 @@
+"""
+Background network diagnostics with a cached, TTL-bound snapshot
+"""
+
+import logging
+import socket
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.timeout_policy import run_tool_process
+
+logger = logging.getLogger('HackFusion')
+
+DEFAULT_TEST_DOMAINS = ('google.com', 'github.com', 'microsoft.com')
+DEFAULT_PING_TARGETS = (('8.8.8.8', 'Google DNS'), ('1.1.1.1', 'Cloudflare DNS'))
+
+
+def _run(cmd: List[str], timeout: float, target: Optional[str] = None) -> subprocess.CompletedProcess:
+    # timeout only applies until the command has enough recorded history
+    return run_tool_process(cmd, target=target, default=timeout)
+
+
+class NetworkMonitor:
+    """
+    Collect network diagnostics off the caller's thread and cache the report
+
+    Each check (interfaces, DNS, connectivity, routing, firewall) runs on its
+    own worker so a report takes as long as the slowest check rather than the
+    sum of all of them. A report is reused until it is older than ``ttl``;
+    concurrent requests for a new report share one collection.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        timeout: float = 10,
+        ping_count: int = 4,
+        test_domains: Tuple[str, ...] = DEFAULT_TEST_DOMAINS,
+        ping_targets: Tuple[Tuple[str, str], ...] = DEFAULT_PING_TARGETS
+    ):
+        """
+        Initialize the monitor
+
+        Args:
+            ttl: Seconds a snapshot stays fresh
+            timeout: Seconds allowed for each diagnostic command until the
+                     timeout policy has enough history for it
+            ping_count: Echo requests sent to each connectivity target
+            test_domains: Domains resolved to check DNS
+            ping_targets: (address, label) pairs pinged to check connectivity
+        """
+        self.ttl = ttl
+        self.timeout = timeout
+        self.ping_count = max(1, ping_count)
+        self.test_domains = tuple(test_domains)
+        self.ping_targets = tuple(tuple(target) for target in ping_targets)
+
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._collected_at = 0.0
+        self._lock = threading.Lock()
+        self._collecting: Optional[threading.Event] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'NetworkMonitor':
+        """Build a monitor from information_gathering.diagnostics"""
+        return cls(
+            ttl=float(config.get('ttl', 300)),
+            timeout=float(config.get('timeout', 10)),
+            ping_count=int(config.get('ping_count', 4)),
+            test_domains=tuple(config.get('test_domains') or DEFAULT_TEST_DOMAINS),
+            ping_targets=tuple(
+                (target['ip'], target.get('name', target['ip'])) for target in config['ping_targets']
+            ) if config.get('ping_targets') else DEFAULT_PING_TARGETS
+        )
+
+    def age(self) -> Optional[float]:
+        """Seconds since the last snapshot, or None if there is none"""
+        with self._lock:
+            return time.monotonic() - self._collected_at if self._snapshot is not None else None
+
+    def snapshot(self, max_age: Optional[float] = None, wait: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Get a diagnostics report, collecting one if the cached report is too old
+
+        Args:
+            max_age: Oldest acceptable report in seconds (defaults to the TTL)
+            wait: Block until a new report is ready; otherwise start collecting
+                  in the background and return whatever is cached (maybe None)
+
+        Returns:
+            Diagnostics report with a 'collected_at' timestamp and 'age' in seconds
+        """
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            fresh = self._snapshot is not None and time.monotonic() - self._collected_at <= max_age
+            if fresh:
+                return self._with_age(self._snapshot)
+            event = self._collecting
+            owner = event is None
+            if owner:
+                event = self._collecting = threading.Event()
+            cached = self._snapshot
+
+        if owner:
+            if wait:
+                self._collect(event)
+            else:
+                threading.Thread(target=self._collect, args=(event,), name='network-monitor', daemon=True).start()
+        if not wait:
+            return self._with_age(cached) if cached is not None else None
+
+        event.wait()
+        with self._lock:
+            return self._with_age(self._snapshot) if self._snapshot is not None else None
+
+    def refresh_in_background(self):
+        """Start collecting a new report without waiting for it, however fresh the cached one is"""
+        self.snapshot(max_age=0, wait=False)
+
+    def _with_age(self, report: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(report, age=round(time.monotonic() - self._collected_at, 1))
+
+    def _collect(self, event: threading.Event):
+        try:
+            report = self.collect()
+            with self._lock:
+                self._snapshot = report
+                self._collected_at = time.monotonic()
+        except Exception as e:
+            logger.error(f"Network diagnostics failed: {e}")
+        finally:
+            with self._lock:
+                self._collecting = None
+            event.set()
+
+    def collect(self) -> Dict[str, Any]:
+        """
+        Run every check now, in parallel, bypassing the cache
+
+        Returns:
+            Diagnostics report
+        """
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=5, thread_name_prefix='netdiag') as pool:
+            interfaces = pool.submit(self._interfaces)
+            dns = pool.submit(self._dns_resolution)
+            connectivity = pool.submit(self._connectivity)
+            routing = pool.submit(self._routing)
+            firewall = pool.submit(self._firewall)
+            report = {
+                'network_interfaces': interfaces.result(),
+                'dns_resolution': dns.result(),
+                'connectivity': connectivity.result(),
+                'routing': routing.result(),
+                'firewall': firewall.result(),
+            }
+        report['collected_at'] = time.time()
+        report['duration'] = round(time.monotonic() - started, 3)
+        logger.info(f"Network diagnostics collected in {report['duration']}s")
+        return report
+
+    def _interfaces(self) -> List[str]:
+        try:
+            return _run(['ip', 'addr'], self.timeout).stdout.strip().split('\n')
+        except Exception as e:
+            logger.error(f"Network interface detection failed: {e}")
+            return []
+
+    def _dns_resolution(self) -> Dict[str, Any]:
+        def resolve(domain: str) -> Dict[str, Any]:
+            try:
+                return {'resolved_ip': socket.gethostbyname(domain), 'status': 'success'}
+            except (socket.gaierror, UnicodeError) as e:
+                return {'status': 'failed', 'error': str(e)}
+
+        with ThreadPoolExecutor(max_workers=max(1, len(self.test_domains))) as pool:
+            return dict(zip(self.test_domains, pool.map(resolve, self.test_domains)))
+
+    def _connectivity(self) -> Dict[str, Any]:
+        def ping(target: Tuple[str, str]) -> Dict[str, Any]:
+            ip = target[0]
+            try:
+                result = _run(['ping', '-c', str(self.ping_count), ip], self.timeout, target=ip)
+                return {
+                    'ip': ip,
+                    'status': 'reachable' if result.returncode == 0 else 'unreachable',
+                    'output': result.stdout.strip()
+                }
+            except Exception as e:
+                return {'status': 'error', 'error': str(e)}
+
+        with ThreadPoolExecutor(max_workers=max(1, len(self.ping_targets))) as pool:
+            return {
+                target[1]: status
+                for target, status in zip(self.ping_targets, pool.map(ping, self.ping_targets))
+            }
+
+    def _routing(self) -> Dict[str, Any]:
+        try:
+            return {'default_routes': _run(['ip', 'route'], self.timeout).stdout.strip().split('\n')}
+        except Exception as e:
+            logger.error(f"Routing information detection failed: {e}")
+            return {}
+
+    def _firewall(self) -> Dict[str, Any]:
+        # -n: never block on a password prompt
+        try:
+            result = _run(['sudo', '-n', 'ufw', 'status'], self.timeout)
+            return {'ufw': result.stdout.strip() or result.stderr.strip()}
+        except Exception as e:
+            logger.error(f"Firewall status check failed: {e}")
+            return {}
+
+
+_shared_monitor: Optional[NetworkMonitor] = None
+_shared_lock = threading.Lock()
+
+
+def get_network_monitor() -> NetworkMonitor:
+    """Get the process-wide network monitor, built from config on first use"""
+    global _shared_monitor
+    if _shared_monitor is None:
+        with _shared_lock:
+            if _shared_monitor is None:
+                from src.utils.config_loader import ConfigLoader
+                _shared_monitor = NetworkMonitor.from_config(
+                    ConfigLoader().get_tool_config('information_gathering', 'diagnostics')
+                )
+    return _shared_monitor
@@ -0,0 +1,201 @@
+"""
+Compact data model for parsed nmap XML results
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+
+class Port:
+    """One scanned port and the service detected on it"""
+
+    __slots__ = ('number', 'protocol', 'state', 'service', 'product', 'version')
+
+    def __init__(
+        self,
+        number: Optional[str],
+        protocol: Optional[str],
+        state: str = 'unknown',
+        service: str = 'unknown',
+        product: Optional[str] = None,
+        version: Optional[str] = None
+    ):
+        self.number = number
+        self.protocol = protocol
+        self.state = state
+        self.service = service
+        self.product = product
+        self.version = version
+
+    @classmethod
+    def from_element(cls, element: ET.Element) -> 'Port':
+        """Build a port from a ``<port>`` element, visiting each child once"""
+        port = cls(element.get('portid'), element.get('protocol'))
+        for child in element:
+            if child.tag == 'state':
+                port.state = child.get('state', 'unknown')
+            elif child.tag == 'service':
+                port.service = child.get('name', 'unknown')
+                port.product = child.get('product')
+                port.version = child.get('version')
+        return port
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'number': self.number,
+            'protocol': self.protocol,
+            'state': self.state,
+            'service': self.service,
+            'product': self.product,
+            'version': self.version
+        }
+
+
+class Host:
+    """One scanned host with its ports and best OS match"""
+
+    __slots__ = ('addresses', 'hostnames', 'status', 'ports', 'os_name', 'os_accuracy')
+
+    def __init__(self):
+        self.addresses: List[tuple] = []
+        self.hostnames: List[str] = []
+        self.status = 'unknown'
+        self.ports: List[Port] = []
+        self.os_name: Optional[str] = None
+        self.os_accuracy: Optional[str] = None
+
+    @classmethod
+    def from_element(cls, element: ET.Element) -> 'Host':
+        """Build a host from a ``<host>`` element in a single walk over its children"""
+        host = cls()
+        for child in element:
+            tag = child.tag
+            if tag == 'status':
+                host.status = child.get('state', 'unknown')
+            elif tag == 'address':
+                host.addresses.append((child.get('addr'), child.get('addrtype')))
+            elif tag == 'hostnames':
+                host.hostnames.extend(name.get('name') for name in child if name.tag == 'hostname')
+            elif tag == 'ports':
+                host.ports.extend(Port.from_element(port) for port in child if port.tag == 'port')
+            elif tag == 'os' and host.os_name is None:
+                for match in child:
+                    if match.tag == 'osmatch':
+                        host.os_name = match.get('name', 'Unknown')
+                        host.os_accuracy = match.get('accuracy', 'N/A')
+                        break
+        return host
+
+    @property
+    def address(self) -> Optional[str]:
+        """Primary address (first listed, normally IPv4/IPv6)"""
+        return self.addresses[0][0] if self.addresses else None
+
+    def open_ports(self) -> List[Port]:
+        return [port for port in self.ports if port.state == 'open']
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Host record in the format produced by nmap_stream"""
+        return {
+            'addresses': [{'addr': addr, 'type': addr_type} for addr, addr_type in self.addresses],
+            'hostnames': list(self.hostnames),
+            'host_status': self.status,
+            'ports': [port.to_dict() for port in self.ports],
+            'os_detection': (
+                {'name': self.os_name, 'accuracy': self.os_accuracy}
+                if self.os_name is not None else None
+            )
+        }
+
+
+def aggregate_host_records(hosts: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build parsed_output from host records
+
+    Keeps the keys of the original single-host parser (open_ports, services,
+    os_detection, host_status) and adds every host under 'hosts'. Open port
+    and service entries carry the address of their host.
+
+    :param hosts: Host records (Host.to_dict format)
+    :return: parsed_output dictionary
+    """
+    parsed = {
+        'hosts': [],
+        'open_ports': [],
+        'services': [],
+        'os_detection': None,
+        'host_status': 'down'
+    }
+    for host in hosts:
+        address = host['addresses'][0]['addr'] if host.get('addresses') else None
+        parsed['hosts'].append(host)
+        if host.get('host_status') == 'up':
+            parsed['host_status'] = 'up'
+        if parsed['os_detection'] is None and host.get('os_detection'):
+            parsed['os_detection'] = host['os_detection']
+        for port in host.get('ports', []):
+            if port.get('state') != 'open':
+                continue
+            parsed['open_ports'].append(dict(port, host=address))
+            if port.get('service') not in (None, 'unknown'):
+                parsed['services'].append({
+                    'host': address,
+                    'port': port.get('number'),
+                    'protocol': port.get('protocol'),
+                    'name': port.get('service'),
+                    'product': port.get('product'),
+                    'version': port.get('version')
+                })
+    return parsed
+
+
+class NmapRun:
+    """All hosts of one nmap XML document"""
+
+    __slots__ = ('hosts', 'args', 'finished')
+
+    def __init__(self, hosts: Optional[List[Host]] = None, args: Optional[str] = None, finished: Optional[str] = None):
+        self.hosts = hosts if hosts is not None else []
+        self.args = args
+        self.finished = finished
+
+    def open_ports(self) -> List[tuple]:
+        """(host address, Port) pairs of every open port"""
+        return [(host.address, port) for host in self.hosts for port in host.open_ports()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """parsed_output dictionary (see aggregate_host_records)"""
+        return aggregate_host_records(host.to_dict() for host in self.hosts)
+
+
+def parse_nmap_xml(xml_output: Union[str, bytes]) -> NmapRun:
+    """
+    Parse a complete nmap ``-oX`` document in a single pass
+
+    Host elements are converted as soon as they close and then cleared, so
+    peak memory stays close to one host plus the resulting model.
+
+    :param xml_output: nmap XML output
+    :return: NmapRun with every host in the document
+    :raises ET.ParseError: If the document is not valid XML
+    """
+    data = xml_output.encode('utf-8') if isinstance(xml_output, str) else xml_output
+    run = NmapRun()
+    root = None
+    for event, element in ET.iterparse(io.BytesIO(data), events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = element
+                run.args = element.get('args')
+            continue
+        if element.tag == 'host':
+            run.hosts.append(Host.from_element(element))
+            element.clear()
+            try:
+                root.remove(element)
+            except ValueError:
+                pass
+        elif element.tag == 'finished':
+            run.finished = element.get('timestr')
+    return run
@@ -0,0 +1,160 @@
+"""
+Incremental nmap XML parsing from a live pipe
+"""
+
+import logging
+import subprocess
+import threading
+import time
+import xml.etree.ElementTree as ET
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src.utils.nmap_model import Host
+from src.utils.process_control import current_context, terminate_process_group, TaskCancelled
+
+logger = logging.getLogger('HackFusion')
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def parse_host_element(host: ET.Element) -> Dict[str, Any]:
+    """
+    Convert one nmap ``<host>`` element into a host record
+
+    :param host: Parsed ``<host>`` element
+    :return: Host record with addresses, status, ports and OS match
+    """
+    return Host.from_element(host).to_dict()
+
+
+class NmapXMLStream:
+    """
+    Feed-driven nmap XML parser that emits one record per closed ``<host>``
+
+    Each host element is cleared from the tree as soon as it has been
+    converted, so memory stays bounded by a single host regardless of how
+    large the scan is.
+    """
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+        self._root: Optional[ET.Element] = None
+        self.hosts_seen = 0
+
+    def feed(self, data) -> List[Dict[str, Any]]:
+        """
+        Feed a chunk of XML
+
+        :param data: Next chunk of nmap ``-oX`` output (bytes or str)
+        :return: Host records completed by this chunk
+        """
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Finish parsing and return any remaining host records"""
+        try:
+            self._parser.close()
+        except ET.ParseError as e:
+            # Truncated documents (e.g. a killed scan) still yield finished hosts
+            logger.warning(f"Incomplete nmap XML stream: {e}")
+        return self._drain()
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        records = []
+        for event, element in self._parser.read_events():
+            if event == 'start':
+                if self._root is None:
+                    self._root = element
+                continue
+            if element.tag == 'host':
+                records.append(parse_host_element(element))
+                self.hosts_seen += 1
+                element.clear()
+                try:
+                    # Drop the emptied element so the root does not grow
+                    self._root.remove(element)
+                except (AttributeError, ValueError):
+                    pass
+        return records
+
+
+def iter_nmap_hosts(
+    cmd: List[str],
+    env: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    on_host: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run nmap with ``-oX -`` and yield host records while the scan is running
+
+    The process runs in its own process group and is owned by the
+    thread-bound task context, so cancelling the task stops the scan.
+
+    :param cmd: Full nmap command, must write XML to stdout
+    :param env: Environment for the child process
+    :param timeout: Seconds before the scan is killed
+    :param on_host: Optional callback invoked with each host record
+    :return: Iterator of host records; the generator returns nmap's exit code
+    """
+    context = current_context()
+    if context is not None:
+        context.raise_if_cancelled()
+
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=env,
+        start_new_session=True
+    )
+    if context is not None:
+        context.register(proc)
+
+    timed_out = threading.Event()
+    timer = None
+    if timeout:
+        def expire():
+            timed_out.set()
+            terminate_process_group(proc)
+        timer = threading.Timer(timeout, expire)
+        timer.daemon = True
+        timer.start()
+
+    stream = NmapXMLStream()
+    started = time.monotonic()
+    try:
+        while True:
+            # read1 returns whatever is available instead of waiting for a full chunk
+            chunk = proc.stdout.read1(_CHUNK_SIZE)
+            if not chunk:
+                break
+            for record in stream.feed(chunk):
+                if on_host:
+                    on_host(record)
+                yield record
+        for record in stream.close():
+            if on_host:
+                on_host(record)
+            yield record
+        proc.wait()
+    finally:
+        if timer is not None:
+            timer.cancel()
+        if proc.poll() is None:
+            # Consumer stopped early or an error occurred
+            terminate_process_group(proc)
+        if context is not None:
+            context.unregister(proc)
+
+    if context is not None and context.cancelled:
+        raise TaskCancelled(context.task_id)
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+    logger.info(
+        f"nmap stream finished: {stream.hosts_seen} hosts in "
+        f"{time.monotonic() - started:.1f}s (exit code {proc.returncode})"
+    )
+    return proc.returncode
@@ -0,0 +1,219 @@
+"""
+Single-pass output parsing for tool wrappers
+
+Each tool declares its fields once as an OutputParser. The field patterns
+are compiled at import time into one alternation, so the output is scanned
+once in C instead of once per field (or split and searched line by line in
+Python). Fields must match within a single line.
+"""
+
+import copy
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+FIRST = 'first'    # keep the first match
+ALL = 'all'        # append every match
+EXTEND = 'extend'  # extend a list with every match (build returns a list)
+
+
+class Field:
+    """One value extracted from tool output"""
+
+    __slots__ = ('key', 'pattern', 'mode', 'build', 'ignore_case', 'path')
+
+    def __init__(
+        self,
+        key: str,
+        pattern: str,
+        mode: str = FIRST,
+        build: Optional[Callable[[Tuple[Optional[str], ...]], Any]] = None,
+        ignore_case: bool = False
+    ):
+        """
+        Declare a field
+
+        :param key: Result key; dots address nested dicts (``registrant.name``)
+        :param pattern: Regular expression matched within one line
+        :param mode: FIRST, ALL or EXTEND
+        :param build: Turns the pattern's groups into the stored value
+                      (default: the single group, or the tuple of groups)
+        :param ignore_case: Match this field case-insensitively
+        """
+        if mode not in (FIRST, ALL, EXTEND):
+            raise ValueError(f"Unknown field mode: {mode}")
+        self.key = key
+        self.pattern = pattern
+        self.mode = mode
+        self.build = build
+        self.ignore_case = ignore_case
+        self.path = key.split('.')
+
+
+class OutputParser:
+    """
+    Parse tool output in one pass with a compiled alternation of all fields
+
+    Each line yields at most one match (the leftmost, earliest-declared
+    field), like a per-line ``re.search``. When every field is FIRST, parsing
+    stops as soon as all of them are found.
+    """
+
+    def __init__(self, fields: Sequence[Field], template: Optional[Dict[str, Any]] = None, anchored: bool = False):
+        """
+        Compile a parser
+
+        :param fields: Field declarations
+        :param template: Initial result (deep-copied for each parse); missing
+                         top-level keys start as None (FIRST) or [], nested
+                         FIRST keys are only added once matched
+        :param anchored: Fields only match at the start of a line, after
+                         optional indentation, which lets the scanner reject
+                         every other position with a single check
+        """
+        self.fields = list(fields)
+        self.template = copy.deepcopy(template) if template is not None else {}
+        for field in self.fields:
+            node = self.template
+            for part in field.path[:-1]:
+                node = node.setdefault(part, {})
+            if field.mode != FIRST:
+                node.setdefault(field.path[-1], [])
+            elif len(field.path) == 1:
+                node.setdefault(field.path[-1], None)
+
+        alternatives = []
+        # group name -> (field, index of its first group, index past its last group)
+        self._groups: Dict[str, Tuple[Field, int, int]] = {}
+        next_group = 1
+        for idx, field in enumerate(self.fields):
+            inner = re.compile(field.pattern).groups
+            name = f"_f{idx}"
+            body = f"(?i:{field.pattern})" if field.ignore_case else f"(?:{field.pattern})"
+            alternatives.append(f"(?P<{name}>{body})")
+            self._groups[name] = (field, next_group, next_group + inner)
+            next_group += inner + 1
+        combined = '|'.join(alternatives)
+        if anchored:
+            combined = rf"^[ \t]*(?:{combined})"
+        self.regex = re.compile(combined, re.MULTILINE)
+        self._all_first = all(field.mode == FIRST for field in self.fields)
+
+        # A lone field needs no alternation, so findall can hand back its
+        # groups directly without a Python-level step per match
+        self._single: Optional['re.Pattern'] = None
+        if len(self.fields) == 1:
+            body = alternatives[0][len('(?P<_f0>'):-1]
+            self._single = re.compile(rf"^[ \t]*{body}" if anchored else body, re.MULTILINE)
+
+    def new_result(self) -> Dict[str, Any]:
+        return copy.deepcopy(self.template)
+
+    def parse(self, output: str) -> Dict[str, Any]:
+        """
+        Parse a complete output
+
+        :param output: Raw tool output
+        :return: Parsed result
+        """
+        result = self.new_result()
+        self._scan(result, output or '', set())
+        return result
+
+    def parse_lines(self, lines: Iterable[str]) -> Dict[str, Any]:
+        """
+        Parse output line by line, e.g. straight from a process pipe
+
+        :param lines: Output lines
+        :return: Parsed result
+        """
+        result = self.new_result()
+        found: set = set()
+        for line in lines:
+            if self._scan(result, line, found):
+                break
+        return result
+
+    def _scan(self, result: Dict[str, Any], text: str, found: set) -> bool:
+        """Store the matches in text; returns True once every FIRST field is set"""
+        if self._single is not None:
+            return self._scan_single(result, text, found)
+
+        groups = self._groups
+        for match in self.regex.finditer(text):
+            field, start, end = groups[match.lastgroup]
+            if field.mode == FIRST and field.key in found:
+                continue
+            # Fields without groups store the whole match
+            values = match.groups()[start:end] or (match.group(match.lastgroup),)
+            value = field.build(values) if field.build else (values[0] if len(values) == 1 else values)
+
+            node = self._parent(result, field)
+            if field.mode == FIRST:
+                node[field.path[-1]] = value
+                found.add(field.key)
+                if self._all_first and len(found) == len(self.fields):
+                    return True
+            elif field.mode == ALL:
+                node[field.path[-1]].append(value)
+            else:
+                node[field.path[-1]].extend(value)
+        return False
+
+    def _scan_single(self, result: Dict[str, Any], text: str, found: set) -> bool:
+        field = self.fields[0]
+        node = self._parent(result, field)
+        leaf = field.path[-1]
+        tuples = self._single.groups > 1
+
+        if field.mode == FIRST:
+            if field.key in found:
+                return True
+            match = self._single.search(text)
+            if match is None:
+                return False
+            values = match.groups() if tuples else (match.group(match.lastindex or 0),)
+            node[leaf] = field.build(values) if field.build else (values if tuples else values[0])
+            found.add(field.key)
+            return True
+
+        matches = self._single.findall(text)
+        if field.build is not None:
+            build = field.build
+            matches = [build(groups) for groups in matches] if tuples else [build((value,)) for value in matches]
+        if field.mode == ALL:
+            node[leaf].extend(matches)
+        else:
+            for value in matches:
+                node[leaf].extend(value)
+        return False
+
+    @staticmethod
+    def _parent(result: Dict[str, Any], field: Field) -> Dict[str, Any]:
+        node = result
+        for part in field.path[:-1]:
+            node = node[part]
+        return node
+
+
+_PARSERS: Dict[str, OutputParser] = {}
+
+
+def register_parser(name: str, parser: OutputParser) -> OutputParser:
+    """
+    Register a parser under a tool name
+
+    :param name: Tool name
+    :param parser: Compiled parser
+    :return: The parser, so declarations can be assigned in one statement
+    """
+    _PARSERS[name] = parser
+    return parser
+
+
+def get_parser(name: str) -> Optional[OutputParser]:
+    """Parser registered for a tool, or None"""
+    return _PARSERS.get(name)
+
+
+def registered_parsers() -> List[str]:
+    return sorted(_PARSERS)
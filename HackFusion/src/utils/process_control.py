@@ -0,0 +1,227 @@
+"""
+Process-group aware subprocess execution with task cancellation
+"""
+
+import logging
+import os
+import signal
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+logger = logging.getLogger('HackFusion')
+
+# How often a blocked run_process() checks whether its task was cancelled
+_POLL_INTERVAL = 0.2
+
+_local = threading.local()
+
+
+class TaskCancelled(BaseException):
+    """
+    Raised inside a task whose cancellation was requested
+
+    Derives from BaseException, like asyncio.CancelledError, so the broad
+    ``except Exception`` handlers in the tool wrappers do not swallow it.
+    """
+
+
+def terminate_process_group(proc: subprocess.Popen, grace_period: float = 5.0):
+    """
+    Send SIGTERM to a process group and SIGKILL it if still alive after the grace period
+
+    Escalation and reaping happen on a background timer so the caller returns at once.
+
+    Args:
+        proc: Process started with start_new_session=True
+        grace_period: Seconds to wait before escalating to SIGKILL
+    """
+    if proc.poll() is not None:
+        return
+
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    except Exception as e:
+        logger.warning(f"SIGTERM to process group {proc.pid} failed: {str(e)}")
+        proc.terminate()
+
+    def escalate():
+        if proc.poll() is None:
+            logger.warning(f"Process group {proc.pid} ignored SIGTERM, sending SIGKILL")
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            except Exception as e:
+                logger.warning(f"SIGKILL to process group {proc.pid} failed: {str(e)}")
+                proc.kill()
+        try:
+            proc.wait(timeout=grace_period)
+        except Exception:
+            pass
+        for stream in (proc.stdout, proc.stderr):
+            try:
+                if stream:
+                    stream.close()
+            except Exception:
+                pass
+
+    timer = threading.Timer(grace_period, escalate)
+    timer.daemon = True
+    timer.start()
+
+
+class TaskContext:
+    """Cancellation flag and child processes owned by a single task"""
+
+    def __init__(self, task_id: Optional[str] = None, grace_period: float = 5.0):
+        """
+        Initialize task context
+
+        Args:
+            task_id: Identifier of the owning task, used for logging
+            grace_period: Seconds between SIGTERM and SIGKILL on cancel
+        """
+        self.task_id = task_id
+        self.grace_period = grace_period
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._processes: Dict[int, subprocess.Popen] = {}
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def register(self, proc: subprocess.Popen):
+        """Attach a child process; kills it right away if the task is already cancelled"""
+        with self._lock:
+            self._processes[proc.pid] = proc
+        if self.cancelled:
+            terminate_process_group(proc, self.grace_period)
+
+    def unregister(self, proc: subprocess.Popen):
+        """Detach a finished child process"""
+        with self._lock:
+            self._processes.pop(proc.pid, None)
+
+    def processes(self) -> List[subprocess.Popen]:
+        with self._lock:
+            return list(self._processes.values())
+
+    def cancel(self) -> bool:
+        """
+        Cancel the task and terminate every child process group it owns
+
+        Returns:
+            bool: True if this call performed the cancellation
+        """
+        if self._cancelled.is_set():
+            return False
+        self._cancelled.set()
+        for proc in self.processes():
+            logger.info(f"Terminating process group {proc.pid} of task {self.task_id}")
+            terminate_process_group(proc, self.grace_period)
+        return True
+
+    def raise_if_cancelled(self):
+        """Raise TaskCancelled if cancellation was requested"""
+        if self.cancelled:
+            raise TaskCancelled(self.task_id)
+
+
+def current_context() -> Optional[TaskContext]:
+    """Get the task context bound to the calling thread"""
+    return getattr(_local, 'context', None)
+
+
+@contextmanager
+def task_context(context: Optional[TaskContext]):
+    """Bind a task context to the calling thread for the duration of the block"""
+    previous = current_context()
+    _local.context = context
+    try:
+        yield context
+    finally:
+        _local.context = previous
+
+
+def run_process(
+    cmd: List[str],
+    timeout: Optional[float] = None,
+    env: Optional[Dict[str, str]] = None,
+    context: Optional[TaskContext] = None,
+    input: Optional[str] = None,
+    text: bool = True
+) -> subprocess.CompletedProcess:
+    """
+    Run a command in its own process group, honouring task cancellation
+
+    Drop-in replacement for ``subprocess.run(cmd, capture_output=True, text=True)``.
+    The child is owned by the given (or thread-bound) task context, so
+    cancelling the task kills the whole process group and makes this call
+    return immediately instead of waiting for the tool to finish.
+
+    Args:
+        cmd: Command to run as a list of strings
+        timeout: Timeout in seconds
+        env: Environment for the child process
+        context: Owning task context (defaults to the thread-bound one)
+        input: Optional text written to the child's stdin
+        text: Decode output as text; False returns bytes (binary output)
+
+    Returns:
+        subprocess.CompletedProcess with text (or bytes) stdout/stderr
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeded the timeout
+        TaskCancelled: If the owning task was cancelled
+    """
+    context = context or current_context()
+    if context is not None:
+        context.raise_if_cancelled()
+
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=text,
+        errors='replace' if text else None,
+        env=env,
+        start_new_session=True
+    )
+    if context is not None:
+        context.register(proc)
+
+    grace_period = context.grace_period if context is not None else 5.0
+    deadline = time.monotonic() + timeout if timeout else None
+    pending_input = input
+    try:
+        while True:
+            wait = _POLL_INTERVAL if context is not None else None
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.monotonic())
+                wait = remaining if wait is None else min(wait, remaining)
+            try:
+                stdout, stderr = proc.communicate(input=pending_input, timeout=wait)
+                break
+            except subprocess.TimeoutExpired:
+                pending_input = None
+                if context is not None and context.cancelled:
+                    terminate_process_group(proc, grace_period)
+                    raise TaskCancelled(context.task_id)
+                if deadline is not None and time.monotonic() >= deadline:
+                    terminate_process_group(proc, grace_period)
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+    finally:
+        if context is not None:
+            context.unregister(proc)
+
+    if context is not None and context.cancelled:
+        raise TaskCancelled(context.task_id)
+
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
@@ -0,0 +1,319 @@
+"""
+Process-wide cache of hostname resolutions with TTL and negative caching
+"""
+
+import asyncio
+import ipaddress
+import logging
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.async_dns import AsyncResolver
+from src.utils.async_runner import run_async
+
+logger = logging.getLogger('HackFusion')
+
+
+def _is_ip(value: str) -> bool:
+    try:
+        ipaddress.ip_address(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _hosts_file(path: str = '/etc/hosts') -> Dict[str, List[str]]:
+    entries: Dict[str, List[str]] = {}
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                parts = line.split('#', 1)[0].split()
+                if len(parts) < 2 or not _is_ip(parts[0]):
+                    continue
+                for name in parts[1:]:
+                    entries.setdefault(name.lower(), []).append(parts[0])
+    except OSError:
+        pass
+    return entries
+
+
+class ResolverCache:
+    """
+    Resolve hostnames once and share the answer across the process
+
+    Names are looked up in the hosts file, then over DNS with the async
+    resolver so the record TTL is known, and finally with getaddrinfo (search
+    domains, mDNS, ...). Positive answers live for their DNS TTL clamped to
+    [min_ttl, max_ttl]; failures are cached for the SOA negative TTL or
+    ``negative_ttl``. Concurrent lookups of the same name share one query.
+    """
+
+    def __init__(
+        self,
+        min_ttl: float = 30,
+        max_ttl: float = 3600,
+        negative_ttl: float = 60,
+        max_entries: int = 4096,
+        fallback_workers: int = 32,
+        resolver_config: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            min_ttl: Lower bound for positive TTLs (also used when no TTL is known)
+            max_ttl: Upper bound for positive TTLs
+            negative_ttl: Seconds to remember failed resolutions without an SOA
+            max_entries: Maximum cached names (least recently used are evicted)
+            fallback_workers: Threads used for concurrent getaddrinfo fallbacks
+            resolver_config: AsyncResolver settings (information_gathering.dns)
+        """
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max(1, max_entries)
+        self.fallback_workers = max(1, fallback_workers)
+        self.resolver_config = dict(resolver_config or {})
+
+        # name -> (expires, addresses); an empty list is a negative entry
+        self._entries: 'OrderedDict[str, Tuple[float, List[str]]]' = OrderedDict()
+        self._inflight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._hosts: Optional[Dict[str, List[str]]] = None
+        self._stats = {'hits': 0, 'negative_hits': 0, 'misses': 0, 'dns': 0, 'fallback': 0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], resolver_config: Optional[Dict[str, Any]] = None) -> 'ResolverCache':
+        """Build a cache from the resolver_cache configuration section"""
+        return cls(
+            min_ttl=float(config.get('min_ttl', 30)),
+            max_ttl=float(config.get('max_ttl', 3600)),
+            negative_ttl=float(config.get('negative_ttl', 60)),
+            max_entries=int(config.get('max_entries', 4096)),
+            fallback_workers=int(config.get('fallback_workers', 32)),
+            resolver_config=resolver_config
+        )
+
+    @staticmethod
+    def _key(host: str) -> str:
+        return host.strip().rstrip('.').lower()
+
+    def _cached(self, key: str) -> Optional[List[str]]:
+        """Fresh cached addresses (caller holds the lock), None on a miss"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        self._stats['hits' if entry[1] else 'negative_hits'] += 1
+        return entry[1]
+
+    def _store(self, key: str, addresses: List[str], ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, addresses)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def resolve_all(self, host: str) -> List[str]:
+        """
+        Resolve a hostname to all of its addresses (IPv4 first)
+
+        Args:
+            host: Hostname or IP address
+
+        Returns:
+            Addresses, or an empty list if the name does not resolve
+        """
+        if _is_ip(host.strip()):
+            return [host.strip()]
+        key = self._key(host)
+        if not key:
+            return []
+
+        while True:
+            with self._lock:
+                cached = self._cached(key)
+                if cached is not None:
+                    return list(cached)
+                event = self._inflight.get(key)
+                if event is None:
+                    event = self._inflight[key] = threading.Event()
+                    self._stats['misses'] += 1
+                    break
+            # Another thread is resolving this name; use its answer
+            event.wait()
+
+        try:
+            addresses, ttl = self._lookup(key)
+            self._store(key, addresses, ttl)
+            return list(addresses)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def resolve(self, host: str) -> Optional[str]:
+        """
+        Resolve a hostname like socket.gethostbyname, through the cache
+
+        Returns:
+            First address, or None if the name does not resolve
+        """
+        addresses = self.resolve_all(host)
+        return addresses[0] if addresses else None
+
+    def resolve_many(self, hosts: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Resolve many hostnames concurrently
+
+        Uncached names are queried over DNS in one async batch; names DNS
+        cannot answer fall back to getaddrinfo on a thread pool.
+
+        Args:
+            hosts: Hostnames or IP addresses
+
+        Returns:
+            Mapping of each input to its first address or None
+        """
+        hosts = list(dict.fromkeys(hosts))
+        results: Dict[str, Optional[str]] = {}
+        pending: Dict[str, List[str]] = {}
+        for host in hosts:
+            if _is_ip(host.strip()):
+                results[host] = host.strip()
+                continue
+            key = self._key(host)
+            with self._lock:
+                cached = self._cached(key)
+            if cached is not None:
+                results[host] = cached[0] if cached else None
+            elif key:
+                pending.setdefault(key, []).append(host)
+            else:
+                results[host] = None
+
+        if pending:
+            with self._lock:
+                self._stats['misses'] += len(pending)
+            resolved = self._lookup_batch(list(pending))
+            for key, (addresses, ttl) in resolved.items():
+                self._store(key, addresses, ttl)
+                for host in pending[key]:
+                    results[host] = addresses[0] if addresses else None
+
+        return {host: results.get(host) for host in hosts}
+
+    def _lookup(self, key: str) -> Tuple[List[str], float]:
+        return self._lookup_batch([key])[key]
+
+    def _lookup_batch(self, keys: List[str]) -> Dict[str, Tuple[List[str], float]]:
+        if self._hosts is None:
+            self._hosts = _hosts_file()
+
+        answers: Dict[str, Tuple[List[str], float]] = {}
+        dns_keys = []
+        for key in keys:
+            if key in self._hosts:
+                answers[key] = (self._hosts[key], self.max_ttl)
+            else:
+                dns_keys.append(key)
+
+        if dns_keys:
+            try:
+                answers.update(run_async(self._dns_batch(dns_keys)))
+            except Exception as e:
+                logger.warning(f"DNS batch resolution failed, using system resolver: {e}")
+
+        fallback = [key for key in keys if key not in answers]
+        if fallback:
+            with self._lock:
+                self._stats['fallback'] += len(fallback)
+            with ThreadPoolExecutor(max_workers=min(self.fallback_workers, len(fallback))) as pool:
+                for key, addresses in zip(fallback, pool.map(self._getaddrinfo, fallback)):
+                    answers[key] = (addresses, self.min_ttl if addresses else self.negative_ttl)
+        return answers
+
+    async def _dns_batch(self, keys: List[str]) -> Dict[str, Tuple[List[str], float]]:
+        """
+        Answer what DNS can answer definitively
+
+        Names without a dot (subject to search domains) and names whose
+        queries failed are left for getaddrinfo.
+        """
+        async with AsyncResolver.from_config(self.resolver_config) as resolver:
+            lookups = await asyncio.gather(*(resolver.lookup(key, ('A', 'AAAA')) for key in keys))
+
+        answers = {}
+        for key, by_type in zip(keys, lookups):
+            records = [
+                answer for qtype in ('A', 'AAAA')
+                for answer in by_type[qtype].get('answers', []) if answer['type'] == qtype
+            ]
+            if records:
+                ttl = min(answer['ttl'] for answer in records)
+                answers[key] = ([answer['data'] for answer in records], min(self.max_ttl, max(self.min_ttl, ttl)))
+            elif '.' in key and by_type['A']['status'] in ('NXDOMAIN', 'NOERROR') \
+                    and by_type['AAAA']['status'] in ('NXDOMAIN', 'NOERROR'):
+                # RFC 2308: negative answers live for min(SOA TTL, SOA minimum)
+                ttl = self.negative_ttl
+                for record in by_type['A'].get('authority', []):
+                    if record['type'] == 'SOA' and isinstance(record['data'], dict):
+                        ttl = min(record['ttl'], record['data']['minimum'], self.max_ttl)
+                answers[key] = ([], ttl)
+        with self._lock:
+            self._stats['dns'] += len(answers)
+        return answers
+
+    def _getaddrinfo(self, key: str) -> List[str]:
+        try:
+            infos = socket.getaddrinfo(key, None, proto=socket.IPPROTO_TCP)
+        except (socket.gaierror, UnicodeError, OSError):
+            return []
+        addresses = []
+        for family in (socket.AF_INET, socket.AF_INET6):
+            for info in infos:
+                if info[0] == family and info[4][0] not in addresses:
+                    addresses.append(info[4][0])
+        return addresses
+
+    def invalidate(self, host: Optional[str] = None):
+        """Forget one name, or every name when host is None"""
+        with self._lock:
+            if host is None:
+                self._entries.clear()
+                self._hosts = None
+            else:
+                self._entries.pop(self._key(host), None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and cache size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        return stats
+
+
+_shared_cache: Optional[ResolverCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_resolver_cache() -> ResolverCache:
+    """Get the process-wide resolver cache, built from config on first use"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                from src.utils.config_loader import ConfigLoader
+                config = ConfigLoader().config
+                _shared_cache = ResolverCache.from_config(
+                    config.get('resolver_cache', {}),
+                    resolver_config=config.get('information_gathering', {}).get('dns', {})
+                )
+    return _shared_cache
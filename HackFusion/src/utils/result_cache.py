@@ -0,0 +1,277 @@
+"""
+TTL result cache shared by tool wrappers
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger('HackFusion')
+
+_MISSING = object()
+
+
+def default_cacheable(result: Any) -> bool:
+    """Only successful (or partial), non-stale results are worth serving again"""
+    return (
+        isinstance(result, dict)
+        and not result.get('error')
+        and not result.get('stale')
+        and result.get('status') in ('success', 'partial')
+    )
+
+
+class ResultCache:
+    """
+    Two-tier cache of tool results keyed by tool, target and arguments
+
+    The memory tier is an LRU bounded by ``max_entries``. The optional disk
+    tier keeps results across runs as one JSON file per key. Every entry
+    expires after the TTL configured for its tool.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        default_ttl: float = 300,
+        ttls: Optional[Dict[str, float]] = None,
+        disk_dir: Optional[str] = None,
+        enabled: bool = True
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Maximum entries held in memory
+            default_ttl: TTL in seconds for tools without their own TTL
+            ttls: Per-tool TTL in seconds (0 disables caching for the tool)
+            disk_dir: Directory of the disk tier (None keeps the cache in memory only)
+            enabled: Master switch; a disabled cache always runs the tool
+        """
+        self.max_entries = max(1, max_entries)
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.disk_dir = os.path.expanduser(disk_dir) if disk_dir else None
+        self.enabled = enabled
+
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'bypassed': 0, 'stores': 0, 'evictions': 0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ResultCache':
+        """Build a cache from the result_cache configuration section"""
+        return cls(
+            max_entries=int(config.get('max_entries', 256)),
+            default_ttl=float(config.get('default_ttl', 300)),
+            ttls=config.get('ttl', {}),
+            disk_dir=config.get('disk_dir') if config.get('disk_enabled', False) else None,
+            enabled=config.get('enabled', True)
+        )
+
+    @staticmethod
+    def make_key(tool: str, target: str, args: Any = None) -> str:
+        """
+        Build a cache key from the tool, normalized target and normalized args
+
+        Targets are compared case-insensitively without surrounding whitespace
+        or a trailing dot. Argument strings are split into tokens and dicts are
+        sorted, so equivalent invocations share a key.
+        """
+        normalized_target = (target or '').strip().lower().rstrip('.')
+        if isinstance(args, str):
+            normalized_args: Any = args.split()
+        elif isinstance(args, dict):
+            normalized_args = {k: v for k, v in sorted(args.items()) if v is not None}
+        else:
+            normalized_args = args
+        payload = json.dumps([tool, normalized_target, normalized_args], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def ttl_for(self, tool: str) -> float:
+        """TTL in seconds for a tool"""
+        return float(self.ttls.get(tool, self.default_ttl))
+
+    def get(self, tool: str, target: str, args: Any = None) -> Any:
+        """
+        Look up a fresh cached result
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        value = self._lookup(self.make_key(tool, target, args))
+        if value is _MISSING:
+            with self._lock:
+                self._stats['misses'] += 1
+            return None
+        return value
+
+    def put(self, tool: str, target: str, args: Any, result: Any):
+        """Store a result for its tool's TTL"""
+        ttl = self.ttl_for(tool)
+        if not self.enabled or ttl <= 0:
+            return
+        key = self.make_key(tool, target, args)
+        expires = time.time() + ttl
+        with self._lock:
+            self._entries[key] = (expires, result)
+            self._entries.move_to_end(key)
+            self._stats['stores'] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+        if self.disk_dir:
+            self._write_disk(key, expires, result)
+
+    def cached(
+        self,
+        tool: str,
+        target: str,
+        args: Any,
+        compute: Callable[[], Any],
+        bypass: bool = False,
+        refresh: bool = False,
+        cacheable: Callable[[Any], bool] = default_cacheable
+    ) -> Any:
+        """
+        Return a cached result or compute and store a fresh one
+
+        Args:
+            tool: Tool name (selects the TTL)
+            target: Scan target
+            args: Tool arguments
+            compute: Runs the tool when there is no usable cached result
+            bypass: Run the tool without reading or writing the cache
+            refresh: Run the tool and overwrite any cached result
+            cacheable: Predicate deciding whether a computed result is stored
+
+        Returns:
+            Tool result; cache hits carry a 'cache' annotation
+        """
+        if bypass or not self.enabled or self.ttl_for(tool) <= 0:
+            with self._lock:
+                self._stats['bypassed'] += 1
+            return compute()
+
+        key = self.make_key(tool, target, args)
+        if not refresh:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                if isinstance(value, dict):
+                    value = dict(value, cache={'hit': True, 'tool': tool})
+                return value
+
+        with self._lock:
+            self._stats['misses'] += 1
+        result = compute()
+        if cacheable(result):
+            self.put(tool, target, args, result)
+        return result
+
+    def _lookup(self, key: str) -> Any:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return entry[1]
+                del self._entries[key]
+
+        if not self.disk_dir:
+            return _MISSING
+        entry = self._read_disk(key)
+        if entry is None:
+            return _MISSING
+        expires, value = entry
+        if expires <= now:
+            self._remove_disk(key)
+            return _MISSING
+        with self._lock:
+            # Promote to the memory tier
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+            self._stats['disk_hits'] += 1
+        return value
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _write_disk(self, key: str, expires: float, result: Any):
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'expires': expires, 'result': result}, f, default=str)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write result cache entry: {e}")
+
+    def _read_disk(self, key: str) -> Optional[Tuple[float, Any]]:
+        try:
+            with open(self._disk_path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            return float(entry['expires']), entry['result']
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable result cache entry {key}: {e}")
+            self._remove_disk(key)
+            return None
+
+    def _remove_disk(self, key: str):
+        try:
+            os.remove(self._disk_path(key))
+        except OSError:
+            pass
+
+    def invalidate(self, tool: str, target: str, args: Any = None):
+        """Drop one cached result from both tiers"""
+        key = self.make_key(tool, target, args)
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.disk_dir:
+            self._remove_disk(key)
+
+    def clear(self):
+        """Drop every cached result from both tiers"""
+        with self._lock:
+            self._entries.clear()
+        if self.disk_dir and os.path.isdir(self.disk_dir):
+            for name in os.listdir(self.disk_dir):
+                if name.endswith('.json'):
+                    self._remove_disk(name[:-len('.json')])
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and memory tier size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        lookups = stats['hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['hits'] + stats['disk_hits']) / lookups, 3) if lookups else 0.0
+        return stats
+
+
+_shared_cache: Optional[ResultCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """Get the process-wide result cache, built from config on first use"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                from src.utils.config_loader import ConfigLoader
+                _shared_cache = ResultCache.from_config(ConfigLoader().config.get('result_cache', {}))
+    return _shared_cache
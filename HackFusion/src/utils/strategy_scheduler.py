@@ -0,0 +1,152 @@
+"""
+Scheduling of alternative tool strategies (sequential, cost-ordered or raced)
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.utils.process_control import TaskCancelled, TaskContext, current_context, task_context
+
+logger = logging.getLogger('HackFusion')
+
+POLICIES = ('sequential', 'cost_order', 'race')
+
+# How often a race checks whether the owning task was cancelled
+_POLL_INTERVAL = 0.2
+
+
+class StrategyScheduler:
+    """
+    Run alternative strategies for the same goal until one is accepted
+
+    Policies:
+        sequential: try strategies in the order given
+        cost_order: try strategies from cheapest to most expensive
+        race: start all strategies at once; the first accepted result wins
+              and the remaining strategies' process groups are killed
+    """
+
+    def __init__(self, policy: str = 'cost_order', max_parallel: Optional[int] = None):
+        """
+        Initialize the scheduler
+
+        Args:
+            policy: One of 'sequential', 'cost_order' or 'race'
+            max_parallel: Maximum concurrent strategies when racing
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown strategy policy: {policy}. Choose from {', '.join(POLICIES)}")
+        self.policy = policy
+        self.max_parallel = max_parallel
+
+    def order(self, strategies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Order strategies according to the policy"""
+        if self.policy == 'sequential':
+            return list(strategies)
+        # Stable sort keeps the configured order for equal costs
+        return sorted(strategies, key=lambda strategy: strategy.get('cost', 0))
+
+    def run(
+        self,
+        strategies: List[Dict[str, Any]],
+        runner: Callable[[Dict[str, Any]], Any],
+        accept: Callable[[Any], bool]
+    ) -> Tuple[Optional[Dict[str, Any]], Any, List[Dict[str, Any]]]:
+        """
+        Run strategies until one produces an accepted result
+
+        Args:
+            strategies: Strategy dictionaries (name, cost and runner-specific keys)
+            runner: Function executing one strategy and returning its result
+            accept: Predicate deciding whether a result ends the search
+
+        Returns:
+            Tuple of (winning strategy or None, its result or None, attempt log)
+        """
+        ordered = self.order(strategies)
+        if self.policy == 'race' and len(ordered) > 1:
+            return self._race(ordered, runner, accept)
+        return self._serial(ordered, runner, accept)
+
+    def _serial(self, strategies, runner, accept):
+        attempts = []
+        for strategy in strategies:
+            started = time.monotonic()
+            try:
+                result = runner(strategy)
+            except TaskCancelled:
+                raise
+            except Exception as e:
+                logger.error(f"Strategy {strategy.get('name')} failed: {e}")
+                result = None
+            accepted = result is not None and accept(result)
+            attempts.append(self._attempt(strategy, started, 'accepted' if accepted else 'rejected'))
+            if accepted:
+                return strategy, result, attempts
+        return None, None, attempts
+
+    def _race(self, strategies, runner, accept):
+        parent = current_context()
+        grace_period = parent.grace_period if parent is not None else 5.0
+        contexts = {
+            idx: TaskContext(f"{parent.task_id if parent else 'race'}:{strategy.get('name', idx)}", grace_period)
+            for idx, strategy in enumerate(strategies)
+        }
+        started = time.monotonic()
+        attempts = []
+
+        def run_one(idx: int):
+            with task_context(contexts[idx]):
+                return runner(strategies[idx])
+
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_parallel or len(strategies),
+            thread_name_prefix='strategy-race'
+        )
+        try:
+            futures = {pool.submit(run_one, idx): idx for idx in range(len(strategies))}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+
+                if parent is not None and parent.cancelled:
+                    for context in contexts.values():
+                        context.cancel()
+                    raise TaskCancelled(parent.task_id)
+
+                for future in done:
+                    idx = futures[future]
+                    strategy = strategies[idx]
+                    try:
+                        result = future.result()
+                    except TaskCancelled:
+                        attempts.append(self._attempt(strategy, started, 'cancelled'))
+                        continue
+                    except Exception as e:
+                        logger.error(f"Strategy {strategy.get('name')} failed: {e}")
+                        result = None
+
+                    if result is not None and accept(result):
+                        attempts.append(self._attempt(strategy, started, 'accepted'))
+                        for other_idx, context in contexts.items():
+                            if other_idx != idx:
+                                context.cancel()
+                        for other in pending:
+                            attempts.append(self._attempt(strategies[futures[other]], started, 'cancelled'))
+                        logger.info(f"Strategy {strategy.get('name')} won the race, cancelling the rest")
+                        return strategy, result, attempts
+                    attempts.append(self._attempt(strategy, started, 'rejected'))
+            return None, None, attempts
+        finally:
+            # Losing strategies unwind on their own once their processes die
+            pool.shutdown(wait=False)
+
+    @staticmethod
+    def _attempt(strategy: Dict[str, Any], started: float, outcome: str) -> Dict[str, Any]:
+        return {
+            'strategy': strategy.get('name'),
+            'outcome': outcome,
+            'elapsed': round(time.monotonic() - started, 3)
+        }
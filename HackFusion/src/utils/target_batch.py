@@ -0,0 +1,130 @@
+"""
+Helpers for running a tool over many targets: scope file reading,
+de-duplication and bounded, streaming concurrency
+"""
+
+import logging
+import os
+import re
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, TypeVar, Union
+
+from src.utils.process_control import TaskCancelled, current_context, task_context
+
+logger = logging.getLogger('HackFusion')
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+TargetSource = Union[str, os.PathLike, Iterable[str]]
+
+_SEPARATORS = re.compile(r'[\s,]+')
+
+
+def read_targets(source: TargetSource) -> Iterator[str]:
+    """
+    Read targets from a scope file or an iterable
+
+    Scope files hold one or more targets per line separated by whitespace or
+    commas; ``#`` starts a comment. A string that is not an existing file is
+    treated as a single target.
+
+    :param source: Path to a scope file, a single target, or an iterable of targets
+    :return: Iterator of raw targets
+    """
+    if isinstance(source, os.PathLike) or (isinstance(source, str) and os.path.isfile(source)):
+        with open(source, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                for target in _SEPARATORS.split(line.split('#', 1)[0]):
+                    if target:
+                        yield target
+        return
+    if isinstance(source, str):
+        source = [source]
+    for target in source:
+        target = target.strip() if isinstance(target, str) else ''
+        if target and not target.startswith('#'):
+            yield target
+
+
+def unique_targets(
+    targets: Iterable[str],
+    normalize: Optional[Callable[[str], str]] = None
+) -> Iterator[str]:
+    """
+    Normalize targets and drop repeats, keeping first-seen order
+
+    :param targets: Raw targets
+    :param normalize: Normalization applied before comparing (default: lower-case)
+    :return: Iterator of unique normalized targets
+    """
+    seen = set()
+    for target in targets:
+        try:
+            target = normalize(target) if normalize else target.strip().lower()
+        except Exception as e:
+            logger.warning(f"Skipping unparseable target {target!r}: {e}")
+            continue
+        if target and target not in seen:
+            seen.add(target)
+            yield target
+
+
+def run_bounded(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    concurrency: int = 8
+) -> Iterator[Tuple[T, Any]]:
+    """
+    Run func over items on a thread pool and yield results as they finish
+
+    At most ``concurrency`` calls are in flight, and items are pulled from the
+    iterable only as slots free up, so huge inputs are never materialized.
+    Workers run in the caller's task context, so cancelling the task cancels
+    their child processes too. An exception raised by func is yielded as the
+    result for its item.
+
+    :param func: Function applied to each item
+    :param items: Items to process
+    :param concurrency: Maximum concurrent calls
+    :return: Iterator of (item, result or exception) in completion order
+    """
+    concurrency = max(1, concurrency)
+    parent = current_context()
+    items = iter(items)
+
+    def call(item: T) -> R:
+        with task_context(parent):
+            return func(item)
+
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='batch')
+    pending = {}
+    try:
+        for item in items:
+            pending[pool.submit(call, item)] = item
+            if len(pending) >= concurrency:
+                break
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            finished = deque()
+            for future in done:
+                item = pending.pop(future)
+                try:
+                    finished.append((item, future.result()))
+                except TaskCancelled:
+                    raise
+                except Exception as e:
+                    finished.append((item, e))
+            # Refill before yielding so work continues while the caller consumes
+            for item in items:
+                pending[pool.submit(call, item)] = item
+                if len(pending) >= concurrency:
+                    break
+            while finished:
+                yield finished.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
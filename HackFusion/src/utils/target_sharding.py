@@ -0,0 +1,180 @@
+"""
+CIDR sharding of large scan targets and parallel nmap execution
+"""
+
+import ipaddress
+import logging
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+from src.utils.nmap_model import aggregate_host_records
+from src.utils.nmap_stream import iter_nmap_hosts
+from src.utils.process_control import TaskCancelled, current_context, task_context
+
+logger = logging.getLogger('HackFusion')
+
+
+def parse_network(target: str) -> Optional[ipaddress._BaseNetwork]:
+    """
+    Parse a CIDR target
+
+    :param target: Target string such as 10.0.0.0/16
+    :return: Network object, or None if the target is not a CIDR range
+    """
+    if '/' not in target:
+        return None
+    try:
+        return ipaddress.ip_network(target.strip(), strict=False)
+    except ValueError:
+        return None
+
+
+def shard_network(network: ipaddress._BaseNetwork, hosts_per_shard: int = 256) -> List[str]:
+    """
+    Split a network into equally sized CIDR shards
+
+    :param network: Network to split
+    :param hosts_per_shard: Upper bound on addresses per shard
+    :return: List of shard CIDR strings
+    """
+    bits = max(0, math.floor(math.log2(max(1, hosts_per_shard))))
+    new_prefix = max(network.prefixlen, network.max_prefixlen - bits)
+    if new_prefix == network.prefixlen:
+        return [str(network)]
+    return [str(subnet) for subnet in network.subnets(new_prefix=new_prefix)]
+
+
+class ShardedNmapScanner:
+    """
+    Run one nmap process per shard with a global packet rate budget
+
+    Shards are supervised from a thread pool; the scanning itself happens in
+    the nmap child processes, which the OS spreads across all cores. The
+    packets-per-second budget is divided evenly between concurrent shards
+    with ``--max-rate`` so the aggregate stays within the budget.
+    """
+
+    def __init__(
+        self,
+        hosts_per_shard: int = 256,
+        workers: int = 8,
+        max_rate_pps: Optional[int] = None,
+        shard_timeout: Optional[float] = None
+    ):
+        """
+        Initialize the sharded scanner
+
+        :param hosts_per_shard: Addresses per nmap process
+        :param workers: Maximum concurrent nmap processes
+        :param max_rate_pps: Global packets-per-second budget (None for unlimited)
+        :param shard_timeout: Timeout in seconds for each shard
+        """
+        self.hosts_per_shard = hosts_per_shard
+        self.workers = max(1, workers)
+        self.max_rate_pps = max_rate_pps
+        self.shard_timeout = shard_timeout
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ShardedNmapScanner':
+        """Build a scanner from information_gathering.nmap.sharding"""
+        return cls(
+            hosts_per_shard=int(config.get('hosts_per_shard', 256)),
+            workers=int(config.get('workers', 8)),
+            max_rate_pps=config.get('max_rate_pps'),
+            shard_timeout=config.get('shard_timeout')
+        )
+
+    def shard_args(self, concurrent_shards: int) -> List[str]:
+        """Rate limiting arguments for one shard"""
+        if not self.max_rate_pps:
+            return []
+        per_shard = max(1, int(self.max_rate_pps) // max(1, concurrent_shards))
+        return ['--max-rate', str(per_shard)]
+
+    def scan(
+        self,
+        network: ipaddress._BaseNetwork,
+        scan_args: List[str],
+        env: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Scan a network shard by shard and merge the results
+
+        :param network: Network to scan
+        :param scan_args: Nmap arguments applied to every shard
+        :param env: Environment for the nmap processes
+        :return: Result dictionary with merged parsed_output and per-shard status
+        """
+        shards = [[shard] for shard in shard_network(network, self.hosts_per_shard)]
+        return self._scan_shards(shards, str(network), scan_args, env)
+
+    def scan_hosts(
+        self,
+        hosts: List[str],
+        scan_args: List[str],
+        env: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Scan an explicit host list, ``hosts_per_shard`` hosts per nmap process
+
+        :param hosts: Host addresses (e.g. the live hosts of a pre-sweep)
+        :param scan_args: Nmap arguments applied to every shard
+        :param env: Environment for the nmap processes
+        :return: Result dictionary with merged parsed_output and per-shard status
+        """
+        size = max(1, self.hosts_per_shard)
+        shards = [hosts[i:i + size] for i in range(0, len(hosts), size)]
+        return self._scan_shards(shards, f"{len(hosts)} hosts", scan_args, env)
+
+    def _scan_shards(
+        self,
+        shards: List[List[str]],
+        label: str,
+        scan_args: List[str],
+        env: Optional[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        concurrency = max(1, min(self.workers, len(shards)))
+        rate_args = self.shard_args(concurrency)
+        parent = current_context()
+        started = time.monotonic()
+
+        def scan_shard(targets: List[str]) -> List[Dict[str, Any]]:
+            cmd = ['nmap'] + list(scan_args) + rate_args + ['-oX', '-'] + targets
+            with task_context(parent):
+                return list(iter_nmap_hosts(cmd, env=env, timeout=self.shard_timeout))
+
+        logger.info(
+            f"Scanning {label} as {len(shards)} shards with {concurrency} workers"
+            + (f" at {rate_args[1]} pps each" if rate_args else "")
+        )
+
+        hosts: List[Dict[str, Any]] = []
+        failed_shards = []
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='nmap-shard') as pool:
+            futures = {pool.submit(scan_shard, shard): shard for shard in shards}
+            for future in as_completed(futures):
+                shard = ' '.join(futures[future])
+                try:
+                    hosts.extend(future.result())
+                except TaskCancelled:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                except Exception as e:
+                    logger.error(f"Shard {shard} failed: {e}")
+                    failed_shards.append({'shard': shard, 'error': str(e)})
+
+        return {
+            'status': 'success' if len(failed_shards) < len(shards) else 'error',
+            'command': ' '.join(['nmap'] + list(scan_args) + rate_args + ['-oX', '-', '<shard>']),
+            'parsed_output': aggregate_host_records(hosts),
+            'shards': {
+                'network': label,
+                'total': len(shards),
+                'failed': failed_shards,
+                'workers': concurrency,
+                'elapsed': round(time.monotonic() - started, 3)
+            }
+        }
@@ -0,0 +1,339 @@
+"""
+Append-only, crash-safe journal of task submissions and completions
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger('HackFusion')
+
+TERMINAL_EVENTS = ('completed', 'failed', 'cancelled')
+
+# Argument naming the task a record belongs to (plan steps carry their plan's ID)
+_PARENT_ARG = 'plan_id'
+
+
+class TaskJournal:
+    """
+    JSONL journal recording task submission, completion and result location
+
+    Every record is flushed to the OS as soon as it is written, so a crash of
+    the HackFusion process loses nothing. fsync() is batched (every
+    ``fsync_batch`` records or ``fsync_interval`` seconds, on a timer so an
+    idle process does not leave records unsynced, and at exit) to bound the
+    cost of surviving power loss. Result payloads are written to
+    ``results_dir`` and only their path is journaled.
+
+    Once the file grows past ``compact_bytes`` it is rewritten with only the
+    records of unfinished tasks (and of tasks belonging to an unfinished
+    plan), so replay() cost tracks outstanding work, not history.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        results_dir: Optional[str] = None,
+        fsync_batch: int = 16,
+        fsync_interval: float = 1.0,
+        compact_bytes: int = 4 * 1024 * 1024
+    ):
+        """
+        Initialize the journal
+
+        Args:
+            path: Journal file path
+            results_dir: Directory for result payloads (defaults to <path>.results)
+            fsync_batch: Records written between fsync calls
+            fsync_interval: Maximum seconds between fsync calls
+            compact_bytes: Journal size that triggers compaction (0 disables)
+        """
+        self.path = os.path.expanduser(path)
+        self.results_dir = os.path.expanduser(results_dir or f"{self.path}.results")
+        self.fsync_batch = max(1, fsync_batch)
+        self.fsync_interval = fsync_interval
+        self.compact_bytes = max(0, compact_bytes)
+        self._compact_at = self.compact_bytes
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._sync_timer: Optional[threading.Timer] = None
+        atexit.register(self.close)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], path_key: str = 'path') -> 'TaskJournal':
+        """
+        Build a journal from the executor.journal configuration section
+
+        Args:
+            config: Journal configuration
+            path_key: Key holding the journal path ('path' or 'plans_path')
+        """
+        defaults = {
+            'path': '~/.hackfusion/journal/tasks.jsonl',
+            'plans_path': '~/.hackfusion/journal/plans.jsonl'
+        }
+        return cls(
+            config.get(path_key, defaults.get(path_key, defaults['path'])),
+            fsync_batch=int(config.get('fsync_batch', 16)),
+            fsync_interval=float(config.get('fsync_interval', 1.0)),
+            compact_bytes=int(config.get('compact_bytes', 4 * 1024 * 1024))
+        )
+
+    def _open(self):
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+            if self._file.tell() > 0 and not self._ends_with_newline():
+                # Terminate a line truncated by a crash so it cannot swallow the next record
+                self._file.write('\n')
+        return self._file
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def append(self, event: str, task_id: str, **fields) -> Dict[str, Any]:
+        """
+        Append a record to the journal
+
+        Args:
+            event: Event name (submitted, completed, failed, cancelled, ...)
+            task_id: Task the event belongs to
+            **fields: Additional JSON-serializable fields
+
+        Returns:
+            The written record
+        """
+        record = {'ts': time.time(), 'event': event, 'task_id': task_id}
+        record.update(fields)
+        line = json.dumps(record, default=str) + '\n'
+
+        with self._lock:
+            journal_file = self._open()
+            journal_file.write(line)
+            journal_file.flush()
+            self._unsynced += 1
+            if (self._unsynced >= self.fsync_batch
+                    or time.monotonic() - self._last_sync >= self.fsync_interval):
+                self._sync()
+            elif self._sync_timer is None:
+                # Sync even if no further record arrives
+                self._sync_timer = threading.Timer(self.fsync_interval, self._timed_sync)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+            # Only a finished task can make records droppable
+            if self.compact_bytes and event in TERMINAL_EVENTS and journal_file.tell() > self._compact_at:
+                self._compact()
+        return record
+
+    def _timed_sync(self):
+        with self._lock:
+            self._sync_timer = None
+            self._sync()
+
+    def _sync(self):
+        """fsync the journal file (caller holds the lock)"""
+        if self._file is None or not self._unsynced:
+            return
+        try:
+            os.fsync(self._file.fileno())
+        except OSError as e:
+            logger.warning(f"Journal fsync failed: {e}")
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def compact(self) -> int:
+        """
+        Rewrite the journal keeping only records that replay() still needs
+
+        Records of unfinished tasks are kept, as are those of tasks whose
+        ``plan_id`` argument names an unfinished task, so a resumed plan can
+        restore its completed steps. Stored results of dropped tasks are deleted.
+
+        Returns:
+            Number of records dropped
+        """
+        with self._lock:
+            return self._compact()
+
+    def _compact(self) -> int:
+        """Compact the journal (caller holds the lock)"""
+        if self._file is not None:
+            self._file.flush()
+        if not os.path.exists(self.path):
+            return 0
+
+        records = list(self._read_records())
+        states = self._fold(records)
+        unfinished = {task_id for task_id, state in states.items() if state['status'] not in TERMINAL_EVENTS}
+        keep = {
+            task_id for task_id, state in states.items()
+            if task_id in unfinished or (state.get('args') or {}).get(_PARENT_ARG) in unfinished
+        }
+        kept = [record for record in records if record.get('task_id') in keep]
+
+        tmp_path = f"{self.path}.compact"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for record in kept:
+                    f.write(json.dumps(record, default=str) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Journal compaction failed: {e}")
+            return 0
+
+        # Later appends go to the rewritten file
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._unsynced = 0
+        # Mostly-unfinished journals are not rewritten again on every record
+        self._compact_at = max(self.compact_bytes, 2 * os.path.getsize(self.path))
+
+        for task_id, state in states.items():
+            result_path = state.get('result_path')
+            if task_id not in keep and result_path and os.path.dirname(result_path) == self.results_dir:
+                try:
+                    os.remove(result_path)
+                except OSError:
+                    pass
+
+        dropped = len(records) - len(kept)
+        logger.info(f"Compacted journal {self.path}: kept {len(kept)} records, dropped {dropped}")
+        return dropped
+
+    def record_submitted(self, task_id: str, tool: str, args: Dict[str, Any], **fields):
+        """Record that a task was submitted"""
+        return self.append('submitted', task_id, tool=tool, args=args, **fields)
+
+    def record_completed(self, task_id: str, result: Any, **fields) -> Optional[str]:
+        """
+        Store a task result and record its completion
+
+        Returns:
+            Path of the stored result, or None if it could not be written
+        """
+        result_path = self._write_result(task_id, result)
+        self.append('completed', task_id, result_path=result_path, **fields)
+        return result_path
+
+    def record_failed(self, task_id: str, error: str, **fields):
+        """Record that a task failed"""
+        return self.append('failed', task_id, error=error, **fields)
+
+    def record_cancelled(self, task_id: str, **fields):
+        """Record that a task was cancelled"""
+        return self.append('cancelled', task_id, **fields)
+
+    def _write_result(self, task_id: str, result: Any) -> Optional[str]:
+        safe_id = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in task_id)
+        result_path = os.path.join(self.results_dir, f"{safe_id}.json")
+        tmp_path = f"{result_path}.tmp"
+        try:
+            os.makedirs(self.results_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            # Atomic rename: a crash never leaves a half-written result behind
+            os.replace(tmp_path, result_path)
+            return result_path
+        except Exception as e:
+            logger.error(f"Could not store result of {task_id}: {e}")
+            return None
+
+    def load_result(self, state: Dict[str, Any]) -> Any:
+        """Load the stored result of a completed task state from replay()"""
+        result_path = state.get('result_path')
+        if not result_path or not os.path.exists(result_path):
+            return None
+        with open(result_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def replay(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Rebuild the latest state of every task from the journal
+
+        A truncated last line from a crash mid-write is ignored.
+
+        Returns:
+            Mapping of task ID to merged state with a 'status' field, in
+            order of first submission
+        """
+        self.flush()
+        return self._fold(self._read_records())
+
+    def _read_records(self):
+        """Yield the journal's records, skipping corrupt lines"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt journal line {line_number} in {self.path}")
+
+    @staticmethod
+    def _fold(records) -> Dict[str, Dict[str, Any]]:
+        """Merge records into the latest state of every task"""
+        states: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            task_id = record.get('task_id')
+            event = record.get('event')
+            if event == 'submitted':
+                # A resubmission starts the task's state over
+                states.pop(task_id, None)
+                states[task_id] = dict(record, status='submitted')
+            elif task_id in states:
+                states[task_id].update(record)
+                states[task_id]['status'] = event
+        return states
+
+    def unfinished(self, tool: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get tasks that were submitted but never reached a terminal state
+
+        Args:
+            tool: Only return tasks for this tool
+
+        Returns:
+            Task states in submission order
+        """
+        return [
+            state for state in self.replay().values()
+            if state['status'] not in TERMINAL_EVENTS
+            and (tool is None or state.get('tool') == tool)
+        ]
+
+    def flush(self):
+        """Flush and fsync pending records"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                self._sync()
+
+    def close(self):
+        """Flush and close the journal file"""
+        with self._lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            if self._file is not None:
+                self._file.flush()
+                self._sync()
+                self._file.close()
+                self._file = None
@@ -0,0 +1,216 @@
+"""
+Task registry with secondary indexes and disk spill for finished results
+"""
+
+import json
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set
+
+logger = logging.getLogger('HackFusion')
+
+FINISHED_STATUSES = ('completed', 'failed', 'cancelled')
+
+
+class TaskRegistry:
+    """
+    Thread-safe store of executor tasks
+
+    Active tasks stay in memory and are indexed by status and tool. Finished
+    tasks are kept in memory until either the count or the estimated size of
+    their result payloads exceeds the retention limits; the oldest ones are
+    then written to ``spill_dir`` and dropped from memory. Spilled tasks are
+    still returned by get(), which reads them back from disk.
+    """
+
+    def __init__(
+        self,
+        max_finished: int = 1000,
+        max_result_mb: float = 64,
+        spill_dir: str = '~/.hackfusion/results'
+    ):
+        """
+        Initialize the registry
+
+        Args:
+            max_finished: Finished tasks to keep in memory
+            max_result_mb: Memory budget for finished result payloads in MB
+            spill_dir: Directory where evicted tasks are written
+        """
+        self.max_finished = max_finished
+        self.max_result_bytes = int(max_result_mb * 1024 * 1024)
+        self.spill_dir = os.path.expanduser(spill_dir)
+
+        self._lock = threading.RLock()
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+        self._by_status: Dict[str, Set[str]] = {}
+        self._by_tool: Dict[str, Set[str]] = {}
+        self._finished: 'OrderedDict[str, int]' = OrderedDict()
+        self._finished_bytes = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'TaskRegistry':
+        """
+        Build a registry from the ``executor.retention`` section of tools.yaml
+
+        Args:
+            config: Retention configuration dictionary
+
+        Returns:
+            Configured TaskRegistry
+        """
+        return cls(
+            max_finished=int(config.get('max_finished_tasks', 1000)),
+            max_result_mb=float(config.get('max_result_mb', 64)),
+            spill_dir=config.get('spill_dir', '~/.hackfusion/results')
+        )
+
+    @staticmethod
+    def new_task_id(tool_name: str) -> str:
+        """Generate a collision-free task ID"""
+        return f"{tool_name}_{uuid.uuid4().hex}"
+
+    def add(self, task_id: str, task: Dict[str, Any]):
+        """
+        Register a new task
+
+        Args:
+            task_id: Unique task identifier
+            task: Task entry, must contain 'tool' and 'status'
+        """
+        with self._lock:
+            self._tasks[task_id] = task
+            self._index(task_id, task)
+            if task['status'] in FINISHED_STATUSES:
+                self._track_finished(task_id, task)
+
+    def update(self, task_id: str, **fields) -> Optional[Dict[str, Any]]:
+        """
+        Update fields of an in-memory task, keeping indexes consistent
+
+        Args:
+            task_id: Task identifier
+            **fields: Fields to set on the task entry
+
+        Returns:
+            Updated task entry, or None if the task is not in memory
+        """
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return None
+
+            old_status = task['status']
+            task.update(fields)
+            if task['status'] != old_status:
+                self._by_status.get(old_status, set()).discard(task_id)
+                self._by_status.setdefault(task['status'], set()).add(task_id)
+                if task['status'] in FINISHED_STATUSES and task_id not in self._finished:
+                    self._track_finished(task_id, task)
+            return task
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a task entry from memory or from the spill directory
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Task entry, or None if unknown
+        """
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is not None:
+                return task
+
+        spill_path = self._spill_path(task_id)
+        if not os.path.exists(spill_path):
+            return None
+        try:
+            with open(spill_path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Could not load spilled task {task_id}: {str(e)}")
+            return None
+
+    def __contains__(self, task_id: str) -> bool:
+        with self._lock:
+            if task_id in self._tasks:
+                return True
+        return os.path.exists(self._spill_path(task_id))
+
+    def ids_by_status(self, status: str) -> List[str]:
+        """Get IDs of in-memory tasks with the given status"""
+        with self._lock:
+            return list(self._by_status.get(status, ()))
+
+    def ids_by_tool(self, tool_name: str) -> List[str]:
+        """Get IDs of in-memory tasks for the given tool"""
+        with self._lock:
+            return list(self._by_tool.get(tool_name, ()))
+
+    def stats(self) -> Dict[str, Any]:
+        """Get counts per status and the finished payload footprint"""
+        with self._lock:
+            return {
+                'in_memory': len(self._tasks),
+                'by_status': {status: len(ids) for status, ids in self._by_status.items() if ids},
+                'finished_bytes': self._finished_bytes
+            }
+
+    def _index(self, task_id: str, task: Dict[str, Any]):
+        self._by_status.setdefault(task['status'], set()).add(task_id)
+        self._by_tool.setdefault(task['tool'], set()).add(task_id)
+
+    def _unindex(self, task_id: str, task: Dict[str, Any]):
+        self._by_status.get(task['status'], set()).discard(task_id)
+        tool_ids = self._by_tool.get(task['tool'])
+        if tool_ids is not None:
+            tool_ids.discard(task_id)
+            if not tool_ids:
+                del self._by_tool[task['tool']]
+
+    def _track_finished(self, task_id: str, task: Dict[str, Any]):
+        size = self._estimate_size(task)
+        self._finished[task_id] = size
+        self._finished_bytes += size
+        self._enforce_retention()
+
+    def _enforce_retention(self):
+        while self._finished and (
+            len(self._finished) > self.max_finished
+            or self._finished_bytes > self.max_result_bytes
+        ):
+            task_id, size = self._finished.popitem(last=False)
+            self._finished_bytes -= size
+            task = self._tasks.pop(task_id, None)
+            if task is None:
+                continue
+            self._unindex(task_id, task)
+            self._spill(task_id, task)
+
+    def _spill(self, task_id: str, task: Dict[str, Any]):
+        try:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            entry = {key: value for key, value in task.items() if not callable(value)}
+            entry['task_id'] = task_id
+            entry['spilled'] = True
+            with open(self._spill_path(task_id), 'w') as f:
+                json.dump(entry, f, default=str)
+        except Exception as e:
+            logger.error(f"Could not spill task {task_id} to disk: {str(e)}")
+
+    def _spill_path(self, task_id: str) -> str:
+        safe_id = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in task_id)
+        return os.path.join(self.spill_dir, f"{safe_id}.json")
+
+    @staticmethod
+    def _estimate_size(task: Dict[str, Any]) -> int:
+        try:
+            return len(json.dumps(task.get('result'), default=str))
+        except Exception:
+            return 0
@@ -0,0 +1,194 @@
+"""
+Asynchronous TCP connect sweep for finding live hosts before nmap
+"""
+
+import asyncio
+import errno
+import logging
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Set, Tuple
+
+from src.utils.async_runner import run_async
+
+logger = logging.getLogger('HackFusion')
+
+DEFAULT_SWEEP_PORTS = (21, 22, 23, 25, 53, 80, 110, 135, 139, 143, 443, 445, 993, 995, 3306, 3389, 5900, 8080, 8443)
+
+# Ports a liveness-only sweep probes on every host; dead hosts cost one
+# probe per port here, so this stays short
+DEFAULT_LIVENESS_PORTS = (22, 80, 443, 445)
+
+# A refused connection still proves the host is up
+_ALIVE_ERRNOS = {errno.ECONNREFUSED, errno.ECONNRESET}
+
+
+class TcpSweeper:
+    """
+    Probe hosts with non-blocking TCP connects to a small set of ports
+
+    A host counts as live when any port accepts or actively refuses the
+    connection. A full sweep probes every port on every host. A liveness
+    sweep (until_alive) probes only ``liveness_ports``, stopping at the first
+    answer, and then probes the remaining ports on live hosts alone, so a
+    dead host costs a handful of probes instead of one per sweep port.
+    Probes are bounded by a concurrency limit and a global connection rate,
+    so large ranges can be swept without flooding the link.
+    """
+
+    def __init__(
+        self,
+        ports: Sequence[int] = DEFAULT_SWEEP_PORTS,
+        liveness_ports: Sequence[int] = DEFAULT_LIVENESS_PORTS,
+        concurrency: int = 512,
+        rate: Optional[float] = 2000,
+        timeout: float = 1.0
+    ):
+        """
+        Initialize the sweeper
+
+        Args:
+            ports: Ports probed on every host (on live hosts only in a liveness sweep)
+            liveness_ports: Ports a liveness sweep probes on every host
+            concurrency: Maximum connection attempts in flight
+            rate: Maximum connection attempts per second (None for unlimited)
+            timeout: Seconds to wait for each connection attempt
+        """
+        self.ports = [int(port) for port in ports]
+        self.liveness_ports = [int(port) for port in liveness_ports]
+        self.concurrency = max(1, concurrency)
+        self.rate = rate
+        self.timeout = timeout
+        self._next_slot = 0.0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'TcpSweeper':
+        """Build a sweeper from information_gathering.nmap.pre_sweep"""
+        return cls(
+            ports=config.get('ports') or DEFAULT_SWEEP_PORTS,
+            liveness_ports=config.get('liveness_ports') or DEFAULT_LIVENESS_PORTS,
+            concurrency=int(config.get('concurrency', 512)),
+            rate=config.get('rate', 2000),
+            timeout=float(config.get('timeout', 1.0))
+        )
+
+    async def _wait_for_slot(self):
+        if not self.rate:
+            return
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + 1.0 / float(self.rate)
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def probe(self, host: str, port: int) -> Optional[str]:
+        """
+        Attempt one TCP connection
+
+        Returns:
+            'open' if the connection was accepted, 'closed' if it was refused,
+            None if there was no answer
+        """
+        await self._wait_for_slot()
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), self.timeout)
+        except asyncio.TimeoutError:
+            return None
+        except OSError as e:
+            return 'closed' if e.errno in _ALIVE_ERRNOS else None
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return 'open'
+
+    async def _run_probes(
+        self,
+        results: Dict[str, Dict[str, Any]],
+        probes: Iterator[Tuple[str, int]],
+        count: int,
+        probed: Dict[str, Set[int]],
+        until_alive: bool = False
+    ):
+        """Drain a lazy probe generator with a fixed set of workers"""
+        async def worker():
+            for host, port in probes:
+                if until_alive and results[host]['alive']:
+                    continue
+                probed[host].add(port)
+                state = await self.probe(host, port)
+                if state is not None:
+                    results[host]['alive'] = True
+                    if state == 'open':
+                        results[host]['open_ports'].append(port)
+
+        await asyncio.gather(*(worker() for _ in range(min(self.concurrency, count or 1))))
+
+    async def sweep(
+        self,
+        hosts: Iterable[str],
+        until_alive: bool = False,
+        hints: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Sweep hosts concurrently
+
+        Args:
+            hosts: IP addresses or hostnames
+            until_alive: Decide liveness from liveness_ports only, stopping at
+                         a host's first answer, for callers that only prune
+            hints: After a liveness sweep, probe the remaining ports on live
+                   hosts so open_ports is complete for them
+
+        Returns:
+            Mapping of host to {'alive': bool, 'open_ports': [int, ...]}
+        """
+        results: Dict[str, Dict[str, Any]] = {
+            host: {'alive': False, 'open_ports': []} for host in dict.fromkeys(hosts)
+        }
+        probed: Dict[str, Set[int]] = {host: set() for host in results}
+        # Probe generators are lazy, so memory does not grow with hosts x ports
+        if not until_alive:
+            probes = ((host, port) for port in self.ports for host in results)
+            await self._run_probes(results, probes, len(results) * len(self.ports), probed)
+        else:
+            probes = ((host, port) for port in self.liveness_ports for host in results)
+            await self._run_probes(results, probes, len(results) * len(self.liveness_ports), probed, until_alive=True)
+            if hints:
+                live = [host for host, result in results.items() if result['alive']]
+                probes = (
+                    (host, port) for port in self.ports for host in live if port not in probed[host]
+                )
+                await self._run_probes(results, probes, len(live) * len(self.ports), probed)
+
+        for result in results.values():
+            result['open_ports'].sort()
+        return results
+
+    def sweep_hosts(self, hosts: Iterable[str], until_alive: bool = False, hints: bool = True) -> Dict[str, Any]:
+        """
+        Blocking sweep with timing information
+
+        Args:
+            hosts: IP addresses or hostnames
+            until_alive: Decide liveness from liveness_ports only (see sweep)
+            hints: Complete open_ports on live hosts after a liveness sweep
+
+        Returns:
+            Dict with 'hosts' (see sweep), 'live' (live host list in input
+            order), 'probed' count and 'elapsed' seconds
+        """
+        hosts = list(dict.fromkeys(hosts))
+        started = time.monotonic()
+        self._next_slot = 0.0
+        results = run_async(self.sweep(hosts, until_alive, hints))
+        live = [host for host in hosts if results[host]['alive']]
+        elapsed = round(time.monotonic() - started, 3)
+        logger.info(f"TCP pre-sweep: {len(live)}/{len(hosts)} hosts live in {elapsed}s")
+        return {
+            'hosts': results,
+            'live': live,
+            'probed': len(hosts),
+            'elapsed': elapsed
+        }
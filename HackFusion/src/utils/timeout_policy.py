@@ -0,0 +1,303 @@
+"""
+Tool deadlines derived from recorded execution times
+"""
+
+import logging
+import os
+import subprocess
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.process_control import run_process
+from src.utils.tool_telemetry import TelemetryStore, args_signature, get_telemetry_store, target_class
+from src.utils.tool_telemetry import percentile as duration_percentile
+
+logger = logging.getLogger('HackFusion')
+
+_SETTINGS = (
+    'default', 'percentile', 'multiplier', 'floor', 'ceiling', 'min_samples', 'open_ended',
+    'timeout_rate', 'timeout_growth', 'rate_window'
+)
+
+# Fast non-zero exits (bad credentials, missing files) say nothing about how
+# long a real run takes, so they feed neither the percentiles nor the
+# timeout rate. Timed-out runs only count towards the rate: their duration
+# is the deadline they were given, and feeding it back would let every hang
+# raise the next deadline
+_TIMED_STATUSES = ('success', 'timeout')
+
+
+class TimeoutPolicy:
+    """
+    Per-tool, per-argument-set timeouts from telemetry percentiles
+
+    The deadline is the ``percentile``-th recorded duration times
+    ``multiplier``, clamped to [floor, ceiling]. The command's own argument
+    set (e.g. one nmap strategy) is used once it has ``min_samples`` records,
+    otherwise all runs of the tool; without enough history the caller's
+    default, the tool's configured default or the global default applies.
+    Only successful runs feed the percentile. When more than
+    ``timeout_rate`` of the last ``rate_window`` successful and timed-out
+    runs timed out, the deadline is raised by ``timeout_growth`` once; it
+    is always relative to the successful runs, so repeated hangs cannot
+    compound it, while runs that succeed under the longer deadline raise
+    the percentile itself. For open-ended jobs (``open_ended: true``, e.g.
+    cracking, whose run time depends on the input rather than the tool)
+    the default is a lower bound on the derived deadline.
+    """
+
+    def __init__(
+        self,
+        telemetry: Optional[TelemetryStore] = None,
+        default: float = 300,
+        percentile: float = 99,
+        multiplier: float = 3.0,
+        floor: float = 10,
+        ceiling: float = 3600,
+        min_samples: int = 5,
+        timeout_rate: float = 0.1,
+        timeout_growth: float = 2.0,
+        rate_window: int = 20,
+        cache_ttl: float = 60,
+        tools: Optional[Dict[str, Dict[str, Any]]] = None
+    ):
+        """
+        Initialize the policy
+
+        Args:
+            telemetry: Store the percentiles come from (shared store if None)
+            default: Seconds allowed while a tool has too little history
+            percentile: Recorded duration percentile the deadline is based on
+            multiplier: Factor applied to that percentile
+            floor: Minimum deadline in seconds
+            ceiling: Maximum deadline in seconds
+            min_samples: Records needed before history is trusted
+            timeout_rate: Share of recent runs timing out above which the
+                          deadline is raised
+            timeout_growth: Factor the deadline is raised by in that case
+            rate_window: Number of recent runs the timeout rate covers
+            cache_ttl: Seconds a computed deadline is reused
+            tools: Per-tool overrides of default, percentile, multiplier,
+                   floor, ceiling, min_samples, open_ended, timeout_rate,
+                   timeout_growth and rate_window
+        """
+        self._telemetry = telemetry
+        self.defaults = {
+            'default': float(default),
+            'percentile': float(percentile),
+            'multiplier': float(multiplier),
+            'floor': float(floor),
+            'ceiling': float(ceiling),
+            'min_samples': int(min_samples),
+            'open_ended': False,
+            'timeout_rate': float(timeout_rate),
+            'timeout_growth': max(1.0, float(timeout_growth)),
+            'rate_window': max(1, int(rate_window))
+        }
+        self.cache_ttl = cache_ttl
+        self.tools = {name: dict(settings or {}) for name, settings in (tools or {}).items()}
+
+        # (tool, args, default) -> (expires, deadline)
+        self._cache: Dict[Tuple[str, Optional[str], Optional[float]], Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], telemetry: Optional[TelemetryStore] = None) -> 'TimeoutPolicy':
+        """Build a policy from the timeouts configuration section"""
+        return cls(
+            telemetry=telemetry,
+            default=float(config.get('default', 300)),
+            percentile=float(config.get('percentile', 99)),
+            multiplier=float(config.get('multiplier', 3.0)),
+            floor=float(config.get('floor', 10)),
+            ceiling=float(config.get('ceiling', 3600)),
+            min_samples=int(config.get('min_samples', 5)),
+            timeout_rate=float(config.get('timeout_rate', 0.1)),
+            timeout_growth=float(config.get('timeout_growth', 2.0)),
+            rate_window=int(config.get('rate_window', 20)),
+            cache_ttl=float(config.get('cache_ttl', 60)),
+            tools=config.get('tools') or {}
+        )
+
+    @property
+    def telemetry(self) -> TelemetryStore:
+        if self._telemetry is None:
+            self._telemetry = get_telemetry_store()
+        return self._telemetry
+
+    def settings_for(self, tool: str) -> Dict[str, Any]:
+        """Global settings merged with the tool's overrides"""
+        settings = dict(self.defaults)
+        overrides = self.tools.get(tool, {})
+        settings.update({key: overrides[key] for key in _SETTINGS if key in overrides})
+        return settings
+
+    def explain(self, tool: str, args: Optional[str] = None, default: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Compute a deadline and show how it was derived
+
+        Args:
+            tool: Tool name
+            args: Argument set (see args_signature())
+            default: Caller's fallback when there is too little history
+
+        Returns:
+            timeout, source ('args', 'tool' or 'default'), samples, the
+            percentile value it was derived from and the recent timeout rate
+        """
+        settings = self.settings_for(tool)
+        if default is None:
+            default = settings['default']
+        default = float(default)
+        q = settings['percentile']
+        scopes = ([('args', args)] if args is not None else []) + [('tool', None)]
+        for source, scope_args in scopes:
+            records = self.telemetry.samples(tool, scope_args, statuses=_TIMED_STATUSES)
+            durations = sorted(record['duration'] for record in records if record.get('status') == 'success')
+            if len(durations) < settings['min_samples']:
+                continue
+
+            observed = duration_percentile(durations, q)
+            timeout = max(settings['floor'], observed * settings['multiplier'])
+            recent = sorted(records, key=lambda record: record.get('ts', 0))[-settings['rate_window']:]
+            rate = sum(record.get('status') == 'timeout' for record in recent) / len(recent)
+            if rate > settings['timeout_rate']:
+                timeout *= settings['timeout_growth']
+            timeout = min(settings['ceiling'], timeout)
+            if settings['open_ended'] and timeout < default:
+                timeout, source = default, 'default'
+            return {
+                'timeout': timeout, 'source': source, 'samples': len(durations),
+                'observed': observed, 'timeout_rate': rate
+            }
+
+        return {'timeout': default, 'source': 'default', 'samples': 0, 'observed': None, 'timeout_rate': None}
+
+    def timeout_for(self, tool: str, args: Optional[str] = None, default: Optional[float] = None) -> float:
+        """
+        Deadline in seconds for a tool, optionally for one argument set
+
+        Args:
+            tool: Tool name
+            args: Argument set (see args_signature())
+            default: Caller's fallback when there is too little history
+
+        Returns:
+            Timeout in seconds
+        """
+        key = (tool, args, default)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
+        try:
+            timeout = self.explain(tool, args, default)['timeout']
+        except Exception as e:
+            logger.warning(f"Could not derive a timeout for {tool}: {e}")
+            timeout = float(default if default is not None else self.settings_for(tool)['default'])
+
+        with self._lock:
+            self._cache[key] = (now + self.cache_ttl, timeout)
+        return timeout
+
+    def timeout_for_command(
+        self,
+        cmd: List[str],
+        target: Optional[str] = None,
+        default: Optional[float] = None,
+        tool: Optional[str] = None
+    ) -> float:
+        """
+        Deadline in seconds for a command line
+
+        Args:
+            cmd: Command as a list of strings
+            target: Target of the command, left out of the argument set
+            default: Caller's fallback when there is too little history
+            tool: Tool name (defaults to the command's executable)
+
+        Returns:
+            Timeout in seconds
+        """
+        return self.timeout_for(tool or os.path.basename(cmd[0]), args_signature(cmd, target), default)
+
+
+def run_tool_process(
+    cmd: List[str],
+    target: Optional[str] = None,
+    default: Optional[float] = None,
+    tool: Optional[str] = None,
+    timeout: Optional[float] = None,
+    env: Optional[Dict[str, str]] = None,
+    input: Optional[str] = None,
+    policy: Optional['TimeoutPolicy'] = None,
+    text: bool = True
+) -> subprocess.CompletedProcess:
+    """
+    Run a tool under its policy deadline and record the execution
+
+    Drop-in replacement for ``subprocess.run(cmd, capture_output=True, text=True)``.
+    The child runs in its own process group (see run_process), so a hung tool
+    is killed together with its children once the deadline passes, and its
+    duration, exit code and output size go to the telemetry store.
+
+    Args:
+        cmd: Command to run as a list of strings
+        target: Target of the command (groups telemetry, not part of the argument set)
+        default: Timeout while the tool has too little history
+        tool: Tool name recorded (defaults to the command's executable)
+        timeout: Fixed timeout overriding the policy
+        env: Environment for the child process
+        input: Optional text written to the child's stdin
+        policy: Timeout policy (shared policy if None)
+        text: Decode output as text; False returns bytes (binary output)
+
+    Returns:
+        subprocess.CompletedProcess with text (or bytes) stdout/stderr
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeded its deadline
+        TaskCancelled: If the owning task was cancelled
+    """
+    policy = policy or get_timeout_policy()
+    name = tool or os.path.basename(cmd[0])
+    args = args_signature(cmd, target)
+    if timeout is None:
+        timeout = policy.timeout_for(name, args, default)
+
+    started = time.monotonic()
+    try:
+        result = run_process(cmd, timeout=timeout, env=env, input=input, text=text)
+    except subprocess.TimeoutExpired:
+        logger.warning(f"{name} exceeded its {timeout:.1f}s deadline and was killed")
+        policy.telemetry.record(
+            name, time.monotonic() - started,
+            target_class=target_class(target), args=args, status='timeout'
+        )
+        raise
+    policy.telemetry.record(
+        name, time.monotonic() - started,
+        exit_code=result.returncode,
+        output_bytes=len(result.stdout or '') + len(result.stderr or ''),
+        target_class=target_class(target),
+        args=args
+    )
+    return result
+
+
+_shared_policy: Optional[TimeoutPolicy] = None
+_shared_lock = threading.Lock()
+
+
+def get_timeout_policy() -> TimeoutPolicy:
+    """Get the process-wide timeout policy, built from config on first use"""
+    global _shared_policy
+    if _shared_policy is None:
+        with _shared_lock:
+            if _shared_policy is None:
+                from src.utils.config_loader import ConfigLoader
+                _shared_policy = TimeoutPolicy.from_config(ConfigLoader().config.get('timeouts', {}))
+    return _shared_policy
@@ -0,0 +1,282 @@
+"""
+Persistent cache of which external tools are installed
+"""
+
+import json
+import logging
+import os
+import shlex
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger('HackFusion')
+
+_VERSION = 1
+
+
+class ToolAvailabilityCache:
+    """
+    Remember tool availability across runs
+
+    A tool is available when its name resolves on PATH or, failing that, when
+    its check command runs successfully. Results are persisted to a JSON file
+    together with PATH and the mtime of every PATH directory:
+
+    - a different PATH discards every entry
+    - a changed PATH directory (something was installed or removed) discards
+      the missing-tool entries
+    - an available entry is dropped when its binary's mtime changes
+
+    so a warm lookup costs a few stat calls and no subprocesses. Cold probes
+    run on a thread pool.
+    """
+
+    def __init__(
+        self,
+        path: str = '~/.hackfusion/tool_availability.json',
+        probe_workers: int = 16,
+        probe_timeout: float = 10.0,
+        max_age: float = 7 * 86400,
+        check_commands: Optional[Dict[str, str]] = None
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            path: JSON file the cache is persisted to
+            probe_workers: Threads used for cold probes
+            probe_timeout: Seconds a check command may run
+            max_age: Seconds after which any entry is probed again
+            check_commands: Tool name -> command proving the tool works when
+                            the name itself is not on PATH
+        """
+        self.path = os.path.expanduser(path)
+        self.probe_workers = max(1, probe_workers)
+        self.probe_timeout = probe_timeout
+        self.max_age = max_age
+        self.check_commands = dict(check_commands or {})
+
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._environment: Optional[Tuple[str, Dict[str, Optional[int]]]] = None
+        self._dirty = False
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Dict[str, Any],
+        check_commands: Optional[Dict[str, str]] = None
+    ) -> 'ToolAvailabilityCache':
+        """Build a cache from the tool_availability configuration section"""
+        return cls(
+            path=config.get('path', '~/.hackfusion/tool_availability.json'),
+            probe_workers=int(config.get('probe_workers', 16)),
+            probe_timeout=float(config.get('probe_timeout', 10.0)),
+            max_age=float(config.get('max_age', 7 * 86400)),
+            check_commands=check_commands
+        )
+
+    @staticmethod
+    def _current_environment() -> Tuple[str, Dict[str, Optional[int]]]:
+        """PATH and the mtime of each of its directories"""
+        path_env = os.environ.get('PATH', os.defpath)
+        dirs: Dict[str, Optional[int]] = {}
+        for directory in path_env.split(os.pathsep):
+            if directory in dirs:
+                continue
+            try:
+                dirs[directory] = os.stat(directory or '.').st_mtime_ns
+            except OSError:
+                dirs[directory] = None
+        return path_env, dirs
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the persisted entries on first use (caller holds the lock)"""
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        try:
+            with open(self.path, 'r') as f:
+                state = json.load(f)
+            if state.get('version') == _VERSION:
+                self._entries = dict(state.get('tools', {}))
+                self._environment = (state.get('path_env', ''), dict(state.get('dirs', {})))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable tool availability cache {self.path}: {e}")
+        return self._entries
+
+    def _sync_environment(self):
+        """Invalidate entries the PATH or its directories no longer vouch for (caller holds the lock)"""
+        entries = self._load()
+        current = self._current_environment()
+        if current == self._environment:
+            return
+        if self._environment is None or current[0] != self._environment[0]:
+            entries.clear()
+        else:
+            for name in [name for name, entry in entries.items() if not entry.get('available')]:
+                del entries[name]
+        self._environment = current
+        self._dirty = True
+
+    def _valid(self, entry: Optional[Dict[str, Any]]) -> bool:
+        if entry is None or time.time() - entry.get('checked_at', 0) > self.max_age:
+            return False
+        if not entry.get('available'):
+            return True
+        try:
+            return os.stat(entry['path']).st_mtime_ns == entry.get('mtime_ns')
+        except (OSError, KeyError, TypeError):
+            return False
+
+    def probe(self, name: str) -> Dict[str, Any]:
+        """
+        Check a tool without consulting the cache
+
+        Args:
+            name: Tool name
+
+        Returns:
+            Cache entry: available, path, mtime_ns, via, checked_at
+        """
+        entry = {'available': False, 'path': None, 'mtime_ns': None, 'via': None, 'checked_at': time.time()}
+        binary = shutil.which(name)
+        via = 'path'
+        if binary is None and self.check_commands.get(name):
+            argv = shlex.split(self.check_commands[name])
+            binary = shutil.which(argv[0])
+            via = 'check_command'
+            # Only spawn the check when its binary exists at all
+            if binary is not None and not self._run_check([binary] + argv[1:]):
+                binary = None
+        if binary is not None:
+            try:
+                entry.update(available=True, path=binary, mtime_ns=os.stat(binary).st_mtime_ns, via=via)
+            except OSError:
+                pass
+        return entry
+
+    def _run_check(self, argv: List[str]) -> bool:
+        try:
+            subprocess.run(
+                argv,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                stdin=subprocess.DEVNULL,
+                timeout=self.probe_timeout,
+                check=True
+            )
+            return True
+        except subprocess.TimeoutExpired:
+            logger.debug(f"Check command {argv[0]} timed out after {self.probe_timeout}s")
+            return False
+        except (OSError, subprocess.CalledProcessError):
+            return False
+
+    def check_many(self, names: Iterable[str], refresh: bool = False) -> Dict[str, bool]:
+        """
+        Check several tools, probing only those without a valid cache entry
+
+        Args:
+            names: Tool names
+            refresh: Probe every tool regardless of the cache
+
+        Returns:
+            Mapping of tool name to availability, in input order
+        """
+        names = list(dict.fromkeys(names))
+        with self._lock:
+            self._sync_environment()
+            entries = self._entries
+            stale = [name for name in names if refresh or not self._valid(entries.get(name))]
+
+        if stale:
+            if len(stale) == 1:
+                probed = [self.probe(stale[0])]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.probe_workers, len(stale)),
+                    thread_name_prefix='tool-probe'
+                ) as pool:
+                    probed = list(pool.map(self.probe, stale))
+            with self._lock:
+                self._entries.update(zip(stale, probed))
+                self._dirty = True
+            self.save()
+
+        with self._lock:
+            return {name: bool(self._entries.get(name, {}).get('available')) for name in names}
+
+    def check(self, name: str, refresh: bool = False) -> bool:
+        """
+        Check one tool
+
+        Args:
+            name: Tool name
+            refresh: Probe the tool regardless of the cache
+
+        Returns:
+            Whether the tool is available
+        """
+        return self.check_many([name], refresh=refresh)[name]
+
+    def missing(self, names: Iterable[str], refresh: bool = False) -> List[str]:
+        """Tools from names that are not available, in input order"""
+        return [name for name, available in self.check_many(names, refresh=refresh).items() if not available]
+
+    def invalidate(self, names: Optional[Iterable[str]] = None):
+        """Forget some tools, or every tool when names is None"""
+        with self._lock:
+            entries = self._load()
+            if names is None:
+                entries.clear()
+            else:
+                for name in names:
+                    entries.pop(name, None)
+            self._dirty = True
+        self.save()
+
+    def save(self):
+        """Persist the cache if it changed"""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            path_env, dirs = self._environment or self._current_environment()
+            state = {'version': _VERSION, 'path_env': path_env, 'dirs': dirs, 'tools': self._entries}
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                with open(tmp_path, 'w') as f:
+                    json.dump(state, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"Could not save tool availability cache: {e}")
+
+
+_shared_cache: Optional[ToolAvailabilityCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_tool_availability() -> ToolAvailabilityCache:
+    """Get the process-wide tool availability cache, built from config on first use"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                from src.utils.config_loader import ConfigLoader
+                from src.utils.kali_tools import KaliToolsManager
+                check_commands = {
+                    name: info['check_command']
+                    for name, info in KaliToolsManager.REQUIRED_TOOLS.items()
+                    if info.get('check_command')
+                }
+                config = ConfigLoader().config.get('tool_availability', {})
+                _shared_cache = ToolAvailabilityCache.from_config(config, check_commands)
+    return _shared_cache
@@ -73,8 +73,8 @@ def tool_loading_animation(func: Callable) -> Callable:
             
             return result
         
-        except Exception as e:
-            # Stop the loading animation
+        except BaseException as e:
+            # Stop the loading animation (also on task cancellation)
             stop_event.set()
             loading_thread.join(timeout=1)
             
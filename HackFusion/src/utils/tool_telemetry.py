@@ -0,0 +1,482 @@
+"""
+Append-only store of tool execution telemetry with percentile queries
+"""
+
+import atexit
+import ipaddress
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+logger = logging.getLogger('HackFusion')
+
+DEFAULT_QUANTILES = (50, 95, 99)
+
+TARGET_PLACEHOLDER = '<target>'
+
+_URL = re.compile(r'^[a-z][a-z0-9+.-]*://', re.IGNORECASE)
+_DOMAIN = re.compile(r'^(?=.{1,253}\.?$)(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}\.?$', re.IGNORECASE)
+
+
+def target_class(target: Optional[str]) -> Optional[str]:
+    """
+    Coarse class of a target: ipv4, ipv6, cidr, url, domain or other
+
+    Args:
+        target: Target as given to the tool
+
+    Returns:
+        Class name, or None when there is no target
+    """
+    if not target:
+        return None
+    if _URL.match(target):
+        return 'url'
+    try:
+        return f"ipv{ipaddress.ip_address(target).version}"
+    except ValueError:
+        pass
+    if '/' in target:
+        try:
+            ipaddress.ip_network(target, strict=False)
+            return 'cidr'
+        except ValueError:
+            pass
+    if _DOMAIN.match(target):
+        return 'domain'
+    return 'other'
+
+
+def _looks_like_target(token: str) -> bool:
+    return target_class(token) in ('ipv4', 'ipv6', 'cidr', 'url')
+
+
+def args_signature(cmd: Sequence[str], target: Optional[str] = None) -> str:
+    """
+    Argument set of a command with the target left out, used to group timings
+
+    Args:
+        cmd: Command as a list of strings
+        target: Target of the command, also replaced inside arguments such
+                as ``--url=<target>``; without it only IPs, networks and URLs
+                are recognised as the target
+
+    Returns:
+        Space-separated arguments with the target replaced by a placeholder
+    """
+    tokens = []
+    for token in list(cmd)[1:]:
+        if target:
+            token = token.replace(target, TARGET_PLACEHOLDER)
+        elif _looks_like_target(token):
+            token = TARGET_PLACEHOLDER
+        tokens.append(token)
+    return ' '.join(tokens)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> Optional[float]:
+    """Linearly interpolated q-th percentile of already sorted values"""
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * q / 100.0
+    low = math.floor(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+class TelemetryStore:
+    """
+    Record every tool execution in an append-only JSONL file
+
+    record() only appends to an in-memory deque, so callers never wait for a
+    lock or for disk I/O. Whoever crosses the ``flush_batch`` or
+    ``flush_interval`` threshold writes the whole pending batch with a single
+    O_APPEND write; concurrent processes share the file under a shared flock.
+    Once the file exceeds ``compact_bytes`` it is compacted under an exclusive
+    flock down to the newest ``max_samples`` records per tool and argument set
+    younger than ``max_age``; if that still leaves it above ``compact_bytes``,
+    the next compaction waits until the file has doubled. Queries read the file incrementally into an
+    in-memory index.
+    """
+
+    def __init__(
+        self,
+        path: str = '~/.hackfusion/telemetry/executions.jsonl',
+        flush_batch: int = 64,
+        flush_interval: float = 5.0,
+        max_samples: int = 500,
+        max_age: float = 90 * 86400,
+        compact_bytes: int = 8 * 1024 * 1024
+    ):
+        """
+        Initialize the store
+
+        Args:
+            path: JSONL file receiving the records
+            flush_batch: Pending records that trigger a flush
+            flush_interval: Maximum seconds a record waits before a flush
+            max_samples: Records kept per tool and argument set
+            max_age: Seconds records are kept
+            compact_bytes: File size that triggers a compaction
+        """
+        self.path = os.path.expanduser(path)
+        self.lock_path = f"{self.path}.lock"
+        self.flush_batch = max(1, flush_batch)
+        self.flush_interval = flush_interval
+        self.max_samples = max(1, max_samples)
+        self.max_age = max_age
+        self.compact_bytes = compact_bytes
+        self._compact_at = compact_bytes
+
+        self._pending: Deque[str] = deque()
+        self._last_flush = time.monotonic()
+        self._flush_lock = threading.Lock()
+
+        # (tool, args) -> newest records; rebuilt from the file on demand
+        self._index: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = {}
+        self._index_lock = threading.Lock()
+        self._inode: Optional[int] = None
+        self._offset = 0
+
+        atexit.register(self.flush)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'TelemetryStore':
+        """Build a store from the telemetry configuration section"""
+        return cls(
+            path=config.get('path', '~/.hackfusion/telemetry/executions.jsonl'),
+            flush_batch=int(config.get('flush_batch', 64)),
+            flush_interval=float(config.get('flush_interval', 5.0)),
+            max_samples=int(config.get('max_samples', 500)),
+            max_age=float(config.get('max_age', 90 * 86400)),
+            compact_bytes=int(config.get('compact_bytes', 8 * 1024 * 1024))
+        )
+
+    def record(
+        self,
+        tool: str,
+        duration: float,
+        exit_code: Optional[int] = None,
+        output_bytes: int = 0,
+        target_class: Optional[str] = None,
+        args: str = '',
+        status: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Record one execution
+
+        Args:
+            tool: Tool name
+            duration: Wall-clock seconds the execution took
+            exit_code: Process exit code (None if it never exited, e.g. timeout)
+            output_bytes: Size of stdout plus stderr
+            target_class: Class of the target (see target_class())
+            args: Argument set (see args_signature())
+            status: success, error or timeout (derived from exit_code if omitted)
+
+        Returns:
+            The record
+        """
+        if status is None:
+            status = 'timeout' if exit_code is None else ('success' if exit_code == 0 else 'error')
+        record = {
+            'ts': time.time(),
+            'tool': tool,
+            'args': args,
+            'duration': round(duration, 6),
+            'exit_code': exit_code,
+            'output_bytes': output_bytes,
+            'target_class': target_class,
+            'status': status
+        }
+        # deque.append is atomic, so writers never block each other
+        self._pending.append(json.dumps(record, separators=(',', ':')) + '\n')
+        if (len(self._pending) >= self.flush_batch
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self._flush(blocking=False)
+        return record
+
+    def record_command(
+        self,
+        cmd: Sequence[str],
+        command_result: Dict[str, Any],
+        duration: float,
+        target: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Record a finished command from its result dictionary
+
+        Commands that never ran (e.g. binary not found) are not recorded.
+
+        Args:
+            cmd: Command as a list of strings
+            command_result: Result with status, returncode, stdout and stderr
+            duration: Wall-clock seconds the command took
+            target: Target of the command
+
+        Returns:
+            The record, or None if nothing was recorded
+        """
+        status = command_result.get('status')
+        if status != 'timeout' and 'returncode' not in command_result:
+            return None
+        output_bytes = len(command_result.get('stdout') or '') + len(command_result.get('stderr') or '')
+        return self.record(
+            os.path.basename(cmd[0]),
+            duration,
+            exit_code=command_result.get('returncode'),
+            output_bytes=output_bytes,
+            target_class=target_class(target),
+            args=args_signature(cmd, target),
+            status=status
+        )
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        """Cross-process lock guarding the file against compaction"""
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            os.close(fd)
+
+    def flush(self):
+        """Write every pending record"""
+        self._flush(blocking=True)
+
+    def _flush(self, blocking: bool):
+        if not self._flush_lock.acquire(blocking=blocking):
+            return  # another thread is already flushing
+        try:
+            lines = []
+            while True:
+                try:
+                    lines.append(self._pending.popleft())
+                except IndexError:
+                    break
+            self._last_flush = time.monotonic()
+            if not lines:
+                return
+            data = ''.join(lines).encode('utf-8')
+            try:
+                with self._file_lock(exclusive=False):
+                    fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                    try:
+                        os.write(fd, data)
+                        size = os.fstat(fd).st_size
+                    finally:
+                        os.close(fd)
+            except OSError as e:
+                logger.warning(f"Could not write tool telemetry: {e}")
+                return
+        finally:
+            self._flush_lock.release()
+
+        if size > self._compact_at:
+            self.compact()
+
+    def _read_records(self, offset: int = 0) -> Tuple[List[Dict[str, Any]], int, Optional[int]]:
+        """Complete records from offset on, the offset past them and the file's inode"""
+        records = []
+        try:
+            with open(self.path, 'rb') as f:
+                inode = os.fstat(f.fileno()).st_ino
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return records, 0, None
+        # A batch being appended by another process may end mid-line
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].splitlines():
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+        return records, offset + end, inode
+
+    def _refresh(self):
+        """Fold records appended since the last query into the index"""
+        self.flush()
+        with self._index_lock, self._file_lock(exclusive=False):
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                self._index.clear()
+                self._inode, self._offset = None, 0
+                return
+            if stat.st_ino != self._inode or stat.st_size < self._offset:
+                # Compacted (replaced) since the last read: start over
+                self._index.clear()
+                self._offset = 0
+            records, self._offset, self._inode = self._read_records(self._offset)
+            for record in records:
+                key = (record.get('tool', ''), record.get('args', ''))
+                samples = self._index.get(key)
+                if samples is None:
+                    samples = self._index[key] = deque(maxlen=self.max_samples)
+                samples.append(record)
+
+    def samples(
+        self,
+        tool: str,
+        args: Optional[str] = None,
+        since: Optional[float] = None,
+        statuses: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Recorded executions of a tool
+
+        Args:
+            tool: Tool name
+            args: Only this argument set (all argument sets if None)
+            since: Only records newer than this UNIX timestamp
+            statuses: Only records with one of these statuses
+
+        Returns:
+            Records, oldest first within each argument set
+        """
+        self._refresh()
+        statuses = set(statuses) if statuses is not None else None
+        with self._index_lock:
+            groups = [
+                list(records) for (name, arg_set), records in self._index.items()
+                if name == tool and (args is None or arg_set == args)
+            ]
+        return [
+            record for records in groups for record in records
+            if (since is None or record.get('ts', 0) >= since)
+            and (statuses is None or record.get('status') in statuses)
+        ]
+
+    def percentiles(
+        self,
+        tool: str,
+        args: Optional[str] = None,
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+        since: Optional[float] = None,
+        statuses: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Duration percentiles of a tool, optionally for one argument set
+
+        Args:
+            tool: Tool name
+            args: Only this argument set (all argument sets if None)
+            quantiles: Percentiles to compute
+            since: Only records newer than this UNIX timestamp
+            statuses: Only records with one of these statuses
+
+        Returns:
+            count, mean, max, p<q> for each quantile (None without samples)
+            and the share of failed and timed-out executions
+        """
+        return self._stats(self.samples(tool, args, since, statuses), quantiles)
+
+    @staticmethod
+    def _stats(records: List[Dict[str, Any]], quantiles: Sequence[float]) -> Dict[str, Any]:
+        durations = sorted(record['duration'] for record in records if 'duration' in record)
+        count = len(durations)
+        stats: Dict[str, Any] = {
+            'count': count,
+            'mean': sum(durations) / count if count else None,
+            'max': durations[-1] if count else None
+        }
+        for q in quantiles:
+            stats[f"p{q:g}"] = percentile(durations, q)
+        if records:
+            stats['error_rate'] = sum(1 for r in records if r.get('status') == 'error') / len(records)
+            stats['timeout_rate'] = sum(1 for r in records if r.get('status') == 'timeout') / len(records)
+        return stats
+
+    def summary(self, by_args: bool = False, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+        """
+        Percentiles of every recorded tool
+
+        Args:
+            by_args: Break each tool down by argument set
+            quantiles: Percentiles to compute
+
+        Returns:
+            {tool: stats}, or {tool: {args: stats}} when by_args is set
+        """
+        self._refresh()
+        with self._index_lock:
+            groups = {key: list(records) for key, records in self._index.items()}
+
+        summary: Dict[str, Any] = {}
+        if by_args:
+            for (tool, args), records in sorted(groups.items()):
+                summary.setdefault(tool, {})[args] = self._stats(records, quantiles)
+        else:
+            per_tool: Dict[str, List[Dict[str, Any]]] = {}
+            for (tool, _), records in groups.items():
+                per_tool.setdefault(tool, []).extend(records)
+            for tool in sorted(per_tool):
+                summary[tool] = self._stats(per_tool[tool], quantiles)
+        return summary
+
+    def compact(self) -> int:
+        """
+        Rewrite the file keeping the newest max_samples records per tool and
+        argument set that are younger than max_age
+
+        Returns:
+            Number of records kept
+        """
+        self.flush()
+        cutoff = time.time() - self.max_age
+        try:
+            with self._file_lock(exclusive=True):
+                records, _, _ = self._read_records()
+                groups: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = {}
+                for record in records:
+                    if record.get('ts', 0) < cutoff:
+                        continue
+                    key = (record.get('tool', ''), record.get('args', ''))
+                    groups.setdefault(key, deque(maxlen=self.max_samples)).append(record)
+                kept = sorted((r for group in groups.values() for r in group), key=lambda r: r.get('ts', 0))
+
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    for record in kept:
+                        f.write(json.dumps(record, separators=(',', ':')) + '\n')
+                os.replace(tmp_path, self.path)
+                # Records that are all still kept are not rewritten on every flush
+                self._compact_at = max(self.compact_bytes, 2 * os.path.getsize(self.path))
+        except OSError as e:
+            logger.warning(f"Could not compact tool telemetry: {e}")
+            return 0
+        logger.debug(f"Compacted tool telemetry from {len(records)} to {len(kept)} records")
+        return len(kept)
+
+
+_shared_store: Optional[TelemetryStore] = None
+_shared_lock = threading.Lock()
+
+
+def get_telemetry_store() -> TelemetryStore:
+    """Get the process-wide telemetry store, built from config on first use"""
+    global _shared_store
+    if _shared_store is None:
+        with _shared_lock:
+            if _shared_store is None:
+                from src.utils.config_loader import ConfigLoader
+                _shared_store = TelemetryStore.from_config(ConfigLoader().config.get('telemetry', {}))
+    return _shared_store
@@ -0,0 +1,217 @@
+"""
+Persistent SQLite cache of WHOIS responses with per-TLD TTLs
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger('HackFusion')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS whois (
+    domain     TEXT PRIMARY KEY,
+    raw        TEXT NOT NULL,
+    parsed     TEXT NOT NULL,
+    servers    TEXT NOT NULL,
+    method     TEXT,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+class WhoisCache:
+    """
+    On-disk WHOIS cache keyed by normalized domain
+
+    Entries stay fresh for the TTL of their TLD (longest matching suffix,
+    so ``co.uk`` can differ from ``uk``). Expired entries are kept for up to
+    ``max_stale`` seconds so a lookup that fails live can still be answered,
+    flagged as stale. Entries past that are purged when the database is
+    opened and again every ``purge_every`` writes.
+    """
+
+    def __init__(
+        self,
+        path: str = '~/.hackfusion/whois_cache.db',
+        default_ttl: float = 7 * 86400,
+        tld_ttls: Optional[Dict[str, float]] = None,
+        max_stale: float = 90 * 86400,
+        purge_every: int = 1000
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite database file
+            default_ttl: Seconds an entry stays fresh when its TLD has no TTL
+            tld_ttls: Per-TLD (or public suffix) TTLs in seconds
+            max_stale: Seconds past expiry an entry may still be served as stale
+            purge_every: Writes between purges of unservable entries (0 disables)
+        """
+        self.path = os.path.expanduser(path)
+        self.default_ttl = default_ttl
+        self.tld_ttls = {k.lower().strip('.'): float(v) for k, v in (tld_ttls or {}).items()}
+        self.max_stale = max_stale
+        self.purge_every = max(0, purge_every)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'WhoisCache':
+        """Build a cache from information_gathering.whois.cache"""
+        return cls(
+            path=config.get('path', '~/.hackfusion/whois_cache.db'),
+            default_ttl=float(config.get('default_ttl', 7 * 86400)),
+            tld_ttls=config.get('tld_ttls'),
+            max_stale=float(config.get('max_stale', 90 * 86400)),
+            purge_every=int(config.get('purge_every', 1000))
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use (caller holds the lock)"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+            deleted = self._purge(self._conn)
+            if deleted:
+                logger.debug(f"Purged {deleted} expired WHOIS cache entries")
+        return self._conn
+
+    def _purge(self, conn: sqlite3.Connection) -> int:
+        """Delete unservable entries (caller holds the lock)"""
+        # TTLs differ per TLD, so only rows past the largest TTL are candidates
+        horizon = time.time() - max([self.default_ttl] + list(self.tld_ttls.values())) - self.max_stale
+        deleted = conn.execute('DELETE FROM whois WHERE fetched_at < ?', (horizon,)).rowcount
+        conn.commit()
+        self._writes = 0
+        return deleted
+
+    @staticmethod
+    def normalize(domain: str) -> str:
+        return domain.strip().rstrip('.').lower()
+
+    def ttl_for(self, domain: str) -> float:
+        """TTL of the longest configured suffix of the domain"""
+        labels = self.normalize(domain).split('.')
+        for i in range(1, len(labels)):
+            suffix = '.'.join(labels[i:])
+            if suffix in self.tld_ttls:
+                return self.tld_ttls[suffix]
+        return self.default_ttl
+
+    def get(self, domain: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response
+
+        Args:
+            domain: Domain name
+
+        Returns:
+            Entry with raw, parsed, servers, method, fetched_at, expires_at and
+            stale flag, or None if absent or older than max_stale
+        """
+        domain = self.normalize(domain)
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    'SELECT raw, parsed, servers, method, fetched_at FROM whois WHERE domain = ?',
+                    (domain,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"WHOIS cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+
+        raw, parsed, servers, method, fetched_at = row
+        expires_at = fetched_at + self.ttl_for(domain)
+        now = time.time()
+        if now > expires_at + self.max_stale:
+            return None
+        return {
+            'domain': domain,
+            'raw': raw,
+            'parsed': json.loads(parsed),
+            'servers': json.loads(servers),
+            'method': method,
+            'fetched_at': fetched_at,
+            'expires_at': expires_at,
+            'stale': now > expires_at
+        }
+
+    def put(
+        self,
+        domain: str,
+        raw: str,
+        parsed: Dict[str, Any],
+        servers: Optional[List[str]] = None,
+        method: Optional[str] = None
+    ):
+        """Store (or replace) a response"""
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    'INSERT OR REPLACE INTO whois (domain, raw, parsed, servers, method, fetched_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (self.normalize(domain), raw, json.dumps(parsed, default=str),
+                     json.dumps(servers or []), method, time.time())
+                )
+                conn.commit()
+                self._writes += 1
+                if self.purge_every and self._writes >= self.purge_every:
+                    self._purge(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"WHOIS cache write failed: {e}")
+
+    def purge(self) -> int:
+        """
+        Delete entries too old to be served even as stale
+
+        Returns:
+            Number of deleted entries
+        """
+        with self._lock:
+            return self._purge(self._connection())
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and database size"""
+        with self._lock:
+            count = self._connection().execute('SELECT COUNT(*) FROM whois').fetchone()[0]
+        return {
+            'entries': count,
+            'path': self.path,
+            'size_bytes': os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_shared_cache: Optional[WhoisCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_whois_cache() -> WhoisCache:
+    """Get the process-wide WHOIS cache, built from config on first use"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                from src.utils.config_loader import ConfigLoader
+                whois_config = ConfigLoader().get_tool_config('information_gathering', 'whois')
+                _shared_cache = WhoisCache.from_config(whois_config.get('cache', {}))
+    return _shared_cache
@@ -0,0 +1,325 @@
+"""
+In-process WHOIS client (RFC 3912, port 43) with IANA referral following
+"""
+
+import asyncio
+import ipaddress
+import json
+import logging
+import os
+import re
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from src.utils.async_runner import run_async
+
+logger = logging.getLogger('HackFusion')
+
+IANA_SERVER = 'whois.iana.org'
+
+# Lines naming the next server to ask, most specific first
+_REFERRAL_PATTERNS = [
+    re.compile(r'^[ \t]*Registrar WHOIS Server:[ \t]*(\S+)', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'^[ \t]*ReferralServer:[ \t]*(\S+)', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'^[ \t]*refer:[ \t]*(\S+)', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'^[ \t]*whois:[ \t]*(\S+)', re.IGNORECASE | re.MULTILINE),
+]
+
+_MAX_RESPONSE_BYTES = 1024 * 1024
+
+
+def _clean_server(value: str) -> Optional[str]:
+    """Strip URL schemes and ports from a referral (whois://host:43 -> host)"""
+    server = re.sub(r'^[a-z]+://', '', value.strip(), flags=re.IGNORECASE).split('/')[0]
+    server = server.rsplit(':', 1)[0] if server.count(':') == 1 else server
+    server = server.strip().lower().rstrip('.')
+    if not server or server.startswith('http') or '.' not in server:
+        return None
+    return server
+
+
+def find_referral(response: str) -> Optional[str]:
+    """
+    Find the server a WHOIS response refers to
+
+    :param response: Raw WHOIS response
+    :return: Referred server hostname, or None
+    """
+    for pattern in _REFERRAL_PATTERNS:
+        match = pattern.search(response)
+        if match:
+            server = _clean_server(match.group(1))
+            if server:
+                return server
+    return None
+
+
+class WhoisClient:
+    """
+    Asynchronous port-43 WHOIS client
+
+    Domain lookups go straight to the TLD's registry server (learned once
+    from IANA and cached on disk), then follow the registry's referral to the
+    registrar. Queries to the same server are spaced by a per-server rate
+    limit while different servers are queried in parallel.
+    """
+
+    # TLD -> registry server, shared by every client in the process
+    _tld_servers: Dict[str, str] = {}
+    _tld_cache_loaded = False
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_referrals: int = 2,
+        concurrency: int = 64,
+        server_rate: float = 5.0,
+        server_rates: Optional[Dict[str, float]] = None,
+        tld_servers: Optional[Dict[str, str]] = None,
+        tld_cache_path: Optional[str] = '~/.hackfusion/whois_servers.json',
+        tld_cache_ttl: float = 7 * 86400,
+        port: int = 43
+    ):
+        """
+        Initialize the client
+
+        :param timeout: Seconds allowed for each server exchange
+        :param max_referrals: Referrals followed after the registry answer
+        :param concurrency: Maximum lookups in flight
+        :param server_rate: Default queries per second for any one server
+        :param server_rates: Per-server queries per second overrides
+        :param tld_servers: TLD -> server overrides, skipping IANA
+        :param tld_cache_path: JSON file persisting the TLD -> server map
+        :param tld_cache_ttl: Seconds before the persisted map is refreshed
+        :param port: WHOIS port
+        """
+        self.timeout = timeout
+        self.max_referrals = max(0, max_referrals)
+        self.concurrency = max(1, concurrency)
+        self.server_rate = server_rate
+        self.server_rates = {k.lower(): float(v) for k, v in (server_rates or {}).items()}
+        self.tld_overrides = {k.lower().lstrip('.'): v for k, v in (tld_servers or {}).items()}
+        self.tld_cache_path = os.path.expanduser(tld_cache_path) if tld_cache_path else None
+        self.tld_cache_ttl = tld_cache_ttl
+        self.port = port
+
+        self._next_slot: Dict[str, float] = {}
+        self._slot_lock = threading.Lock()
+        # Semaphore and per-TLD locks for each event loop using this client
+        self._loop_state: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'WhoisClient':
+        """Build a client from information_gathering.whois"""
+        return cls(
+            timeout=float(config.get('timeout', 10)),
+            max_referrals=int(config.get('max_referrals', 2)),
+            concurrency=int(config.get('concurrency', 64)),
+            server_rate=float(config.get('server_rate', 5)),
+            server_rates=config.get('server_rates'),
+            tld_servers=config.get('tld_servers'),
+            tld_cache_path=config.get('tld_cache_path', '~/.hackfusion/whois_servers.json'),
+            tld_cache_ttl=float(config.get('tld_cache_ttl', 7 * 86400))
+        )
+
+    def _state(self):
+        """Loop-bound primitives for the running event loop"""
+        loop = asyncio.get_running_loop()
+        state = self._loop_state.get(loop)
+        if state is None:
+            state = self._loop_state[loop] = (asyncio.Semaphore(self.concurrency), {})
+        return state
+
+    def _load_tld_cache(self):
+        cls = type(self)
+        if cls._tld_cache_loaded or not self.tld_cache_path:
+            return
+        cls._tld_cache_loaded = True
+        try:
+            with open(self.tld_cache_path, 'r') as f:
+                cached = json.load(f)
+            if time.time() - cached.get('updated', 0) < self.tld_cache_ttl:
+                cls._tld_servers.update(cached.get('servers', {}))
+        except (OSError, ValueError):
+            pass
+
+    def _save_tld_cache(self):
+        if not self.tld_cache_path:
+            return
+        tmp_path = f"{self.tld_cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.tld_cache_path), exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump({'updated': time.time(), 'servers': type(self)._tld_servers}, f, indent=2)
+            os.replace(tmp_path, self.tld_cache_path)
+        except OSError as e:
+            logger.warning(f"Could not save WHOIS server cache: {e}")
+
+    async def _wait_for_server(self, server: str):
+        rate = self.server_rates.get(server, self.server_rate)
+        if not rate:
+            return
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # Slots are shared by every thread and loop using this client
+        with self._slot_lock:
+            slot = max(now, self._next_slot.get(server, 0.0))
+            self._next_slot[server] = slot + 1.0 / rate
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def query(self, server: str, query: str) -> str:
+        """
+        Send one query to a WHOIS server and read the full response
+
+        :param server: WHOIS server hostname
+        :param query: Query line (domain, IP, ...)
+        :return: Response text
+        """
+        await self._wait_for_server(server)
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(server, self.port), self.timeout)
+        try:
+            writer.write(f"{query}\r\n".encode('utf-8'))
+            await writer.drain()
+            chunks = []
+            received = 0
+            deadline = asyncio.get_running_loop().time() + self.timeout
+            while received < _MAX_RESPONSE_BYTES:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                chunk = await asyncio.wait_for(reader.read(65536), remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                received += len(chunk)
+        finally:
+            writer.close()
+        return b''.join(chunks).decode('utf-8', errors='replace')
+
+    async def server_for(self, domain: str) -> Optional[str]:
+        """
+        Find the registry WHOIS server for a domain's TLD
+
+        :param domain: Domain name
+        :return: Server hostname, or None if IANA does not know one
+        """
+        tld = domain.rstrip('.').rsplit('.', 1)[-1].lower()
+        if tld in self.tld_overrides:
+            return self.tld_overrides[tld]
+        self._load_tld_cache()
+        servers = type(self)._tld_servers
+        if tld in servers:
+            return servers[tld]
+
+        # One IANA query per TLD even when many lookups start at once
+        lock = self._state()[1].setdefault(tld, asyncio.Lock())
+        async with lock:
+            if tld not in servers:
+                response = await self.query(IANA_SERVER, tld)
+                server = find_referral(response)
+                if server is None:
+                    return None
+                servers[tld] = server
+                self._save_tld_cache()
+        return servers[tld]
+
+    async def lookup(self, target: str) -> Dict[str, Any]:
+        """
+        Look up a domain or IP address, following referrals
+
+        :param target: Normalized domain or IP address
+        :return: Dict with target, status, server chain, and raw response
+                 (most specific answer first)
+        """
+        async with self._state()[0]:
+            chain: List[str] = []
+            responses: List[str] = []
+            try:
+                try:
+                    ipaddress.ip_address(target)
+                    server = IANA_SERVER
+                except ValueError:
+                    server = await self.server_for(target)
+                if server is None:
+                    return {'target': target, 'status': 'error', 'error': f'No WHOIS server known for {target}', 'servers': chain}
+
+                for _ in range(self.max_referrals + 1):
+                    response = await self.query(server, target)
+                    chain.append(server)
+                    responses.append(response)
+                    referral = find_referral(response)
+                    if not referral or referral in chain:
+                        break
+                    server = referral
+            except (OSError, asyncio.TimeoutError) as e:
+                if not responses:
+                    return {
+                        'target': target,
+                        'status': 'error',
+                        'error': f"{type(e).__name__}: {e}" if str(e) else type(e).__name__,
+                        'servers': chain
+                    }
+                # A registrar that refuses us still leaves the registry answer
+                logger.warning(f"WHOIS referral for {target} failed: {e}")
+
+        useful = [response for response in responses if response.strip()]
+        return {
+            'target': target,
+            'status': 'success' if useful else 'not_found',
+            'servers': chain,
+            # Deepest (registrar) answer first so its fields take precedence
+            'raw': '\n'.join(reversed(useful))
+        }
+
+    async def lookup_many(
+        self,
+        targets: Iterable[str],
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Look up many targets concurrently
+
+        :param targets: Normalized domains or IP addresses
+        :param on_result: Callback invoked with each result as it completes
+        :return: Results in input order
+        """
+        async def one(target: str) -> Dict[str, Any]:
+            result = await self.lookup(target)
+            if on_result:
+                on_result(result)
+            return result
+        return list(await asyncio.gather(*(one(target) for target in dict.fromkeys(targets))))
+
+
+def whois_lookup(target: str, client: Optional[WhoisClient] = None) -> Dict[str, Any]:
+    """Blocking wrapper around WhoisClient.lookup (defaults to the shared client)"""
+    return run_async((client or get_whois_client()).lookup(target))
+
+
+def whois_lookup_many(
+    targets: Iterable[str],
+    client: Optional[WhoisClient] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> List[Dict[str, Any]]:
+    """Blocking wrapper around WhoisClient.lookup_many (defaults to the shared client)"""
+    return run_async((client or get_whois_client()).lookup_many(targets, on_result=on_result))
+
+
+_shared_client: Optional[WhoisClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_whois_client() -> WhoisClient:
+    """Get the process-wide WHOIS client, so per-server rate limits hold across callers"""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_lock:
+            if _shared_client is None:
+                from src.utils.config_loader import ConfigLoader
+                _shared_client = WhoisClient.from_config(
+                    ConfigLoader().get_tool_config('information_gathering', 'whois')
+                )
+    return _shared_client
@@ -0,0 +1,70 @@
+import asyncio
+import socket
+import struct
+
+from src.utils.async_dns import AsyncResolver, QTYPES, _read_name
+
+
+class StubDNSServer(asyncio.DatagramProtocol):
+    """Answers every A query with 192.0.2.1 and records the client sockets"""
+
+    def __init__(self):
+        self.transport = None
+        self.clients = set()
+        self.questions = []
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.clients.add(addr)
+        query_id, _flags, _qd, _an, _ns, _ar = struct.unpack('!HHHHHH', data[:12])
+        qname, offset = _read_name(data, 12)
+        qtype, _qclass = struct.unpack('!HH', data[offset:offset + 4])
+        self.questions.append(qname)
+        question = data[12:offset + 4]
+        answers = b''
+        count = 0
+        if qtype == QTYPES['A']:
+            answers = struct.pack('!HHHIH', 0xC00C, QTYPES['A'], 1, 60, 4) + socket.inet_aton('192.0.2.1')
+            count = 1
+        header = struct.pack('!HHHHHH', query_id, 0x8180, 1, count, 0, 0)
+        self.transport.sendto(header + question + answers, addr)
+
+
+async def start_server():
+    loop = asyncio.get_running_loop()
+    transport, server = await loop.create_datagram_endpoint(StubDNSServer, local_addr=('127.0.0.1', 0))
+    return transport, server, transport.get_extra_info('sockname')[1]
+
+
+def test_concurrent_queries_share_pooled_sockets():
+    async def run():
+        transport, server, port = await start_server()
+        try:
+            async with AsyncResolver(['127.0.0.1'], port=port, timeout=0.5, concurrency=500,
+                                     sockets_per_server=4) as resolver:
+                results = await asyncio.gather(*(resolver.query(f"host{i}.example.com") for i in range(500)))
+        finally:
+            transport.close()
+        return results, server
+
+    results, server = asyncio.run(run())
+    assert all(result['records'] == ['192.0.2.1'] for result in results)
+    assert len(server.clients) <= 4
+
+
+def test_idna_name_matches_encoded_question():
+    async def run():
+        transport, server, port = await start_server()
+        try:
+            async with AsyncResolver(['127.0.0.1'], port=port, timeout=2, retries=0) as resolver:
+                result = await resolver.query('Bücher.Example')
+        finally:
+            transport.close()
+        return result, server
+
+    result, server = asyncio.run(run())
+    assert [question.lower() for question in server.questions] == ['xn--bcher-kva.example']
+    assert result['status'] == 'NOERROR'
+    assert result['records'] == ['192.0.2.1']
@@ -0,0 +1,36 @@
+import threading
+from concurrent.futures import Future
+
+from src.utils.execution_engine import ExecutionEngine
+
+
+def test_submit_resolves_the_callers_future():
+    engine = ExecutionEngine(workers=2, queue_size=4)
+    future = Future()
+    assert engine.submit('whois', lambda value: value * 2, 21, future=future) is future
+    assert future.result(timeout=5) == 42
+    engine.shutdown()
+
+
+def test_cancel_releases_queue_space():
+    engine = ExecutionEngine(workers=1, queue_size=2, tool_limits={'nmap': 1})
+    started, release = threading.Event(), threading.Event()
+
+    def slow_scan():
+        started.set()
+        release.wait()
+
+    running = engine.submit('nmap', slow_scan)
+    assert started.wait(timeout=5)
+    queued = [engine.submit('nmap', lambda: 'scan', block=False) for _ in range(2)]
+
+    assert all(engine.cancel(future) for future in queued)
+    assert all(future.cancelled() for future in queued)
+    assert engine.stats()['queued'] == 0
+
+    # The freed slots are usable without waiting for a worker
+    replacement = engine.submit('nmap', lambda: 'scan', block=False)
+    assert engine.cancel(running) is False
+    release.set()
+    assert replacement.result(timeout=5) == 'scan'
+    engine.shutdown()
@@ -0,0 +1,85 @@
+import os
+import stat
+
+import pytest
+
+from src.utils.install_planner import ALREADY_INSTALLED, INSTALLED, NOT_FOUND, UNPACKING, InstallPlanner
+
+TOOLS = {
+    'nmap': {'package': 'nmap'},
+    'sqlmap': {'package': 'sqlmap'},
+    'whois': {'package': 'whois'},
+}
+
+# Logs its arguments; 'install' fails like apt when a package is unknown
+STUB_APT_GET = """#!/bin/sh
+echo "$*" >> "{log}"
+[ "$1" = update ] && exit 0
+shift 3
+missing=0
+for package in "$@"; do
+  case $package in {unknown}) echo "E: Unable to locate package $package" >&2; missing=1;; esac
+done
+[ $missing = 1 ] && exit 100
+for package in "$@"; do
+  case $package in
+    whois) echo "$package is already the newest version (5.5.17).";;
+    *) echo "Unpacking $package (1.0) ..."; echo "Setting up $package:amd64 (1.0) ...";;
+  esac
+done
+"""
+
+
+@pytest.fixture
+def stub_apt(tmp_path, monkeypatch):
+    log = tmp_path / 'calls.log'
+
+    def install(unknown='__none__'):
+        script = tmp_path / 'apt-get'
+        script.write_text(STUB_APT_GET.format(log=log, unknown=unknown))
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        monkeypatch.setenv('PATH', f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+        return log
+
+    return install
+
+
+def calls(log):
+    return log.read_text().splitlines()
+
+
+def test_one_update_and_one_install_transaction(stub_apt):
+    log = stub_apt()
+    planner = InstallPlanner(TOOLS, {'nmap': ['libpcap0.8']}, use_sudo=False)
+    report = planner.install(['nmap', 'sqlmap', 'whois', 'nosuch'])
+
+    assert calls(log) == ['update -q', 'install -y -q libpcap0.8 nmap sqlmap whois']
+    assert report['tools'] == {'nmap': True, 'sqlmap': True, 'whois': True}
+    assert report['unknown'] == ['nosuch']
+    assert report['status'] == 'partial'
+
+
+def test_unlocatable_packages_are_dropped_and_retried_once(stub_apt):
+    log = stub_apt(unknown='libssl1.1|sqlmap')
+    planner = InstallPlanner(TOOLS, {'nmap': ['libssl1.1']}, use_sudo=False)
+    report = planner.install(['nmap', 'sqlmap', 'whois'])
+
+    assert calls(log) == [
+        'update -q',
+        'install -y -q libssl1.1 nmap sqlmap whois',
+        'install -y -q nmap whois',
+    ]
+    assert report['packages']['libssl1.1']['status'] == NOT_FOUND
+    assert report['packages']['sqlmap']['status'] == NOT_FOUND
+    # A missing dependency does not fail a tool whose own package installed
+    assert report['tools'] == {'nmap': True, 'sqlmap': False, 'whois': True}
+
+
+def test_progress_is_reported_per_package(stub_apt):
+    stub_apt()
+    planner = InstallPlanner(TOOLS, use_sudo=False, update=False)
+    progress = []
+    report = planner.install(['nmap', 'whois'], on_progress=lambda package, state, _: progress.append((package, state)))
+
+    assert progress == [('nmap', UNPACKING), ('nmap', INSTALLED), ('whois', ALREADY_INSTALLED)]
+    assert report['status'] == 'success'
@@ -0,0 +1,32 @@
+import time
+
+from src.tools_integration import information_gathering
+from src.tools_integration.information_gathering import InformationGathering
+from src.utils.network_monitor import NetworkMonitor
+
+
+class CountingMonitor(NetworkMonitor):
+    def __init__(self):
+        super().__init__(ttl=300)
+        self.collections = 0
+
+    def collect(self):
+        self.collections += 1
+        return {'collected_at': time.time()}
+
+
+def test_construction_reuses_a_fresh_snapshot(monkeypatch):
+    monitor = CountingMonitor()
+    monkeypatch.setattr(information_gathering, 'get_network_monitor', lambda: monitor)
+
+    InformationGathering()
+    deadline = time.monotonic() + 2
+    while monitor.age() is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    InformationGathering()
+    time.sleep(0.1)
+    assert monitor.collections == 1
+
+    monitor.refresh_in_background()
+    time.sleep(0.1)
+    assert monitor.collections == 2
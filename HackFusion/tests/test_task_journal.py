@@ -0,0 +1,51 @@
+import os
+import time
+
+from src.utils.task_journal import TaskJournal
+
+
+def test_compact_keeps_unfinished_tasks_and_their_plan_steps(tmp_path):
+    journal = TaskJournal(str(tmp_path / 'tasks.jsonl'), compact_bytes=0)
+    journal.record_submitted('done', 'nmap', {})
+    done_result = journal.record_completed('done', {'hosts': 1})
+    journal.record_submitted('plan', 'ai_plan', {'plan': {}})
+    journal.record_submitted('plan_step_0', 'nmap', {'plan_id': 'plan', 'step': 0})
+    step_result = journal.record_completed('plan_step_0', {'hosts': 2})
+    journal.record_submitted('running', 'whois', {})
+
+    assert journal.compact() == 2
+    states = journal.replay()
+    assert list(states) == ['plan', 'plan_step_0', 'running']
+    assert journal.load_result(states['plan_step_0']) == {'hosts': 2}
+    assert os.path.exists(step_result)
+    assert not os.path.exists(done_result)
+
+    # Appends after the rewrite land in the compacted file
+    journal.record_failed('running', 'boom')
+    assert journal.replay()['running']['status'] == 'failed'
+    journal.close()
+
+
+def test_journal_compacts_past_threshold(tmp_path):
+    path = tmp_path / 'tasks.jsonl'
+    journal = TaskJournal(str(path), compact_bytes=4096)
+    journal.record_submitted('pending', 'nmap', {})
+    for i in range(200):
+        journal.record_submitted(f"task_{i}", 'whois', {'target': 'x' * 50})
+        journal.record_failed(f"task_{i}", 'timeout')
+
+    assert os.path.getsize(path) < 4096
+    assert [state['task_id'] for state in journal.unfinished()] == ['pending']
+    journal.close()
+
+
+def test_unsynced_records_are_synced_on_timer(tmp_path):
+    journal = TaskJournal(str(tmp_path / 'tasks.jsonl'), fsync_batch=100, fsync_interval=0.05)
+    journal.record_submitted('task', 'nmap', {})
+    assert journal._unsynced == 1
+
+    deadline = time.monotonic() + 2
+    while journal._unsynced and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert journal._unsynced == 0
+    journal.close()
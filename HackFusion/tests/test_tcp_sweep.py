@@ -0,0 +1,40 @@
+import asyncio
+
+from src.utils.tcp_sweep import TcpSweeper
+
+
+class RecordingSweeper(TcpSweeper):
+    """Answers on ports 22 and 443 only, recording every probe instead of connecting"""
+
+    def __init__(self, **kwargs):
+        super().__init__(ports=[22, 80, 443, 8080], liveness_ports=[22, 80], rate=None, **kwargs)
+        self.probed = []
+
+    async def probe(self, host, port):
+        self.probed.append((host, port))
+        await asyncio.sleep(0)
+        return 'open' if port in (22, 443) and host != 'dead' else None
+
+
+def test_liveness_sweep_probes_dead_hosts_on_liveness_ports_only():
+    sweeper = RecordingSweeper(concurrency=1)
+    results = sweeper.sweep_hosts(['a', 'b', 'dead'], until_alive=True, hints=False)['hosts']
+
+    assert results['a'] == {'alive': True, 'open_ports': [22]}
+    assert results['dead'] == {'alive': False, 'open_ports': []}
+    assert sorted(sweeper.probed) == [('a', 22), ('b', 22), ('dead', 22), ('dead', 80)]
+
+
+def test_hint_pass_probes_remaining_ports_on_live_hosts():
+    sweeper = RecordingSweeper(concurrency=4)
+    results = sweeper.sweep_hosts(['a', 'dead'], until_alive=True)['hosts']
+
+    assert results['a'] == {'alive': True, 'open_ports': [22, 443]}
+    assert sorted(port for host, port in sweeper.probed if host == 'a') == [22, 80, 443, 8080]
+    assert sorted(port for host, port in sweeper.probed if host == 'dead') == [22, 80]
+
+
+def test_full_sweep_probes_every_port():
+    sweeper = RecordingSweeper(concurrency=4)
+    sweeper.sweep_hosts(['a', 'b'])
+    assert len(sweeper.probed) == 8
@@ -0,0 +1,79 @@
+from src.utils.timeout_policy import TimeoutPolicy
+from src.utils.tool_telemetry import TelemetryStore
+
+
+def make_policy(tmp_path, **tools):
+    telemetry = TelemetryStore(path=str(tmp_path / 'executions.jsonl'))
+    return telemetry, TimeoutPolicy(telemetry=telemetry, default=300, floor=10, ceiling=3600,
+                                    min_samples=5, cache_ttl=0, tools=tools)
+
+
+def test_fast_failures_do_not_shrink_the_deadline(tmp_path):
+    telemetry, policy = make_policy(tmp_path)
+    for _ in range(5):
+        telemetry.record('nikto', 0.4, exit_code=1, args='-h <target>')
+    assert policy.explain('nikto', '-h <target>')['source'] == 'default'
+    assert policy.timeout_for('nikto', '-h <target>') == 300
+
+    for _ in range(5):
+        telemetry.record('nikto', 20.0, exit_code=0, args='-h <target>')
+    assert policy.explain('nikto', '-h <target>') == {
+        'timeout': 60.0, 'source': 'args', 'samples': 5, 'observed': 20.0, 'timeout_rate': 0.0
+    }
+
+
+def test_repeated_hangs_do_not_compound_the_deadline(tmp_path):
+    telemetry, policy = make_policy(tmp_path)
+    for _ in range(50):
+        telemetry.record('nikto', 1.0, exit_code=0, args='-h <target>')
+    assert policy.timeout_for('nikto', '-h <target>') == 10
+
+    # Every hang is killed at the current deadline and recorded with it
+    deadlines = []
+    for _ in range(20):
+        deadline = policy.timeout_for('nikto', '-h <target>')
+        deadlines.append(deadline)
+        telemetry.record('nikto', deadline, args='-h <target>', status='timeout')
+    # Raised once more than 2 of the last 20 runs timed out, then held
+    assert deadlines[:3] == [10, 10, 10]
+    assert set(deadlines[3:]) == {20}
+    assert policy.explain('nikto', '-h <target>')['timeout_rate'] == 1.0
+
+
+def test_deadline_grows_only_past_the_timeout_rate(tmp_path):
+    telemetry, policy = make_policy(tmp_path)
+    for _ in range(19):
+        telemetry.record('sqlmap', 10.0, exit_code=0, args='--batch')
+    telemetry.record('sqlmap', 30.0, args='--batch', status='timeout')
+    # 1 of 20 recent runs timed out: below the 10% threshold
+    assert policy.timeout_for('sqlmap', '--batch') == 30
+
+    telemetry.record('sqlmap', 30.0, args='--batch', status='timeout')
+    telemetry.record('sqlmap', 30.0, args='--batch', status='timeout')
+    assert policy.timeout_for('sqlmap', '--batch') == 60
+
+
+def test_open_ended_tool_keeps_default_as_lower_bound(tmp_path):
+    telemetry, policy = make_policy(
+        tmp_path, hashcat={'default': 86400, 'floor': 600, 'ceiling': 604800, 'open_ended': True}
+    )
+    for _ in range(5):
+        telemetry.record('hashcat', 8.0, exit_code=0, args='-m 0 <target>')
+    assert policy.timeout_for('hashcat', '-m 0 <target>') == 86400
+
+    # Runs longer than the default still raise the deadline
+    for _ in range(5):
+        telemetry.record('hashcat', 40000.0, exit_code=0, args='-m 0 <target>')
+    assert policy.timeout_for('hashcat', '-m 0 <target>') == 120000
+
+
+def test_run_tool_process_keeps_binary_output_and_records_it(tmp_path):
+    from src.utils.timeout_policy import run_tool_process
+
+    telemetry, policy = make_policy(tmp_path)
+    result = run_tool_process(['printf', '\\000\\377payload'], policy=policy, text=False)
+
+    assert result.stdout == b'\x00\xffpayload'
+    [record] = telemetry.samples('printf')
+    assert record['status'] == 'success'
+    assert record['output_bytes'] == 9
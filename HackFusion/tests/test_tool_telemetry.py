@@ -0,0 +1,15 @@
+from src.utils.tool_telemetry import TelemetryStore
+
+
+def test_compaction_waits_for_growth_when_everything_is_kept(tmp_path, monkeypatch):
+    store = TelemetryStore(path=str(tmp_path / 'executions.jsonl'), flush_batch=1, compact_bytes=2048)
+    compactions = []
+    compact = store.compact
+    monkeypatch.setattr(store, 'compact', lambda: compactions.append(1) or compact())
+
+    # Every argument set is distinct, so compaction cannot drop anything
+    for i in range(200):
+        store.record('nmap', 1.0, exit_code=0, args=f"-p {i}")
+
+    assert 1 <= len(compactions) <= 4
+    assert len(store.samples('nmap')) == 200
@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+from src.tools_integration import information_gathering
+from src.tools_integration.information_gathering import InformationGathering
+from src.utils.async_runner import run_async
+
+
+class StubKaliTools:
+    def check_tool(self, tool):
+        return False
+
+
+def make_gatherer(monkeypatch, looked_up):
+    def whois_lookup_many(targets, on_result=None):
+        async def lookup_all():
+            for target in targets:
+                await asyncio.sleep(0.02)
+                looked_up.append(target)
+                on_result({'target': target, 'raw': 'Domain Name: x', 'parsed': {}})
+        return run_async(lookup_all())
+
+    monkeypatch.setattr(information_gathering, 'whois_lookup_many', whois_lookup_many)
+    gatherer = InformationGathering.__new__(InformationGathering)
+    gatherer.config = {'whois': {'native': True, 'cache': {'enabled': False}}}
+    gatherer.kali_tools = StubKaliTools()
+    gatherer.validate_targets = lambda targets: {target: True for target in targets}
+    gatherer._whois_native_result = lambda domain, native, cache: {'status': 'success'}
+    return gatherer
+
+
+def test_closing_whois_batch_stops_native_lookups(monkeypatch):
+    looked_up = []
+    gatherer = make_gatherer(monkeypatch, looked_up)
+    domains = [f"host{i}.example.com" for i in range(200)]
+
+    results = gatherer.run_whois_batch(domains, use_cache=False)
+    assert next(results)['target'] == 'host0.example.com'
+    results.close()
+
+    time.sleep(0.5)
+    stopped_at = len(looked_up)
+    time.sleep(0.3)
+    assert len(looked_up) == stopped_at < len(domains)
+
+
+def test_whois_batch_yields_every_domain(monkeypatch):
+    looked_up = []
+    gatherer = make_gatherer(monkeypatch, looked_up)
+    domains = [f"host{i}.example.com" for i in range(5)]
+
+    results = list(gatherer.run_whois_batch(domains, use_cache=False))
+    assert [result['target'] for result in results] == domains
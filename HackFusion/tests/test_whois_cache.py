@@ -0,0 +1,35 @@
+import sqlite3
+import time
+
+from src.utils.whois_cache import WhoisCache
+
+
+def age_entry(path, domain, seconds):
+    conn = sqlite3.connect(path)
+    conn.execute('UPDATE whois SET fetched_at = ? WHERE domain = ?', (time.time() - seconds, domain))
+    conn.commit()
+    conn.close()
+
+
+def test_unservable_entries_are_purged_on_open(tmp_path):
+    path = str(tmp_path / 'whois.db')
+    cache = WhoisCache(path, default_ttl=100, max_stale=100)
+    cache.put('old.com', 'raw', {})
+    cache.put('new.com', 'raw', {})
+    cache.close()
+    age_entry(path, 'old.com', 1000)
+
+    reopened = WhoisCache(path, default_ttl=100, max_stale=100)
+    assert reopened.stats()['entries'] == 1
+    assert reopened.get('new.com') is not None
+
+
+def test_unservable_entries_are_purged_every_n_writes(tmp_path):
+    path = str(tmp_path / 'whois.db')
+    cache = WhoisCache(path, default_ttl=100, max_stale=100, purge_every=3)
+    cache.put('old.com', 'raw', {})
+    age_entry(path, 'old.com', 1000)
+    cache.put('a.com', 'raw', {})
+    assert cache.stats()['entries'] == 2
+    cache.put('b.com', 'raw', {})
+    assert cache.stats()['entries'] == 2
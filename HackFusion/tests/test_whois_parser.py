@@ -0,0 +1,28 @@
+from src.tools_integration.information_gathering import WHOIS_PARSER
+
+REGISTRAR_ANSWER = """Domain Name: MARKMONITOR.COM
+Registrar WHOIS Server: whois.markmonitor.com
+Creation Date: 1999-03-18T00:00:00-0800
+Registrar Registration Expiration Date: 2026-03-18T00:00:00-0700
+Sponsoring Registrar: MarkMonitor, Inc.
+Name Server: ns1.markmonitor.com
+Name Server: ns2.markmonitor.com
+"""
+
+
+def test_registrar_format_labels_are_parsed():
+    parsed = WHOIS_PARSER.parse(REGISTRAR_ANSWER)
+    assert parsed['expiration_date'] == '2026-03-18T00:00:00-0700'
+    assert parsed['registrar'] == 'MarkMonitor, Inc.'
+    assert parsed['name_servers'] == ['ns1.markmonitor.com', 'ns2.markmonitor.com']
+
+
+def test_registry_format_is_unchanged():
+    parsed = WHOIS_PARSER.parse(
+        "   Domain Name: EXAMPLE.COM\n"
+        "   Registrar WHOIS Server: whois.iana.org\n"
+        "   Registrar: RESERVED-Internet Assigned Numbers Authority\n"
+        "NOTICE: The expiration date displayed in this record is the date the\n"
+    )
+    assert parsed['registrar'] == 'RESERVED-Internet Assigned Numbers Authority'
+    assert parsed['expiration_date'] is None